@@ -8,10 +8,70 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite:///./app.db"
+    ASYNC_DATABASE_URL: Optional[str] = None  # None: DATABASE_URL'den türetilir
+    DB_POOL_SIZE: int = 5  # worker başına kalıcı bağlantı
+    DB_MAX_OVERFLOW: int = 5  # yoğunlukta açılabilecek ek bağlantı
+    DB_POOL_TIMEOUT: int = 30  # saniye, havuz doluyken bekleme
+    DB_POOL_RECYCLE: int = 1800  # saniye, uzun ömürlü bağlantıları yenile
+    DB_POOL_PRE_PING: bool = True
     
+    # Redis
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    CACHE_TTL_SECONDS: int = 300  # yazma yolu silse de kaçak kayıtlar için üst sınır
+    CACHE_LOCK_TTL_MS: int = 2000  # stampede kilidi, yükleme bu süreyi aşarsa kilit düşer
+    CACHE_LOCK_WAIT_MS: int = 200  # kilidi alamayan istek değerin yazılmasını bu kadar bekler
+    REPORT_CACHE_TTL_SECONDS: int = 3600  # LLM raporları pahalı, aynı girdi için daha uzun tutulur
+    REPORT_SECTION_TIMEOUT_SECONDS: float = 10.0  # aşan bölüm fallback değeriyle rapora girer
+    REPORT_SECTION_CACHE_TTL_SECONDS: float = 600.0  # girdi değişmese de bölüm en geç bu sürede yeniden hesaplanır
+    REPORT_SECTION_CACHE_MAX_ENTRIES: int = 2048
+
+    # Arka plan işleri (Redis kuyruğu)
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RESULT_TTL_SECONDS: int = 24 * 60 * 60
+    JOB_LEASE_SECONDS: int = 60  # worker bu süre içinde lease'i yenilemezse iş başka worker'a geçer
+    JOB_RETRY_BACKOFF_SECONDS: int = 5  # her denemede iki katına çıkar
+    JOB_POLL_INTERVAL_SECONDS: float = 0.5
+    JOB_WORKER_CONCURRENCY: int = 2
+
+    # Dashboard snapshot'ları (ön hesaplama)
+    DASHBOARD_REFRESH_INTERVAL_SECONDS: float = 15 * 60
+    DASHBOARD_EVENT_DEBOUNCE_SECONDS: float = 10.0  # değişiklik olaylarından sonra bu kadar sessizlik beklenir
+    DASHBOARD_SCHEDULER_CONCURRENCY: int = 2
+    DASHBOARD_SNAPSHOT_TTL_SECONDS: int = 7 * 24 * 60 * 60  # yenilenmeyen (silinmiş) projelerin snapshot'ı düşer
+
+    # Grafikler
+    CHART_MAX_POINTS: int = 1000  # zaman serisi grafiği başına varsayılan nokta bütçesi
+    CHART_WEBGL_THRESHOLD: int = 1000  # bu kadar noktadan fazlası scattergl ile çizilir
+
+    # Arrow / Parquet export
+    EXPORT_BATCH_ROWS: int = 10_000  # batch başına satır; akış belleği bununla sınırlı kalır
+
+    # Story point tahmin modeli (arka planda eğitilir, diskten yüklenir)
+    STORY_POINT_MODEL_PATH: str = "var/story_point_model.joblib"
+    STORY_POINT_MIN_TRAINING_SAMPLES: int = 20  # bundan az tamamlanmış story ile model eğitilmez
+    STORY_POINT_REFIT_MIN_SAMPLES: int = 50  # son eğitimden beri bu kadar örnek değişince yeniden eğitilir
+    STORY_POINT_REFIT_CHECK_EVERY: int = 10  # bu kadar DONE olayında bir yeniden eğitim ihtiyacına bakılır
+    STORY_POINT_MAX_TRAINING_SAMPLES: int = 20_000  # eğitimde kullanılan en yeni tamamlanmış story sayısı
+
+    # OpenAI
+    OPENAI_API_KEY: Optional[str] = None
+
     # Security
     SECRET_KEY: str = "your-secret-key-here"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+
+    # Inference runtime (worker başına torch thread ayarları)
+    WEB_CONCURRENCY: int = 1  # host başına uvicorn worker sayısı
+    TORCH_INTRA_OP_THREADS: Optional[int] = None  # None: cpu_count / (worker * pool)
+    TORCH_INTER_OP_THREADS: int = 1
+    INFERENCE_POOL_WORKERS: int = 1
+    INFERENCE_MAX_BATCH_SIZE: int = 16
+    INFERENCE_BATCH_WAIT_MS: float = 5.0
+
+    # Story DONE olaylarından sonra sprint yeniden analizi
+    REANALYSIS_DEBOUNCE_SECONDS: float = 30.0  # son olaydan sonra bu kadar sessizlik beklenir
+    REANALYSIS_MAX_DELAY_SECONDS: float = 300.0  # ilk olaydan en geç bu kadar sonra çalışır
     
     class Config:
         case_sensitive = True
@@ -0,0 +1,49 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+
+_current_context: ContextVar[Optional["AnalysisContext"]] = ContextVar("analysis_context", default=None)
+
+class AnalysisContext:
+    """
+    Tek bir istek / rapor üretimi boyunca pahalı çağrıların (sprint, story listesi,
+    AI analizi) sonuçlarını saklar. Aynı anahtar için eşzamanlı çağrılar tek çalıştırmada birleşir.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, asyncio.Future] = {}
+
+    async def memoize(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        future = self._results.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._results[key] = future
+            # Hatalar saklanmaz, sonraki çağrı tekrar dener
+            future.add_done_callback(lambda f: self._forget_failed(key, f))
+        return await asyncio.shield(future)
+
+    def _forget_failed(self, key: Hashable, future: asyncio.Future):
+        if (future.cancelled() or future.exception() is not None) and self._results.get(key) is future:
+            del self._results[key]
+
+@asynccontextmanager
+async def analysis_scope() -> AsyncIterator[AnalysisContext]:
+    """Açık bir kapsam varsa onu kullanır, yoksa yenisini açar (iç içe use case çağrıları aynı kapsamı paylaşır)."""
+    context = _current_context.get()
+    if context is not None:
+        yield context
+        return
+    context = AnalysisContext()
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
+
+async def memoized(key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Aktif kapsam içinde sonucu saklar; kapsam dışında doğrudan çalıştırır."""
+    context = _current_context.get()
+    if context is None:
+        return await factory()
+    return await context.memoize(key, factory)
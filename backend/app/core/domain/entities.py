@@ -3,18 +3,19 @@ from typing import List, Optional
 from pydantic import BaseModel
 
 class UserStory(BaseModel):
-    id: int
+    id: Optional[int] = None
     title: str
     description: str
     acceptance_criteria: List[str]
     priority: str
     story_points: int
     status: str
+    sprint_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
 
 class Sprint(BaseModel):
-    id: int
+    id: Optional[int] = None
     name: str
     start_date: datetime
     end_date: datetime
@@ -25,7 +26,7 @@ class Sprint(BaseModel):
     updated_at: datetime
 
 class ProductBacklog(BaseModel):
-    id: int
+    id: Optional[int] = None
     title: str
     description: str
     priority: str
@@ -36,7 +37,7 @@ class ProductBacklog(BaseModel):
     updated_at: datetime
 
 class Stakeholder(BaseModel):
-    id: int
+    id: Optional[int] = None
     name: str
     role: str
     email: str
@@ -44,7 +45,7 @@ class Stakeholder(BaseModel):
     updated_at: datetime
 
 class Feedback(BaseModel):
-    id: int
+    id: Optional[int] = None
     stakeholder_id: int
     content: str
     type: str
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime
 from .entities import UserStory, Sprint, ProductBacklog, Stakeholder, Feedback
 
@@ -12,6 +12,18 @@ class UserStoryRepository(ABC):
     async def get_by_id(self, story_id: int) -> Optional[UserStory]:
         pass
 
+    @abstractmethod
+    async def get_many(self, story_ids: Sequence[int]) -> List[Optional[UserStory]]:
+        pass
+
+    @abstractmethod
+    async def get_by_sprint(self, sprint_id: int) -> List[UserStory]:
+        pass
+
+    @abstractmethod
+    async def get_by_status(self, status: str) -> List[UserStory]:
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[UserStory]:
         pass
@@ -33,6 +45,19 @@ class SprintRepository(ABC):
     async def get_by_id(self, sprint_id: int) -> Optional[Sprint]:
         pass
 
+    @abstractmethod
+    async def get_many(self, sprint_ids: Sequence[int]) -> List[Optional[Sprint]]:
+        pass
+
+    @abstractmethod
+    async def get_by_status(self, status: str) -> List[Sprint]:
+        pass
+
+    @abstractmethod
+    async def get_recent(self, limit: int, before: Optional[datetime] = None) -> List[Sprint]:
+        """start_date'e göre en yeni sprint'ler (en yenisi önce)."""
+        pass
+
     @abstractmethod
     async def get_active(self) -> Optional[Sprint]:
         pass
@@ -58,6 +83,18 @@ class ProductBacklogRepository(ABC):
     async def get_by_id(self, backlog_id: int) -> Optional[ProductBacklog]:
         pass
 
+    @abstractmethod
+    async def get_many(self, backlog_ids: Sequence[int]) -> List[Optional[ProductBacklog]]:
+        pass
+
+    @abstractmethod
+    async def get_by_sprint(self, sprint_id: int) -> List[ProductBacklog]:
+        pass
+
+    @abstractmethod
+    async def get_by_status(self, status: str) -> List[ProductBacklog]:
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[ProductBacklog]:
         pass
@@ -79,6 +116,10 @@ class StakeholderRepository(ABC):
     async def get_by_id(self, stakeholder_id: int) -> Optional[Stakeholder]:
         pass
 
+    @abstractmethod
+    async def get_many(self, stakeholder_ids: Sequence[int]) -> List[Optional[Stakeholder]]:
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Stakeholder]:
         pass
@@ -100,10 +141,18 @@ class FeedbackRepository(ABC):
     async def get_by_id(self, feedback_id: int) -> Optional[Feedback]:
         pass
 
+    @abstractmethod
+    async def get_many(self, feedback_ids: Sequence[int]) -> List[Optional[Feedback]]:
+        pass
+
     @abstractmethod
     async def get_by_stakeholder(self, stakeholder_id: int) -> List[Feedback]:
         pass
 
+    @abstractmethod
+    async def get_by_status(self, status: str) -> List[Feedback]:
+        pass
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[Feedback]:
         pass
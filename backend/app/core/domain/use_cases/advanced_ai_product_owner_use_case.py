@@ -1,5 +1,7 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+import asyncio
+from app.core.domain.analysis_context import analysis_scope, memoized
 from app.core.domain.entities import UserStory, Sprint, ProductBacklog, Stakeholder, Feedback
 from app.core.domain.repositories import (
     UserStoryRepository,
@@ -9,6 +11,12 @@ from app.core.domain.repositories import (
     FeedbackRepository
 )
 from app.core.services.advanced_ai_service import AdvancedAIProductOwner
+from app.core.services.reanalysis_queue import SprintReanalysisQueue, get_reanalysis_queue, session_scoped_analyzer
+
+# Tahminde kullanılan geçmiş sprint sayısı
+HISTORY_SPRINT_WINDOW = 6
+# Tamamlanma tahminine katılan en fazla backlog öğesi
+FORECAST_BACKLOG_LIMIT = 1000
 
 class AdvancedAIProductOwnerUseCase:
     """Gelişmiş AI Product Owner use case implementation"""
@@ -19,13 +27,16 @@ class AdvancedAIProductOwnerUseCase:
         sprint_repo: SprintRepository,
         backlog_repo: ProductBacklogRepository,
         stakeholder_repo: StakeholderRepository,
-        feedback_repo: FeedbackRepository
+        feedback_repo: FeedbackRepository,
+        reanalysis_queue: Optional[SprintReanalysisQueue] = None
     ):
         self.user_story_repo = user_story_repo
         self.sprint_repo = sprint_repo
         self.backlog_repo = backlog_repo
         self.stakeholder_repo = stakeholder_repo
         self.feedback_repo = feedback_repo
+        # DONE sonrası yeniden analiz istekten sonra kendi session'ıyla çalışır (session_scoped_analyzer)
+        self.reanalysis_queue = reanalysis_queue or get_reanalysis_queue()
         self.ai_agent = AdvancedAIProductOwner()
 
     async def create_and_analyze_user_story(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -34,6 +45,9 @@ class AdvancedAIProductOwnerUseCase:
         analysis = await self.ai_agent.analyze_user_story(
             story=story_data["description"],
             context={
+                "title": story_data["title"],
+                "priority": story_data.get("priority"),
+                "acceptance_criteria": story_data.get("acceptance_criteria"),
                 "project_context": story_data.get("project_context"),
                 "team_capacity": story_data.get("team_capacity"),
                 "technical_constraints": story_data.get("technical_constraints"),
@@ -68,9 +82,14 @@ class AdvancedAIProductOwnerUseCase:
     async def prioritize_and_plan_sprint(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
         """Sprint planlaması yapar ve backlog'u gelişmiş önceliklendirme ile değerlendirir."""
         # Backlog önceliklendirme
-        backlog_items = await self.backlog_repo.get_all()
+        backlog_items = [item.dict() for item in await self.backlog_repo.get_all()]
+        # Puanı girilmemiş öğeler tek model çağrısıyla tahmin edilir
+        unestimated = [item for item in backlog_items if not item.get("story_points")]
+        for item, points in zip(unestimated, self.ai_agent.estimate_story_points(unestimated)):
+            item["story_points"] = points
+            item["story_points_estimated"] = True
         prioritization = await self.ai_agent.prioritize_backlog(
-            items=[item.dict() for item in backlog_items],
+            items=backlog_items,
             context={
                 "team_capacity": sprint_data.get("team_capacity"),
                 "sprint_goals": sprint_data.get("goals"),
@@ -104,27 +123,45 @@ class AdvancedAIProductOwnerUseCase:
 
     async def analyze_sprint_performance(self, sprint_id: int) -> Dict[str, Any]:
         """Sprint performansını gelişmiş analiz teknikleri ile değerlendirir."""
+        async with analysis_scope():
+            return await memoized(
+                (type(self).__name__, "sprint_performance", sprint_id),
+                lambda: self._analyze_sprint_performance(sprint_id)
+            )
+
+    async def _analyze_sprint_performance(self, sprint_id: int) -> Dict[str, Any]:
         # Sprint verilerini alma
-        sprint = await self.sprint_repo.get_by_id(sprint_id)
+        sprint = await self._get_sprint(sprint_id)
         if not sprint:
             raise ValueError("Sprint not found")
 
         # Sprint performans analizi
         performance = await self.ai_agent.analyze_sprint_performance({
             "sprint": sprint.dict(),
-            "stories": [story.dict() for story in await self.user_story_repo.get_all()],
+            "stories": [story.dict() for story in await self._get_sprint_stories(sprint_id)],
             "velocity": sprint.velocity,
             "team_metrics": sprint.team_metrics if hasattr(sprint, "team_metrics") else {},
             "quality_metrics": sprint.quality_metrics if hasattr(sprint, "quality_metrics") else {}
         })
 
-        # Gelecek performans tahmini
+        # Gelecek performans tahmini: yalnızca son sprint'ler ve onların story'leri
+        recent_sprints = await memoized(
+            ("recent_sprints", HISTORY_SPRINT_WINDOW),
+            lambda: self.sprint_repo.get_recent(HISTORY_SPRINT_WINDOW)
+        )
+        recent_stories = await asyncio.gather(
+            *[self._get_sprint_stories(s.id) for s in recent_sprints]
+        )
+        # Tamamlanma tahmini sprint'lerde kalan işe ek olarak açık backlog'u da kapsar
+        backlog_items = await memoized(
+            ("backlog", FORECAST_BACKLOG_LIMIT),
+            lambda: self.backlog_repo.get_all(limit=FORECAST_BACKLOG_LIMIT)
+        )
         future_performance = await self.ai_agent.predict_future_performance({
-            "historical_data": {
-                "sprints": [s.dict() for s in await self.sprint_repo.get_all()],
-                "stories": [s.dict() for s in await self.user_story_repo.get_all()],
-                "team_metrics": performance["team_performance"]["metrics"]
-            }
+            "sprints": [s.dict() for s in recent_sprints],
+            "stories": [story.dict() for stories in recent_stories for story in stories],
+            "backlog": [item.dict() for item in backlog_items],
+            "team_metrics": performance["team_performance"]["metrics"]
         })
 
         return {
@@ -134,8 +171,12 @@ class AdvancedAIProductOwnerUseCase:
 
     async def generate_comprehensive_report(self, sprint_id: int) -> Dict[str, Any]:
         """Kapsamlı sprint raporu oluşturur."""
+        async with analysis_scope():
+            return await self._generate_comprehensive_report(sprint_id)
+
+    async def _generate_comprehensive_report(self, sprint_id: int) -> Dict[str, Any]:
         # Sprint verilerini alma
-        sprint = await self.sprint_repo.get_by_id(sprint_id)
+        sprint = await self._get_sprint(sprint_id)
         if not sprint:
             raise ValueError("Sprint not found")
 
@@ -157,6 +198,12 @@ class AdvancedAIProductOwnerUseCase:
             "future_outlook": performance["future_predictions"]
         }
 
+    async def _get_sprint(self, sprint_id: int) -> Optional[Sprint]:
+        return await memoized(("sprint", sprint_id), lambda: self.sprint_repo.get_by_id(sprint_id))
+
+    async def _get_sprint_stories(self, sprint_id: int) -> List[UserStory]:
+        return await memoized(("sprint_stories", sprint_id), lambda: self.user_story_repo.get_by_sprint(sprint_id))
+
     async def update_story_status(self, story_id: int, new_status: str) -> UserStory:
         """User story durumunu günceller ve ilgili analizleri yapar."""
         # Story'yi alma
@@ -171,10 +218,14 @@ class AdvancedAIProductOwnerUseCase:
         # Veritabanını güncelleme
         updated_story = await self.user_story_repo.update(story)
 
-        # Eğer story tamamlandıysa, sprint analizini güncelle
-        if new_status == "DONE":
-            sprint = await self.sprint_repo.get_by_id(story.sprint_id)
-            if sprint:
-                await self.analyze_sprint_performance(sprint.id)
+        # Eğer story tamamlandıysa, sprint analizi arka planda (debounce ile) güncellenir
+        if new_status == "DONE" and story.sprint_id is not None:
+            self.reanalysis_queue.schedule(
+                story.sprint_id, session_scoped_analyzer(self), namespace=type(self).__name__
+            )
+
+        return updated_story
 
-        return updated_story 
\ No newline at end of file
+    def get_latest_sprint_analysis(self, sprint_id: int) -> Optional[Dict[str, Any]]:
+        """Arka planda tamamlanmış en son sprint analizini döner."""
+        return self.reanalysis_queue.get_latest(sprint_id, namespace=type(self).__name__) 
\ No newline at end of file
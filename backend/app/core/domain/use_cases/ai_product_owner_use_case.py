@@ -1,5 +1,6 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from app.core.domain.analysis_context import analysis_scope, memoized
 from app.core.domain.entities import UserStory, Sprint, ProductBacklog, Stakeholder, Feedback
 from app.core.domain.repositories import (
     UserStoryRepository,
@@ -9,6 +10,7 @@ from app.core.domain.repositories import (
     FeedbackRepository
 )
 from app.core.services.ai_service import AIProductOwnerAgent
+from app.core.services.reanalysis_queue import SprintReanalysisQueue, get_reanalysis_queue, session_scoped_analyzer
 
 class AIProductOwnerUseCase:
     """AI Product Owner use case implementation"""
@@ -19,13 +21,16 @@ class AIProductOwnerUseCase:
         sprint_repo: SprintRepository,
         backlog_repo: ProductBacklogRepository,
         stakeholder_repo: StakeholderRepository,
-        feedback_repo: FeedbackRepository
+        feedback_repo: FeedbackRepository,
+        reanalysis_queue: Optional[SprintReanalysisQueue] = None
     ):
         self.user_story_repo = user_story_repo
         self.sprint_repo = sprint_repo
         self.backlog_repo = backlog_repo
         self.stakeholder_repo = stakeholder_repo
         self.feedback_repo = feedback_repo
+        # DONE sonrası yeniden analiz istekten sonra kendi session'ıyla çalışır (session_scoped_analyzer)
+        self.reanalysis_queue = reanalysis_queue or get_reanalysis_queue()
         self.ai_agent = AIProductOwnerAgent()
 
     async def create_and_analyze_user_story(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -95,15 +100,22 @@ class AIProductOwnerUseCase:
 
     async def analyze_sprint_performance(self, sprint_id: int) -> Dict[str, Any]:
         """Sprint performansını analiz eder."""
+        async with analysis_scope():
+            return await memoized(
+                (type(self).__name__, "sprint_performance", sprint_id),
+                lambda: self._analyze_sprint_performance(sprint_id)
+            )
+
+    async def _analyze_sprint_performance(self, sprint_id: int) -> Dict[str, Any]:
         # Sprint verilerini alma
-        sprint = await self.sprint_repo.get_by_id(sprint_id)
+        sprint = await self._get_sprint(sprint_id)
         if not sprint:
             raise ValueError("Sprint not found")
 
         # Sprint performans analizi
         performance = await self.ai_agent.analyze_sprint_performance({
             "sprint": sprint.dict(),
-            "stories": [story.dict() for story in await self.user_story_repo.get_all()],
+            "stories": [story.dict() for story in await self._get_sprint_stories(sprint_id)],
             "velocity": sprint.velocity
         })
 
@@ -111,15 +123,19 @@ class AIProductOwnerUseCase:
 
     async def generate_comprehensive_report(self, sprint_id: int) -> Dict[str, Any]:
         """Kapsamlı sprint raporu oluşturur."""
+        async with analysis_scope():
+            return await self._generate_comprehensive_report(sprint_id)
+
+    async def _generate_comprehensive_report(self, sprint_id: int) -> Dict[str, Any]:
         # Sprint verilerini alma
-        sprint = await self.sprint_repo.get_by_id(sprint_id)
+        sprint = await self._get_sprint(sprint_id)
         if not sprint:
             raise ValueError("Sprint not found")
 
         # Sprint raporu oluşturma
         report = await self.ai_agent.generate_sprint_report({
             "sprint": sprint.dict(),
-            "stories": [story.dict() for story in await self.user_story_repo.get_all()],
+            "stories": [story.dict() for story in await self._get_sprint_stories(sprint_id)],
             "performance": await self.analyze_sprint_performance(sprint_id)
         })
 
@@ -139,6 +155,12 @@ class AIProductOwnerUseCase:
             "stakeholders": stakeholders
         }
 
+    async def _get_sprint(self, sprint_id: int) -> Optional[Sprint]:
+        return await memoized(("sprint", sprint_id), lambda: self.sprint_repo.get_by_id(sprint_id))
+
+    async def _get_sprint_stories(self, sprint_id: int) -> List[UserStory]:
+        return await memoized(("sprint_stories", sprint_id), lambda: self.user_story_repo.get_by_sprint(sprint_id))
+
     async def update_story_status(self, story_id: int, new_status: str) -> UserStory:
         """User story durumunu günceller ve ilgili analizleri yapar."""
         # Story'yi alma
@@ -153,10 +175,14 @@ class AIProductOwnerUseCase:
         # Veritabanını güncelleme
         updated_story = await self.user_story_repo.update(story)
 
-        # Eğer story tamamlandıysa, sprint analizini güncelle
-        if new_status == "DONE":
-            sprint = await self.sprint_repo.get_by_id(story.sprint_id)
-            if sprint:
-                await self.analyze_sprint_performance(sprint.id)
+        # Eğer story tamamlandıysa, sprint analizi arka planda (debounce ile) güncellenir
+        if new_status == "DONE" and story.sprint_id is not None:
+            self.reanalysis_queue.schedule(
+                story.sprint_id, session_scoped_analyzer(self), namespace=type(self).__name__
+            )
+
+        return updated_story
 
-        return updated_story 
\ No newline at end of file
+    def get_latest_sprint_analysis(self, sprint_id: int) -> Optional[Dict[str, Any]]:
+        """Arka planda tamamlanmış en son sprint analizini döner."""
+        return self.reanalysis_queue.get_latest(sprint_id, namespace=type(self).__name__) 
\ No newline at end of file
@@ -2,6 +2,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import torch
 import numpy as np
+from app.core.domain.analysis_context import analysis_scope, memoized
 from app.core.domain.entities import UserStory, Sprint, ProductBacklog, Stakeholder, Feedback
 from app.core.domain.repositories import (
     UserStoryRepository,
@@ -11,6 +12,7 @@ from app.core.domain.repositories import (
     FeedbackRepository
 )
 from app.core.services.deep_learning_ai_service import DeepLearningAIProductOwner
+from app.core.services.reanalysis_queue import SprintReanalysisQueue, get_reanalysis_queue, session_scoped_analyzer
 
 class DeepLearningAIProductOwnerUseCase:
     """Derin öğrenme yetenekleri ile donatılmış AI Product Owner use case implementation"""
@@ -21,13 +23,16 @@ class DeepLearningAIProductOwnerUseCase:
         sprint_repo: SprintRepository,
         backlog_repo: ProductBacklogRepository,
         stakeholder_repo: StakeholderRepository,
-        feedback_repo: FeedbackRepository
+        feedback_repo: FeedbackRepository,
+        reanalysis_queue: Optional[SprintReanalysisQueue] = None
     ):
         self.user_story_repo = user_story_repo
         self.sprint_repo = sprint_repo
         self.backlog_repo = backlog_repo
         self.stakeholder_repo = stakeholder_repo
         self.feedback_repo = feedback_repo
+        # DONE sonrası yeniden analiz istekten sonra kendi session'ıyla çalışır (session_scoped_analyzer)
+        self.reanalysis_queue = reanalysis_queue or get_reanalysis_queue()
         self.ai_agent = DeepLearningAIProductOwner()
 
     async def create_and_analyze_user_story(self, story_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -112,15 +117,22 @@ class DeepLearningAIProductOwnerUseCase:
 
     async def analyze_sprint_performance(self, sprint_id: int) -> Dict[str, Any]:
         """Sprint performansını derin öğrenme ile analiz eder."""
+        async with analysis_scope():
+            return await memoized(
+                (type(self).__name__, "sprint_performance", sprint_id),
+                lambda: self._analyze_sprint_performance(sprint_id)
+            )
+
+    async def _analyze_sprint_performance(self, sprint_id: int) -> Dict[str, Any]:
         # Sprint verilerini alma
-        sprint = await self.sprint_repo.get_by_id(sprint_id)
+        sprint = await self._get_sprint(sprint_id)
         if not sprint:
             raise ValueError("Sprint not found")
 
         # Sprint performans analizi
         performance = await self.ai_agent.analyze_sprint_performance({
             "sprint": sprint.dict(),
-            "stories": [story.dict() for story in await self.user_story_repo.get_all()],
+            "stories": [story.dict() for story in await self._get_sprint_stories(sprint_id)],
             "velocity": sprint.velocity,
             "team_metrics": sprint.team_metrics if hasattr(sprint, "team_metrics") else {},
             "quality_metrics": sprint.quality_metrics if hasattr(sprint, "quality_metrics") else {}
@@ -133,8 +145,12 @@ class DeepLearningAIProductOwnerUseCase:
 
     async def generate_comprehensive_report(self, sprint_id: int) -> Dict[str, Any]:
         """Kapsamlı sprint raporu oluşturur."""
+        async with analysis_scope():
+            return await self._generate_comprehensive_report(sprint_id)
+
+    async def _generate_comprehensive_report(self, sprint_id: int) -> Dict[str, Any]:
         # Sprint verilerini alma
-        sprint = await self.sprint_repo.get_by_id(sprint_id)
+        sprint = await self._get_sprint(sprint_id)
         if not sprint:
             raise ValueError("Sprint not found")
 
@@ -159,6 +175,12 @@ class DeepLearningAIProductOwnerUseCase:
 
         return report
 
+    async def _get_sprint(self, sprint_id: int) -> Optional[Sprint]:
+        return await memoized(("sprint", sprint_id), lambda: self.sprint_repo.get_by_id(sprint_id))
+
+    async def _get_sprint_stories(self, sprint_id: int) -> List[UserStory]:
+        return await memoized(("sprint_stories", sprint_id), lambda: self.user_story_repo.get_by_sprint(sprint_id))
+
     async def update_story_status(self, story_id: int, new_status: str) -> UserStory:
         """User story durumunu günceller ve derin öğrenme ile analiz eder."""
         # Story'yi alma
@@ -173,14 +195,18 @@ class DeepLearningAIProductOwnerUseCase:
         # Veritabanını güncelleme
         updated_story = await self.user_story_repo.update(story)
 
-        # Eğer story tamamlandıysa, sprint analizini güncelle
-        if new_status == "DONE":
-            sprint = await self.sprint_repo.get_by_id(story.sprint_id)
-            if sprint:
-                await self.analyze_sprint_performance(sprint.id)
+        # Eğer story tamamlandıysa, sprint analizi arka planda (debounce ile) güncellenir
+        if new_status == "DONE" and story.sprint_id is not None:
+            self.reanalysis_queue.schedule(
+                story.sprint_id, session_scoped_analyzer(self), namespace=type(self).__name__
+            )
 
         return updated_story
 
+    def get_latest_sprint_analysis(self, sprint_id: int) -> Optional[Dict[str, Any]]:
+        """Arka planda tamamlanmış en son sprint analizini döner."""
+        return self.reanalysis_queue.get_latest(sprint_id, namespace=type(self).__name__)
+
     def _collect_training_data(self, entity: Any, analysis: Dict[str, Any]):
         """Model eğitimi için veri toplar."""
         if isinstance(entity, UserStory):
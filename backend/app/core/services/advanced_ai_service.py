@@ -3,16 +3,21 @@ import openai
 from datetime import datetime
 import json
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
 from app.core.config import settings
+from app.core.services.forecasting import MonteCarloForecaster, remaining_work
+from app.core.services.story_point_predictor import get_story_point_predictor
 from app.core.domain.entities import UserStory, Sprint, ProductBacklog, Feedback
 
+# Model henüz eğitilmemişken verilen tahmin
+DEFAULT_STORY_POINTS = 3
+
 class AdvancedAIProductOwner:
     """Gelişmiş AI Product Owner - Makine öğrenmesi ve derin öğrenme yetenekleri ile donatılmış"""
 
     def __init__(self):
         self.model = "gpt-4"
-        self.velocity_predictor = RandomForestRegressor()
+        # Arka planda eğitilip diskten yüklenen, process boyunca paylaşılan model
+        self.velocity_predictor = get_story_point_predictor()
         self.openai.api_key = settings.OPENAI_API_KEY
         
         # AI sistem promptu
@@ -53,12 +58,7 @@ class AdvancedAIProductOwner:
         value_analysis = await self._analyze_business_value(story, context)
         
         # Story point tahmini
-        story_points = self._predict_story_points(
-            nlp_analysis,
-            complexity_analysis,
-            risk_analysis,
-            value_analysis
-        )
+        story_points = self._predict_story_points(story, context)
 
         return {
             "nlp_analysis": nlp_analysis,
@@ -144,28 +144,23 @@ class AdvancedAIProductOwner:
         }
 
     async def predict_future_performance(self, historical_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Gelecek performansı makine öğrenmesi ile tahmin eder."""
-        # Veri hazırlama
-        features = self._prepare_prediction_features(historical_data)
-        
-        # Model eğitimi
-        self._train_prediction_models(features)
-        
-        # Tahminler
-        velocity_prediction = self._predict_velocity(features)
-        risk_prediction = self._predict_risks(features)
-        quality_prediction = self._predict_quality(features)
-        
+        """
+        Gelecek performansı geçmiş sprint'lerden Monte Carlo simülasyonu ile tahmin eder.
+        Her istekte model eğitilmez; kalan iş için tamamlanma tarihi yüzdelikleri ve güven bantları döner.
+        """
+        forecaster = MonteCarloForecaster.from_history(historical_data)
+        remaining = remaining_work(
+            list(historical_data.get("stories") or []) + list(historical_data.get("backlog") or [])
+        )
+        completion = forecaster.forecast(
+            remaining_points=remaining["points"],
+            remaining_items=remaining["items"]
+        )
+
         return {
-            "velocity_prediction": velocity_prediction,
-            "risk_prediction": risk_prediction,
-            "quality_prediction": quality_prediction,
-            "confidence_scores": self._calculate_prediction_confidence(),
-            "recommendations": self._generate_prediction_recommendations(
-                velocity_prediction,
-                risk_prediction,
-                quality_prediction
-            )
+            "velocity_prediction": forecaster.velocity_bands(),
+            "completion_forecast": completion,
+            "confidence_scores": forecaster.confidence()
         }
 
     async def _perform_nlp_analysis(self, text: str) -> Dict[str, Any]:
@@ -240,27 +235,23 @@ class AdvancedAIProductOwner:
         response = await self._get_ai_response(prompt)
         return self._parse_value_analysis(response)
 
-    def _predict_story_points(
-        self,
-        nlp_analysis: Dict[str, Any],
-        complexity_analysis: Dict[str, Any],
-        risk_analysis: Dict[str, Any],
-        value_analysis: Dict[str, Any]
-    ) -> int:
-        """Story point tahmini yapar."""
-        # Özellik vektörü oluştur
-        features = self._create_story_point_features(
-            nlp_analysis,
-            complexity_analysis,
-            risk_analysis,
-            value_analysis
-        )
-        
-        # Tahmin yap
-        prediction = self.velocity_predictor.predict([features])[0]
-        
-        # Tahmini yuvarla
-        return round(prediction)
+    def _predict_story_points(self, story: str, context: Optional[Dict[str, Any]] = None) -> int:
+        """Story point tahmini yapar; model eğitimdeki gibi başlık, açıklama ve meta veriyi görür."""
+        context = context or {}
+        return self.estimate_story_points([{
+            "title": context.get("title"),
+            "description": story,
+            "priority": context.get("priority"),
+            "acceptance_criteria": context.get("acceptance_criteria")
+        }])[0]
+
+    def estimate_story_points(self, stories: List[Dict[str, Any]]) -> List[int]:
+        """
+        Story'lerin puanlarını tek model çağrısıyla tahmin eder; istek başına eğitim yapılmaz.
+        Model henüz eğitilmemişse varsayılan değer döner.
+        """
+        predictions = self.velocity_predictor.predict(stories)
+        return [DEFAULT_STORY_POINTS if points is None else points for points in predictions]
 
     def _analyze_velocity_trends(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
         """Velocity trendlerini analiz eder."""
@@ -13,10 +13,21 @@ from nltk.corpus import stopwords
 from gensim.models import Word2Vec
 from stable_baselines3 import PPO
 from stable_baselines3.common.vec_env import DummyVecEnv
-import gym
+import gymnasium as gym
+import asyncio
 from app.core.config import settings
+from app.core.services.inference_runtime import (
+    InferenceBatcher,
+    InferenceRuntimeConfig,
+    configure_inference_runtime,
+    get_inference_executor
+)
 from app.core.domain.entities import UserStory, Sprint, ProductBacklog, Feedback
 
+# RL agent'ın gözlem boyutu; story özellikleri ve backlog gömmeleri bu boyuta indirgenir
+AGENT_OBSERVATION_SIZE = 50
+PRIORITY_WEIGHTS = {"LOW": 1.0, "MEDIUM": 2.0, "HIGH": 3.0, "CRITICAL": 4.0}
+
 class DeepLearningModel(nn.Module):
     """Derin öğrenme modeli"""
     
@@ -35,29 +46,65 @@ class DeepLearningModel(nn.Module):
     def forward(self, x):
         return self.layers(x)
 
+class StoryAnalysisNetwork(nn.Module):
+    """Gömme, ortak özellikler ve tüm analiz başlıklarını tek ileri geçişte hesaplayan graf"""
+
+    def __init__(
+        self,
+        encoder: nn.Module,
+        story_analyzer: nn.Module,
+        complexity_head: nn.Module,
+        risk_head: nn.Module,
+        points_head: nn.Module
+    ):
+        super(StoryAnalysisNetwork, self).__init__()
+        self.encoder = encoder
+        self.story_analyzer = story_analyzer
+        self.complexity_head = complexity_head
+        self.risk_head = risk_head
+        self.points_head = points_head
+
+    def forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor, **encoder_inputs) -> Dict[str, torch.Tensor]:
+        # BERT gömme (padding token'ları ortalamaya katılmaz)
+        hidden = self.encoder(input_ids=input_ids, attention_mask=attention_mask, **encoder_inputs).last_hidden_state
+        mask = attention_mask.unsqueeze(-1).to(hidden.dtype)
+        embedding = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+
+        # Ortak özellikler tüm başlıklar için bir kez hesaplanır
+        features = self.story_analyzer(embedding)
+        return {
+            "embedding": embedding,
+            "features": features,
+            "complexity": self.complexity_head(features),
+            "risk": self.risk_head(features),
+            "story_points": self.points_head(features).squeeze(-1)
+        }
+
 class ProductOwnerEnvironment(gym.Env):
     """Product Owner için özel ortam"""
     
-    def __init__(self):
+    def __init__(self, observation_size: int = AGENT_OBSERVATION_SIZE):
         super(ProductOwnerEnvironment, self).__init__()
         self.action_space = gym.spaces.Discrete(10)  # 10 farklı aksiyon
         self.observation_space = gym.spaces.Box(
-            low=-np.inf, high=np.inf, shape=(50,), dtype=np.float32
+            low=-np.inf, high=np.inf, shape=(observation_size,), dtype=np.float32
         )
         self.state = None
         self.reset()
     
-    def reset(self):
-        self.state = np.zeros(50)
-        return self.state
+    def reset(self, seed: Optional[int] = None, options: Optional[Dict[str, Any]] = None):
+        super().reset(seed=seed)
+        self.state = np.zeros(self.observation_space.shape, dtype=np.float32)
+        return self.state, {}
     
     def step(self, action):
         # Aksiyonları uygula ve ödül hesapla
         reward = self._calculate_reward(action)
         self.state = self._update_state(action)
-        done = False
+        terminated = False
+        truncated = False
         info = {}
-        return self.state, reward, done, info
+        return self.state, reward, terminated, truncated, info
     
     def _calculate_reward(self, action):
         # Ödül hesaplama mantığı
@@ -70,15 +117,30 @@ class ProductOwnerEnvironment(gym.Env):
 class DeepLearningAIProductOwner:
     """Derin öğrenme yetenekleri ve güçlü agent ile donatılmış AI Product Owner"""
 
-    def __init__(self):
-        # Derin öğrenme modelleri
+    def __init__(self, runtime_config: Optional[InferenceRuntimeConfig] = None):
+        # Thread ayarları model yüklenmeden önce yapılmalı
+        self.runtime_config = configure_inference_runtime(runtime_config)
+        self.inference_executor = get_inference_executor()
+
+        # Derin öğrenme modelleri (başlıklar story_analyzer özelliklerini girdi alır)
         self.story_analyzer = DeepLearningModel(768, 512, 256)
+        self.complexity_analyzer = DeepLearningModel(256, 128, 3)
         self.velocity_predictor = DeepLearningModel(256, 128, 1)
-        self.risk_analyzer = DeepLearningModel(512, 256, 128)
+        self.risk_analyzer = DeepLearningModel(256, 128, 3)
         
-        # NLP modelleri
+        # NLP modelleri (BERT eğitilmez, yalnızca gömme üretir)
         self.tokenizer = AutoTokenizer.from_pretrained('bert-base-uncased')
         self.bert_model = AutoModel.from_pretrained('bert-base-uncased')
+        self.bert_model.requires_grad_(False)
+
+        # Tek geçişli story analiz grafı
+        self.story_network = StoryAnalysisNetwork(
+            self.bert_model,
+            self.story_analyzer,
+            self.complexity_analyzer,
+            self.risk_analyzer,
+            self.velocity_predictor
+        ).eval()
         self.nlp = spacy.load('en_core_web_sm')
         nltk.download('punkt')
         nltk.download('stopwords')
@@ -100,47 +162,35 @@ class DeepLearningAIProductOwner:
         }
         
         # Model eğitimi için optimizer
-        self.optimizer = optim.Adam(self.story_analyzer.parameters())
+        self.optimizer = optim.Adam(
+            list(self.story_analyzer.parameters()) + list(self.complexity_analyzer.parameters())
+        )
         self.criterion = nn.MSELoss()
 
+        # Story analizleri mikro-batch'ler halinde inference havuzunda çalışır
+        self.story_batcher = InferenceBatcher(self._analyze_story_batch, executor=self.inference_executor)
+
     async def analyze_user_story(self, story: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """User story'yi derin öğrenme ile analiz eder."""
-        # Metin gömme
-        story_embedding = self._get_story_embedding(story)
-        
-        # Derin öğrenme analizi
-        story_features = self.story_analyzer(torch.FloatTensor(story_embedding))
-        
-        # Karmaşıklık analizi
-        complexity = self._analyze_complexity(story_features)
-        
-        # Risk analizi
-        risk_assessment = self._analyze_risks(story_features)
-        
-        # Story point tahmini
-        story_points = self._predict_story_points(story_features)
-        
-        # Agent aksiyonu
-        action = self._get_agent_action(story_features)
-        
-        return {
-            "story_embedding": story_embedding.tolist(),
-            "complexity_analysis": complexity,
-            "risk_assessment": risk_assessment,
-            "story_points": story_points,
-            "agent_recommendation": action
-        }
+        # Aynı anda gelen story'ler tek batch'te analiz edilir, event loop bloklanmaz
+        return await self.story_batcher.submit(story)
 
     async def prioritize_backlog(self, items: List[Dict[str, Any]], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Backlog öğelerini derin öğrenme ile önceliklendirir."""
-        # Öğe gömme
-        item_embeddings = [self._get_story_embedding(item["description"]) for item in items]
+        if not items:
+            return {"prioritized_items": [], "embeddings": [], "agent_recommendation": None}
+
+        # Öğe ve sprint hedefi gömmeleri (tek BERT batch'i, inference havuzunda)
+        goals = (context or {}).get("sprint_goals")
+        texts = [item["description"] for item in items] + ([str(goals)] if goals else [])
+        embeddings = await self._run_inference(self._get_story_embeddings, texts)
+        item_embeddings = embeddings[:len(items)]
         
         # Önceliklendirme
-        priorities = self._calculate_priorities(item_embeddings, context)
+        priorities = self._calculate_priorities(items, item_embeddings, embeddings[len(items)] if goals else None)
         
         # Agent aksiyonu
-        action = self._get_agent_action(np.mean(item_embeddings, axis=0))
+        action = self._get_agent_actions(np.mean(item_embeddings, axis=0)[None, :])[0]
         
         return {
             "prioritized_items": priorities,
@@ -169,51 +219,130 @@ class DeepLearningAIProductOwner:
             "agent_recommendation": action
         }
 
+    async def _run_inference(self, fn, *args):
+        """Model çağrısını ayrılmış inference thread havuzunda çalıştırır."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.inference_executor, fn, *args)
+
+    def _analyze_story_batch(self, stories: List[str]) -> List[Dict[str, Any]]:
+        """Bir grup story'yi inference thread'inde tek ileri geçişle analiz eder."""
+        inputs = self.tokenizer(stories, return_tensors="pt", padding=True, truncation=True)
+        with torch.inference_mode():
+            outputs = self.story_network(**inputs)
+
+        # Agent batch'in tüm story'leri için tek policy çağrısıyla karar verir
+        actions = self._get_agent_actions(outputs["features"].numpy())
+        results = []
+        for i in range(len(stories)):
+            results.append({
+                "story_embedding": outputs["embedding"][i].tolist(),
+                "complexity_analysis": self._analyze_complexity(outputs["complexity"][i]),
+                "risk_assessment": self._analyze_risks(outputs["risk"][i]),
+                "story_points": self._predict_story_points(outputs["story_points"][i]),
+                "agent_recommendation": actions[i]
+            })
+        return results
+
     def _get_story_embedding(self, text: str) -> np.ndarray:
         """Metin gömme oluşturur."""
+        return self._get_story_embeddings([text])[0]
+
+    def _get_story_embeddings(self, texts: List[str]) -> List[np.ndarray]:
+        """Birden fazla metin için tek BERT çağrısıyla gömme oluşturur."""
         # BERT gömme
-        inputs = self.tokenizer(text, return_tensors="pt", padding=True, truncation=True)
+        inputs = self.tokenizer(texts, return_tensors="pt", padding=True, truncation=True)
         with torch.no_grad():
             outputs = self.bert_model(**inputs)
-        bert_embedding = outputs.last_hidden_state.mean(dim=1).numpy()
-        
-        # Word2Vec gömme
-        tokens = word_tokenize(text.lower())
-        word2vec_embedding = np.mean([self.word2vec.wv[word] for word in tokens if word in self.word2vec.wv], axis=0)
-        
-        # Gömme birleştirme
-        return np.concatenate([bert_embedding, word2vec_embedding])
+        # Padding token'ları ortalamaya katılmaz
+        mask = inputs["attention_mask"].unsqueeze(-1).float()
+        bert_embeddings = ((outputs.last_hidden_state * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)).numpy()
+
+        embeddings = []
+        for text, bert_embedding in zip(texts, bert_embeddings):
+            # Word2Vec gömme (bilinen kelime yoksa sıfır vektör)
+            tokens = word_tokenize(text.lower())
+            word_vectors = [self.word2vec.wv[word] for word in tokens if word in self.word2vec.wv]
+            word2vec_embedding = np.mean(word_vectors, axis=0) if word_vectors else np.zeros(self.word2vec.vector_size)
 
-    def _analyze_complexity(self, features: torch.Tensor) -> Dict[str, Any]:
-        """Karmaşıklık analizi yapar."""
-        complexity_scores = self.story_analyzer(features)
+            # Gömme birleştirme
+            embeddings.append(np.concatenate([bert_embedding, word2vec_embedding]))
+        return embeddings
+
+    def _analyze_complexity(self, complexity_scores: torch.Tensor) -> Dict[str, Any]:
+        """Karmaşıklık başlığının çıktısını yorumlar."""
         return {
             "technical_complexity": float(complexity_scores[0]),
             "business_complexity": float(complexity_scores[1]),
             "integration_complexity": float(complexity_scores[2])
         }
 
-    def _analyze_risks(self, features: torch.Tensor) -> Dict[str, Any]:
-        """Risk analizi yapar."""
-        risk_scores = self.risk_analyzer(features)
+    def _analyze_risks(self, risk_scores: torch.Tensor) -> Dict[str, Any]:
+        """Risk başlığının çıktısını yorumlar."""
         return {
             "technical_risk": float(risk_scores[0]),
             "business_risk": float(risk_scores[1]),
             "schedule_risk": float(risk_scores[2])
         }
 
-    def _predict_story_points(self, features: torch.Tensor) -> int:
-        """Story point tahmini yapar."""
-        prediction = self.velocity_predictor(features)
+    def _predict_story_points(self, prediction: torch.Tensor) -> int:
+        """Story point başlığının çıktısını yuvarlar."""
         return round(float(prediction))
 
+    def _calculate_priorities(
+        self,
+        items: List[Dict[str, Any]],
+        embeddings: List[np.ndarray],
+        goal_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Öğeleri öncelik ağırlığı ve sprint hedefine (hedef yoksa backlog'un ortalamasına)
+        anlamsal yakınlığa göre sıralar.
+        """
+        matrix = np.vstack(embeddings)
+        target = goal_embedding if goal_embedding is not None else matrix.mean(axis=0)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(target)
+        alignment = matrix @ target / np.where(norms == 0, 1, norms)
+        weights = np.array([PRIORITY_WEIGHTS.get(str(item.get("priority") or "MEDIUM").upper(), 2.0) for item in items])
+        scores = weights * (1 + alignment)
+        return [
+            {
+                "id": items[i].get("id"),
+                "title": items[i].get("title"),
+                "priority": items[i].get("priority"),
+                "alignment": round(float(alignment[i]), 4),
+                "score": round(float(scores[i]), 4)
+            }
+            for i in np.argsort(-scores, kind="stable")
+        ]
+
+    def _agent_observations(self, states: np.ndarray) -> np.ndarray:
+        """
+        Durum vektörlerini (satır başına bir durum) agent'ın gözlem boyutuna indirger: geniş
+        vektörler eşit parçalarının ortalamasıyla özetlenir, kısa olanlar sıfırla doldurulur.
+        """
+        size = self.agent.observation_space.shape[0]
+        states = np.asarray(states, dtype=np.float32).reshape(len(states), -1)
+        width = states.shape[1]
+        if width < size:
+            return np.pad(states, ((0, 0), (0, size - width)))
+        bounds = np.linspace(0, width, size + 1).astype(np.int64)
+        return np.add.reduceat(states, bounds[:-1], axis=1) / np.diff(bounds).astype(np.float32)
+
+    def _get_agent_actions(self, states: np.ndarray) -> List[Dict[str, Any]]:
+        """RL agent'ın aksiyonlarını durumların tamamı için tek policy çağrısıyla alır."""
+        observations = self._agent_observations(states)
+        actions, _ = self.agent.predict(observations, deterministic=True)
+        with torch.no_grad():
+            obs_tensor, _ = self.agent.policy.obs_to_tensor(observations)
+            entropy = self.agent.policy.get_distribution(obs_tensor).entropy().cpu().numpy()
+        return [
+            {"action_type": int(action), "confidence": float(value)}
+            for action, value in zip(np.atleast_1d(actions), np.atleast_1d(entropy))
+        ]
+
     def _get_agent_action(self, state: np.ndarray) -> Dict[str, Any]:
         """RL agent'ın aksiyonunu alır."""
-        action, _ = self.agent.predict(state)
-        return {
-            "action_type": int(action),
-            "confidence": float(self.agent.policy.get_distribution(torch.FloatTensor(state)).entropy())
-        }
+        return self._get_agent_actions(np.asarray(state, dtype=np.float32)[None, ...])[0]
 
     def train_models(self, training_data: Dict[str, Any]):
         """Modelleri eğitir."""
@@ -230,16 +359,22 @@ class DeepLearningAIProductOwner:
         self._train_agent(training_data["actions"])
 
     def _train_story_analyzer(self, stories: List[Dict[str, Any]]):
-        """Story analyzer modelini eğitir."""
-        for story in stories:
-            features = torch.FloatTensor(self._get_story_embedding(story["text"]))
-            target = torch.FloatTensor(story["complexity"])
-            
-            self.optimizer.zero_grad()
-            output = self.story_analyzer(features)
-            loss = self.criterion(output, target)
-            loss.backward()
-            self.optimizer.step()
+        """Story analyzer ve karmaşıklık başlığını eğitir."""
+        self.story_analyzer.train()
+        self.complexity_analyzer.train()
+        try:
+            for story in stories:
+                inputs = self.tokenizer(story["text"], return_tensors="pt", truncation=True)
+                target = torch.FloatTensor([story["complexity"]])
+
+                self.optimizer.zero_grad()
+                output = self.story_network(**inputs)["complexity"]
+                loss = self.criterion(output, target)
+                loss.backward()
+                self.optimizer.step()
+        finally:
+            self.story_analyzer.eval()
+            self.complexity_analyzer.eval()
 
     def _train_velocity_predictor(self, velocities: List[Dict[str, Any]]):
         """Velocity predictor modelini eğitir."""
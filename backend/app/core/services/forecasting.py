@@ -0,0 +1,210 @@
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from app.core.services.sprint_metrics import DONE_STATUSES, SprintMetricsEngine
+
+DEFAULT_SAMPLES = 20_000
+DEFAULT_PERCENTILES = (50, 70, 85, 95)
+BAND_PERCENTILES = (10, 50, 90)
+DEFAULT_SPRINT_LENGTH = timedelta(days=14)
+# Simülasyon en fazla bu kadar sprint ileri bakar (iki haftalık sprint'te dört yıl)
+MAX_HORIZON = 104
+
+def _percentile_key(percentile: float) -> str:
+    return f"p{percentile:g}"
+
+def remaining_work(items: Iterable[Dict[str, Any]]) -> Dict[str, float]:
+    """DONE olmayan öğelerin sayısı ve toplam puanı."""
+    points = [float(item.get("story_points") or 0) for item in items if item.get("status") not in DONE_STATUSES]
+    return {"items": len(points), "points": float(sum(points))}
+
+class MonteCarloForecaster:
+    """
+    Geçmiş sprint'lerin velocity (puan) ve throughput (task) değerlerinden yeniden örnekleyerek
+    gelecek sprint'leri simüle eder. Tüm örnekler tek NumPy çekilişiyle (örnek x sprint matrisi)
+    üretilir; model eğitimi yoktur, kurulum yalnızca geçmişi dizilere çevirmektir.
+
+    Aynı örnekte velocity ve throughput aynı geçmiş sprint'ten çekilir; ikisi arasındaki ilişki korunur.
+    """
+
+    def __init__(
+        self,
+        velocities: Sequence[float],
+        throughputs: Optional[Sequence[float]] = None,
+        sprint_length: timedelta = DEFAULT_SPRINT_LENGTH,
+        samples: int = DEFAULT_SAMPLES,
+        seed: Optional[int] = None
+    ):
+        self.velocities = np.asarray(velocities, dtype=np.float64)
+        self.throughputs = np.asarray(throughputs if throughputs is not None else [], dtype=np.float64)
+        if len(self.throughputs) != len(self.velocities):
+            self.throughputs = np.full(len(self.velocities), np.nan)
+        self.sprint_length = sprint_length
+        self.samples = samples
+        self.seed = seed
+
+    @classmethod
+    def from_engine(cls, engine: SprintMetricsEngine, window: Optional[int] = None, **kwargs) -> "MonteCarloForecaster":
+        """Bitmiş sprint'lerin (window verilirse son window tanesinin) geçmişinden kurar."""
+        history = engine.velocity_history()
+        if window:
+            history = history[-window:]
+        sprint_ids = [point["sprint_id"] for point in history]
+        stats = engine.sprint_stats().reindex(sprint_ids)
+        if "sprint_length" not in kwargs:
+            lengths = (stats["end_date"] - stats["start_date"]).dropna()
+            lengths = lengths[lengths > pd.Timedelta(0)]
+            if len(lengths):
+                kwargs["sprint_length"] = lengths.median().to_pytimedelta()
+        # Task'ı yüklenmemiş sprint'in throughput'u bilinmez; o örneklerde throughput simüle edilmez
+        throughputs = stats["throughput"].to_numpy(dtype=np.float64) if "throughput" in stats else None
+        return cls([point["velocity"] for point in history], throughputs, **kwargs)
+
+    @classmethod
+    def from_history(cls, historical_data: Dict[str, Any], window: Optional[int] = None, **kwargs) -> "MonteCarloForecaster":
+        """Ekip verisinden ({"sprints": [...], "stories" | "tasks": [...]}) kurar."""
+        data = {**historical_data, "tasks": list(historical_data.get("tasks") or historical_data.get("stories") or [])}
+        return cls.from_engine(SprintMetricsEngine.from_team_data(data), window, **kwargs)
+
+    def _draw(self, rng: np.random.Generator, horizon: int, rows: int) -> np.ndarray:
+        """Sprint x örnek boyutunda geçmiş sprint indeksleri."""
+        return rng.integers(0, len(self.velocities), size=(horizon, rows), dtype=np.int32)
+
+    def _simulate(self, targets: Dict[str, Tuple[np.ndarray, float]]) -> Dict[str, np.ndarray]:
+        """
+        Her hedef için işi bitiren sprint sayısı (örnek başına); MAX_HORIZON içinde bitmeyenler inf.
+        Ufuk ortalama hızdan tahmin edilir; bitmeyen örnekler için ufuk ikiye katlanarak yalnızca
+        onlar uzatılır, böylece yavaş geçmiş sprint'ler matrisin tamamını büyütmez.
+        """
+        rng = np.random.default_rng(self.seed)
+        needed = {name: np.full(self.samples, np.inf) for name in targets}
+        totals = {name: np.zeros(self.samples, dtype=np.float32) for name in targets}
+        active = {}
+        for name, (history, remaining) in targets.items():
+            if remaining <= 0:
+                needed[name][:] = 0
+            elif history.mean() > 0:
+                # Puanlar tam sayı; float32 toplam 2^24'e kadar kesin ve yarı bellek trafiği
+                active[name] = (history.astype(np.float32), remaining)
+        if not active:
+            return needed
+
+        step = max(int(np.ceil(1.25 * remaining / history.mean())) + 1 for history, remaining in active.values())
+        pending = np.arange(self.samples)
+        elapsed = 0
+        while len(pending) and elapsed < MAX_HORIZON:
+            step = min(step, MAX_HORIZON - elapsed)
+            # Satırlar sprint, kolonlar örnek: kümülatif toplam ardışık satırları toplar
+            draws = self._draw(rng, step, len(pending))
+            unfinished = np.zeros(len(pending), dtype=bool)
+            for name, (history, remaining) in active.items():
+                cumulative = np.take(history, draws)
+                np.cumsum(cumulative, axis=0, out=cumulative)
+                cumulative += totals[name][pending]
+                # Kümülatif toplam azalmaz: hedefin altında kalan sprint sayısı, bitiren sprint'in indeksidir
+                short = (cumulative < remaining).sum(axis=0)
+                hit = (short < step) & np.isinf(needed[name][pending])
+                needed[name][pending[hit]] = elapsed + short[hit] + 1
+                totals[name][pending] = cumulative[-1]
+                unfinished |= short == step
+            pending = pending[unfinished]
+            elapsed += step
+            step *= 2
+        return needed
+
+    def _summary(
+        self,
+        sprints: np.ndarray,
+        start: datetime,
+        percentiles: Sequence[float]
+    ) -> Dict[str, Any]:
+        # "higher": sprint sayısı tam sayıdır, ara değer yerine karamsar tarafa yuvarlanır
+        values = np.percentile(sprints, percentiles, method="higher")
+        counts = {
+            _percentile_key(p): int(value) if np.isfinite(value) else None
+            for p, value in zip(percentiles, values)
+        }
+        finite, frequency = np.unique(sprints[np.isfinite(sprints)], return_counts=True)
+        cumulative = np.cumsum(frequency) / len(sprints)
+        return {
+            "sprints": counts,
+            "completion_dates": {
+                key: (start + count * self.sprint_length).isoformat() if count is not None else None
+                for key, count in counts.items()
+            },
+            "probability_within_horizon": round(float(np.isfinite(sprints).mean()), 4),
+            "distribution": [
+                {"sprints": int(count), "probability": round(float(freq) / len(sprints), 4), "cumulative": round(float(cum), 4)}
+                for count, freq, cum in zip(finite, frequency, cumulative)
+            ]
+        }
+
+    def forecast(
+        self,
+        remaining_points: Optional[float] = None,
+        remaining_items: Optional[int] = None,
+        start: Optional[datetime] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Dict[str, Any]:
+        """
+        Kalan puanın (ve verilirse task sayısının) kaç sprint'te biteceğinin yüzdelikleri ve
+        start'tan itibaren tamamlanma tarihleri. Geçmiş yoksa tahmin boş döner.
+        """
+        start = start or datetime.utcnow()
+        result: Dict[str, Any] = {"samples": self.samples, "history_sprints": len(self.velocities)}
+        if not len(self.velocities):
+            return {**result, "points": None, "items": None}
+
+        targets = {}
+        if remaining_points is not None:
+            targets["points"] = (self.velocities, float(remaining_points))
+        # Throughput'u bilinmeyen sprint varsa task sayısı simüle edilmez
+        if remaining_items is not None and not np.isnan(self.throughputs).any():
+            targets["items"] = (self.throughputs, float(remaining_items))
+
+        needed = self._simulate(targets)
+        for name in ("points", "items"):
+            result[name] = (
+                {"remaining": targets[name][1], **self._summary(needed[name], start, percentiles)}
+                if name in targets else None
+            )
+        return result
+
+    def velocity_bands(self, sprints: int = 6, percentiles: Sequence[float] = BAND_PERCENTILES) -> Dict[str, Any]:
+        """
+        Sonraki sprint'ler için güven bantları: sprint başına velocity ve kümülatif teslim edilen
+        puanın yüzdelikleri (burn-up yelpaze grafiği).
+        """
+        if not len(self.velocities) or sprints <= 0:
+            return {"sprints": [], "velocity": {}, "cumulative_points": {}}
+        sampled = np.take(self.velocities, self._draw(np.random.default_rng(self.seed), sprints, self.samples))
+        velocity = np.percentile(sampled[0], percentiles)
+        cumulative = np.percentile(np.cumsum(sampled, axis=0), percentiles, axis=1)
+        return {
+            "sprints": list(range(1, sprints + 1)),
+            "velocity": {
+                "mean": round(float(sampled[0].mean()), 2),
+                **{_percentile_key(p): round(float(v), 2) for p, v in zip(percentiles, velocity)}
+            },
+            "cumulative_points": {
+                _percentile_key(p): np.round(row, 2).tolist() for p, row in zip(percentiles, cumulative)
+            }
+        }
+
+    def confidence(self) -> Dict[str, Any]:
+        """Geçmişin büyüklüğü ve dağılımı; az ve oynak geçmiş tahmini zayıflatır."""
+        count = len(self.velocities)
+        mean = float(self.velocities.mean()) if count else 0.0
+        variation = float(self.velocities.std() / mean) if count and mean else None
+        if count < 3 or variation is None:
+            level = "low"
+        elif count >= 6 and variation <= 0.25:
+            level = "high"
+        else:
+            level = "medium" if variation <= 0.5 else "low"
+        return {
+            "history_sprints": count,
+            "coefficient_of_variation": round(variation, 4) if variation is not None else None,
+            "level": level
+        }
@@ -0,0 +1,188 @@
+from typing import Dict, Any, List, Optional, Callable
+from concurrent.futures import Executor, ThreadPoolExecutor
+import asyncio
+import logging
+import os
+import threading
+import torch
+from pydantic import BaseModel
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_runtime_lock = threading.Lock()
+_runtime_config: Optional["InferenceRuntimeConfig"] = None
+_inference_executor: Optional[ThreadPoolExecutor] = None
+
+class InferenceRuntimeConfig(BaseModel):
+    """Worker başına torch paralellik ayarları"""
+
+    intra_op_threads: int
+    inter_op_threads: int
+    pool_workers: int
+
+    @classmethod
+    def from_settings(cls) -> "InferenceRuntimeConfig":
+        """Ayarlardan, host'taki worker sayısına göre thread bütçesini hesaplar."""
+        pool_workers = max(1, settings.INFERENCE_POOL_WORKERS)
+        intra_op_threads = settings.TORCH_INTRA_OP_THREADS
+        if not intra_op_threads:
+            # Çekirdekleri worker'lar ve inference thread'leri arasında paylaştır
+            cpu_count = os.cpu_count() or 1
+            intra_op_threads = max(1, cpu_count // (max(1, settings.WEB_CONCURRENCY) * pool_workers))
+        return cls(
+            intra_op_threads=intra_op_threads,
+            inter_op_threads=max(1, settings.TORCH_INTER_OP_THREADS),
+            pool_workers=pool_workers
+        )
+
+def configure_inference_runtime(config: Optional[InferenceRuntimeConfig] = None) -> InferenceRuntimeConfig:
+    """Torch thread ayarlarını process başına bir kez uygular ve paralelliği raporlar."""
+    global _runtime_config
+    with _runtime_lock:
+        if _runtime_config is not None:
+            return _runtime_config
+
+        config = config or InferenceRuntimeConfig.from_settings()
+
+        # HF tokenizer'ın kendi thread havuzu da çekirdek kapmasın
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+        torch.set_num_threads(config.intra_op_threads)
+        try:
+            # Inter-op havuzu yalnızca ilk paralel işten önce ayarlanabilir
+            torch.set_num_interop_threads(config.inter_op_threads)
+        except RuntimeError as e:
+            logger.warning("Inter-op thread sayısı ayarlanamadı: %s", e)
+
+        _runtime_config = config
+        logger.info("Inference paralelliği: %s", describe_parallelism())
+        return config
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """Model çağrıları için ayrılmış thread havuzunu döner."""
+    global _inference_executor
+    config = configure_inference_runtime()
+    with _runtime_lock:
+        if _inference_executor is None:
+            _inference_executor = ThreadPoolExecutor(
+                max_workers=config.pool_workers,
+                thread_name_prefix="inference",
+                initializer=_init_inference_thread,
+                initargs=(config.intra_op_threads,)
+            )
+        return _inference_executor
+
+def _init_inference_thread(intra_op_threads: int):
+    """OpenMP thread sayısı thread'e özeldir, havuzdaki her thread için tekrar ayarlanır."""
+    torch.set_num_threads(intra_op_threads)
+
+def describe_parallelism() -> Dict[str, Any]:
+    """Bu worker'daki efektif paralelliği döner."""
+    pool_workers = _runtime_config.pool_workers if _runtime_config else 0
+    intra_op_threads = torch.get_num_threads()
+    return {
+        "cpu_count": os.cpu_count(),
+        "web_concurrency": settings.WEB_CONCURRENCY,
+        "intra_op_threads": intra_op_threads,
+        "inter_op_threads": torch.get_num_interop_threads(),
+        "inference_pool_workers": pool_workers,
+        "max_compute_threads": intra_op_threads * max(1, pool_workers)
+    }
+
+class InferenceBatcher:
+    """Async çağıranlardan gelen istekleri kuyrukta toplayıp mikro-batch'ler halinde çalıştırır."""
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        executor: Optional[Executor] = None,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+        max_in_flight: Optional[int] = None
+    ):
+        self.batch_fn = batch_fn
+        self.executor = executor or get_inference_executor()
+        self.max_batch_size = max_batch_size or settings.INFERENCE_MAX_BATCH_SIZE
+        wait_ms = settings.INFERENCE_BATCH_WAIT_MS if max_wait_ms is None else max_wait_ms
+        self.max_wait = wait_ms / 1000
+        # Havuzdaki thread sayısı kadar batch aynı anda çalışabilir
+        self.max_in_flight = max_in_flight or configure_inference_runtime().pool_workers
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._dispatches: set = set()
+
+    def submit(self, item: Any) -> asyncio.Future:
+        """İsteği kuyruğa ekler, sonucu taşıyacak future'ı döner."""
+        self._ensure_started()
+        future = self._loop.create_future()
+        self._queue.put_nowait((item, future))
+        return future
+
+    async def close(self):
+        """Toplayıcıyı durdurur, bekleyen istekleri iptal eder."""
+        if self._collector is None:
+            return
+        self._collector.cancel()
+        try:
+            await self._collector
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        self._collector = None
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._collector is None or self._collector.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._collector = loop.create_task(self._collect())
+
+    async def _collect(self):
+        """Kuyruktan en fazla max_batch_size isteği max_wait süresi içinde toplar."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._slots.acquire()
+            task = self._loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: List[Any]):
+        """Batch'i executor'da çalıştırıp sonuçları future'lara dağıtır."""
+        try:
+            batch = [(item, future) for item, future in batch if not future.cancelled()]
+            if not batch:
+                return
+            try:
+                results = await self._loop.run_in_executor(
+                    self.executor, self.batch_fn, [item for item, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._slots.release()
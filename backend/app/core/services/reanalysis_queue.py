@@ -0,0 +1,116 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from datetime import datetime
+import asyncio
+import contextvars
+import copy
+import logging
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SprintAnalyzer = Callable[[int], Awaitable[Dict[str, Any]]]
+
+class _PendingReanalysis:
+    def __init__(self, sprint_id: int, analyze: SprintAnalyzer, now: float):
+        self.sprint_id = sprint_id
+        self.analyze = analyze
+        self.events = 0
+        self.first_event_at = now
+        self.last_event_at = now
+        self.worker: Optional[asyncio.Task] = None
+
+class SprintReanalysisQueue:
+    """
+    Story DONE olaylarını sprint başına toplayıp, olaylar debounce süresi kadar
+    durulduğunda tek bir arka plan analizi çalıştırır. Son sonuç okuma için saklanır.
+    """
+
+    def __init__(self, debounce_seconds: Optional[float] = None, max_delay_seconds: Optional[float] = None):
+        self.debounce = settings.REANALYSIS_DEBOUNCE_SECONDS if debounce_seconds is None else debounce_seconds
+        # Sürekli olay gelse bile analiz bu süreden fazla ertelenmez
+        self.max_delay = settings.REANALYSIS_MAX_DELAY_SECONDS if max_delay_seconds is None else max_delay_seconds
+        self._pending: Dict[Hashable, _PendingReanalysis] = {}
+        self._results: Dict[Hashable, Dict[str, Any]] = {}
+
+    def schedule(self, sprint_id: int, analyze: SprintAnalyzer, namespace: str = "default"):
+        """Sprint için yeniden analiz ister; hemen döner."""
+        loop = asyncio.get_running_loop()
+        key = (namespace, sprint_id)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingReanalysis(sprint_id, analyze, loop.time())
+        pending.events += 1
+        pending.last_event_at = loop.time()
+        pending.analyze = analyze
+
+        if pending.worker is None or pending.worker.done():
+            # İsteğin contextvar'larını (ör. analiz kapsamı) taşımaması için boş context ile başlatılır
+            pending.worker = loop.create_task(self._run(key, pending), context=contextvars.Context())
+
+    def get_latest(self, sprint_id: int, namespace: str = "default") -> Optional[Dict[str, Any]]:
+        """Sprint için tamamlanmış en son analizi döner."""
+        return self._results.get((namespace, sprint_id))
+
+    def is_pending(self, sprint_id: int, namespace: str = "default") -> bool:
+        return (namespace, sprint_id) in self._pending
+
+    async def drain(self):
+        """Bekleyen tüm analizlerin bitmesini bekler (kapanış ve testler için)."""
+        while self._pending:
+            workers = [p.worker for p in self._pending.values() if p.worker is not None]
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run(self, key: Hashable, pending: _PendingReanalysis):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                # Olaylar durulana kadar (ya da en fazla max_delay) bekle
+                while True:
+                    deadline = min(pending.last_event_at + self.debounce, pending.first_event_at + self.max_delay)
+                    delay = deadline - loop.time()
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+
+                events, pending.events = pending.events, 0
+                pending.first_event_at = loop.time()
+                try:
+                    result = await pending.analyze(pending.sprint_id)
+                except Exception:
+                    logger.exception("Sprint %s yeniden analizi başarısız", pending.sprint_id)
+                else:
+                    self._results[key] = {
+                        "sprint_id": pending.sprint_id,
+                        "result": result,
+                        "coalesced_events": events,
+                        "completed_at": datetime.utcnow()
+                    }
+
+                # Analiz sürerken yeni olay geldiyse bir tur daha
+                if pending.events == 0:
+                    break
+        finally:
+            self._pending.pop(key, None)
+
+def session_scoped_analyzer(use_case: Any, method: str = "analyze_sprint_performance", session_factory=None) -> SprintAnalyzer:
+    """
+    Analizi kendi AsyncSession'ı ve repository'leriyle çalıştıran analyzer döner.
+    Debounce sonrası çalışan analiz istekten uzun yaşar; isteğin session'ı o sırada kapanmış olur.
+    Use case kopyalanır, yalnızca repository'leri değişir (AI ajanı paylaşılır).
+    """
+    async def analyze(sprint_id: int) -> Dict[str, Any]:
+        from app.database.database import AsyncSessionLocal
+        from app.database.repositories import SqlRepositories
+
+        async with (session_factory or AsyncSessionLocal)() as session:
+            detached = copy.copy(use_case)
+            for name, repo in SqlRepositories(session).as_kwargs().items():
+                setattr(detached, name, repo)
+            return await getattr(detached, method)(sprint_id)
+
+    return analyze
+
+reanalysis_queue = SprintReanalysisQueue()
+
+def get_reanalysis_queue() -> SprintReanalysisQueue:
+    return reanalysis_queue
@@ -0,0 +1,190 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set
+import asyncio
+import logging
+import time
+from app.core.config import settings
+from app.core.services.section_cache import SectionCache, Tag, section_key
+
+logger = logging.getLogger(__name__)
+
+SectionBuilder = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+# Girdisi bilinmeyen (anahtarlanamayan) bölüm işareti
+NO_INPUTS = object()
+
+class ReportSection:
+    """
+    Raporun bir bölümü. `build` bağımlı olduğu bölümlerin sonuçlarını alır.
+    internal=True bölümler (ör. birden çok bölümün kullandığı proje sağlığı) rapora yazılmaz,
+    sadece bir kez ve ancak bir bağımlısı ihtiyaç duyarsa hesaplanıp ona verilir.
+    `inputs` bölümün okuduğu verinin kendisidir (önbellek anahtarı buradan ve bağımlılıkların
+    anahtarlarından türetilir); `tags` bölümün hangi veriye bağlı olduğunu kaydeder.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        build: SectionBuilder,
+        depends_on: Sequence[str] = (),
+        timeout: Optional[float] = None,
+        fallback: Any = None,
+        internal: bool = False,
+        inputs: Any = NO_INPUTS,
+        tags: Sequence[Tag] = ()
+    ):
+        self.name = name
+        self.build = build
+        self.depends_on = tuple(depends_on)
+        self.timeout = timeout
+        self.fallback = fallback
+        self.internal = internal
+        self.inputs = inputs
+        self.tags = tuple(tags)
+
+class ReportRun:
+    """Yürütme sonucu: bölüm sonuçları ve bölüm başına durum / süre."""
+
+    def __init__(self, results: Dict[str, Any], sections: Dict[str, Dict[str, Any]]):
+        self.results = results
+        self.sections = sections
+
+    @property
+    def degraded(self) -> bool:
+        return any(info["status"] != "ok" for info in self.sections.values())
+
+class ReportExecutor:
+    """
+    Bölümleri bağımlılık sırasına göre çalıştırır: birbirinden bağımsız bölümler
+    eşzamanlı ilerler, böylece rapor süresi toplam değil en yavaş zincir kadar olur.
+    Hata veren ya da zaman aşımına uğrayan bölüm fallback değerine düşer; ona bağlı
+    bölümler çalıştırılmadan "skipped" olur, rapor yine de döner.
+    Önbellek verilirse girdileri değişmemiş bölümler yeniden hesaplanmaz; önbellekten
+    gelen bölümün bağımlılıkları da hiç çalıştırılmaz.
+    """
+
+    def __init__(
+        self,
+        sections: Sequence[ReportSection],
+        default_timeout: Optional[float] = None,
+        cache: Optional[SectionCache] = None,
+        namespace: str = "report"
+    ):
+        self.sections = {section.name: section for section in sections}
+        if len(self.sections) != len(sections):
+            raise ValueError("Duplicate report section names")
+        self.default_timeout = settings.REPORT_SECTION_TIMEOUT_SECONDS if default_timeout is None else default_timeout
+        self.cache = cache
+        self.namespace = namespace
+        self._check_graph()
+
+    async def run(self) -> ReportRun:
+        statuses: Dict[str, Dict[str, Any]] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        keys, tags = self._cache_keys()
+
+        def start(name: str) -> asyncio.Task:
+            if name not in tasks:
+                tasks[name] = asyncio.ensure_future(resolve(name))
+            return tasks[name]
+
+        async def resolve(name: str) -> Any:
+            section = self.sections[name]
+            key = keys[name]
+            if key is not None:
+                found, value = self.cache.get(key)
+                if found:
+                    statuses[name] = {"status": "ok", "duration_ms": 0.0, "error": None, "cached": True}
+                    return value
+            if section.depends_on:
+                await asyncio.gather(*(start(dep) for dep in section.depends_on))
+            failed = [dep for dep in section.depends_on if statuses[dep]["status"] != "ok"]
+            if failed:
+                statuses[name] = {
+                    "status": "skipped",
+                    "duration_ms": 0.0,
+                    "error": f"depends on failed {', '.join(failed)}",
+                    "cached": False
+                }
+                return section.fallback
+
+            deps = {dep: tasks[dep].result() for dep in section.depends_on}
+            timeout = section.timeout if section.timeout is not None else self.default_timeout
+            started = time.perf_counter()
+            try:
+                value = await asyncio.wait_for(section.build(deps), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Rapor bölümü %s %.1f sn'de bitmedi", name, timeout)
+                statuses[name] = self._status("timeout", started, f"timed out after {timeout}s")
+                return section.fallback
+            except Exception as e:
+                logger.exception("Rapor bölümü %s başarısız", name)
+                statuses[name] = self._status("failed", started, f"{type(e).__name__}: {e}")
+                return section.fallback
+            statuses[name] = self._status("ok", started)
+            if key is not None:
+                self.cache.set(key, value, tags[name])
+            return value
+
+        # Internal bölümler ancak bir bağımlısı önbellekte bulunamazsa başlatılır
+        outputs = [name for name in self._order if not self.sections[name].internal]
+        try:
+            await asyncio.gather(*(start(name) for name in outputs))
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        results = {name: tasks[name].result() for name in outputs}
+        return ReportRun(results, {name: statuses[name] for name in self._order if name in statuses})
+
+    def _cache_keys(self):
+        """
+        Bölüm anahtarı = hash(namespace, ad, girdiler, bağımlılıkların anahtarları); böylece
+        bir girdi değişince yalnızca ondan etkilenen bölüm zinciri yeniden hesaplanır.
+        Girdisi bilinmeyen bölümler (ve onlara bağlı olanlar) önbelleğe alınmaz.
+        """
+        keys: Dict[str, Optional[str]] = {}
+        tags: Dict[str, Set[Tag]] = {}
+        for name in self._order:
+            section = self.sections[name]
+            tags[name] = set(section.tags).union(*(tags[dep] for dep in section.depends_on))
+            dep_keys = [keys[dep] for dep in section.depends_on]
+            if (
+                self.cache is None
+                or None in dep_keys
+                or (section.inputs is NO_INPUTS and not section.depends_on)
+            ):
+                keys[name] = None
+                continue
+            inputs = None if section.inputs is NO_INPUTS else section.inputs
+            keys[name] = section_key(self.namespace, name, inputs, dep_keys)
+        return keys, tags
+
+    def _status(self, status: str, started: float, error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "status": status,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+            "error": error,
+            "cached": False
+        }
+
+    def _check_graph(self):
+        """Bilinmeyen bağımlılık ve döngüleri reddeder, topolojik sırayı hazırlar."""
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Report section cycle: {' -> '.join(path + [name])}")
+            state[name] = "visiting"
+            for dep in self.sections[name].depends_on:
+                if dep not in self.sections:
+                    raise ValueError(f"Report section {name} depends on unknown section {dep}")
+                visit(dep, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.sections:
+            visit(name, [])
+        self._order = order
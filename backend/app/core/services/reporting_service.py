@@ -7,6 +7,32 @@ from app.core.services.deep_learning_ai_service import DeepLearningAIProductOwne
 from app.core.services.business_intelligence_service import BusinessIntelligenceService
 from app.core.services.team_management_service import TeamManagementService
 from app.core.services.project_management_service import ProjectManagementService
+from app.core.services.report_executor import ReportExecutor, ReportSection
+from app.core.services.section_cache import SectionCache, Tag, report_section_cache
+from app.core.services.sprint_metrics import SprintMetricsEngine
+
+# Analizlerin okuduğu proje verisi alanları. Her analiz yalnızca kendi alanlarını alır ve
+# bölüm tam olarak bu alt kümenin hash'iyle anahtarlanır; örn. sadece ekip verisi değişirse
+# sağlık ve pazar bölümleri önbellekten gelir.
+PROJECT_FIELDS = ("id", "name", "status", "start_date", "end_date", "budget", "scope", "milestones")
+SPRINT_FIELDS = ("sprints",)
+TASK_FIELDS = ("tasks",)
+TEAM_FIELDS = ("team", "members")
+MARKET_FIELDS = ("market", "competitors")
+
+def _fields(data: Dict[str, Any], *field_groups: tuple) -> Dict[str, Any]:
+    """Verinin yalnızca verilen alanlarını içeren kopyası (olmayan alanlar eklenmez)."""
+    return {field: data[field] for group in field_groups for field in group if field in data}
+
+def _project_tags(project_data: Dict[str, Any]) -> List[Tag]:
+    return [("project", project_data.get("id"))]
+
+def _sprint_tags(project_data: Dict[str, Any]) -> List[Tag]:
+    return [("sprint", sprint.get("id")) for sprint in project_data.get("sprints") or [] if isinstance(sprint, dict)]
+
+def _team_tags(data: Dict[str, Any]) -> List[Tag]:
+    team = data.get("team")
+    return [("team", team.get("id") if isinstance(team, dict) and "id" in team else data.get("id"))]
 
 class ReportingService:
     """Detaylı raporlama servisi"""
@@ -16,120 +42,149 @@ class ReportingService:
         ai_service: DeepLearningAIProductOwner,
         bi_service: BusinessIntelligenceService,
         team_service: TeamManagementService,
-        project_service: ProjectManagementService
+        project_service: ProjectManagementService,
+        section_cache: Optional[SectionCache] = report_section_cache
     ):
         self.ai_service = ai_service
         self.bi_service = bi_service
         self.team_service = team_service
         self.project_service = project_service
+        # None: her rapor baştan hesaplanır
+        self.section_cache = section_cache
+
+    def invalidate(self, *tags: Tag) -> int:
+        """Veri dışarıdan değiştiğinde (ör. ("team", 3)) yalnızca ona bağlı bölümleri düşürür."""
+        return self.section_cache.invalidate(*tags) if self.section_cache is not None else 0
 
     async def generate_comprehensive_report(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """Kapsamlı proje raporu oluşturur."""
-        # Proje sağlığı
-        health_report = await self._generate_health_report(project_data)
-        
-        # Ekip performansı
-        team_report = await self._generate_team_report(project_data)
-        
-        # İş metrikleri
-        business_report = await self._generate_business_report(project_data)
-        
-        # Risk analizi
-        risk_report = await self._generate_risk_report(project_data)
-        
-        # Öneriler ve iyileştirmeler
-        recommendations = await self._generate_recommendations(project_data)
-        
+        health_input = _fields(project_data, PROJECT_FIELDS, SPRINT_FIELDS)
+        team_input = _fields(project_data, ("id",), TEAM_FIELDS, SPRINT_FIELDS, TASK_FIELDS)
+        market_input = _fields(project_data, PROJECT_FIELDS, MARKET_FIELDS)
+        roi_input = _fields(project_data, PROJECT_FIELDS)
+        # Birden çok bölümün kullandığı analizler bir kez hesaplanır
+        run = await ReportExecutor([
+            ReportSection("health_metrics", lambda _: self.project_service.calculate_project_health(health_input), internal=True,
+                          inputs=health_input, tags=_project_tags(project_data) + _sprint_tags(project_data)),
+            ReportSection("team_performance", lambda _: self.team_service.analyze_team_performance(team_input), internal=True,
+                          inputs=team_input, tags=_team_tags(project_data) + _sprint_tags(project_data)),
+            ReportSection("market_trends", lambda _: self.bi_service.analyze_market_trends(market_input), internal=True,
+                          inputs=market_input, tags=_project_tags(project_data)),
+            # Proje sağlığı
+            ReportSection("health_report", lambda r: self._generate_health_report(r["health_metrics"]),
+                          depends_on=["health_metrics"], fallback={}),
+            # Ekip performansı
+            ReportSection("team_report", lambda r: self._generate_team_report(r["team_performance"]),
+                          depends_on=["team_performance"], fallback={}),
+            # İş metrikleri
+            ReportSection("business_report", lambda r: self._generate_business_report(
+                roi_input, r["market_trends"], r["health_metrics"]
+            ), depends_on=["market_trends", "health_metrics"], fallback={}, inputs=roi_input),
+            # Risk analizi
+            ReportSection("risk_report", lambda r: self._generate_risk_report(r["health_metrics"], r["team_performance"]),
+                          depends_on=["health_metrics", "team_performance"], fallback={}),
+            # Öneriler ve iyileştirmeler
+            ReportSection("recommendations", lambda r: self._generate_recommendations(
+                r["health_metrics"], r["team_performance"], r["market_trends"]
+            ), depends_on=["health_metrics", "team_performance", "market_trends"], fallback=[])
+        ], cache=self.section_cache, namespace="comprehensive").run()
+
         return {
             "report_metadata": {
                 "generated_at": datetime.utcnow().isoformat(),
                 "project_id": project_data.get("id"),
-                "report_type": "comprehensive"
+                "report_type": "comprehensive",
+                "sections": run.sections
             },
-            "health_report": health_report,
-            "team_report": team_report,
-            "business_report": business_report,
-            "risk_report": risk_report,
-            "recommendations": recommendations
+            **run.results
         }
 
     async def generate_sprint_report(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
         """Sprint raporu oluşturur."""
-        # Sprint metrikleri
-        sprint_metrics = await self._calculate_sprint_metrics(sprint_data)
-        
-        # Ekip performansı
-        team_performance = await self._analyze_team_performance(sprint_data)
-        
-        # Kalite metrikleri
-        quality_metrics = await self._analyze_quality_metrics(sprint_data)
-        
-        # Öğrenilen dersler
-        lessons_learned = await self._analyze_lessons_learned(sprint_data)
-        
+        sprint_tags = [("sprint", sprint_data.get("id"))]
+        run = await ReportExecutor([
+            # Sprint metrikleri
+            ReportSection("sprint_metrics", lambda _: self._calculate_sprint_metrics(sprint_data), fallback={},
+                          inputs=sprint_data, tags=sprint_tags),
+            # Ekip performansı
+            ReportSection("team_performance", lambda r: self._analyze_team_performance(r["sprint_metrics"]),
+                          depends_on=["sprint_metrics"], fallback={}, tags=_team_tags(sprint_data)),
+            # Kalite metrikleri
+            ReportSection("quality_metrics", lambda r: self._analyze_quality_metrics(r["sprint_metrics"]),
+                          depends_on=["sprint_metrics"], fallback={}),
+            # Öğrenilen dersler
+            ReportSection("lessons_learned", lambda _: self._analyze_lessons_learned(sprint_data), fallback=[],
+                          inputs=sprint_data, tags=sprint_tags)
+        ], cache=self.section_cache, namespace="sprint").run()
+
         return {
             "report_metadata": {
                 "generated_at": datetime.utcnow().isoformat(),
                 "sprint_id": sprint_data.get("id"),
-                "report_type": "sprint"
+                "report_type": "sprint",
+                "sections": run.sections
             },
-            "sprint_metrics": sprint_metrics,
-            "team_performance": team_performance,
-            "quality_metrics": quality_metrics,
-            "lessons_learned": lessons_learned
+            **run.results
         }
 
     async def generate_team_report(self, team_data: Dict[str, Any]) -> Dict[str, Any]:
         """Ekip raporu oluşturur."""
-        # Performans metrikleri
-        performance = await self.team_service.analyze_team_performance(team_data)
-        
-        # Yetenek analizi
-        skills = await self.team_service.match_skills_to_tasks(team_data, [])
-        
-        # Motivasyon analizi
-        motivation = await self.team_service.analyze_team_motivation(team_data)
-        
-        # Eğitim ihtiyaçları
-        training = await self.team_service.analyze_training_needs(team_data)
-        
+        team_tags = _team_tags(team_data)
+        run = await ReportExecutor([
+            # Performans metrikleri
+            ReportSection("performance_analysis", lambda _: self.team_service.analyze_team_performance(team_data), fallback={},
+                          inputs=team_data, tags=team_tags),
+            # Yetenek analizi
+            ReportSection("skill_analysis", lambda _: self.team_service.match_skills_to_tasks(team_data, []), fallback={},
+                          inputs=team_data, tags=team_tags),
+            # Motivasyon analizi
+            ReportSection("motivation_analysis", lambda _: self.team_service.analyze_team_motivation(team_data), fallback={},
+                          inputs=team_data, tags=team_tags),
+            # Eğitim ihtiyaçları
+            ReportSection("training_analysis", lambda _: self.team_service.analyze_training_needs(team_data), fallback={},
+                          inputs=team_data, tags=team_tags)
+        ], cache=self.section_cache, namespace="team").run()
+
         return {
             "report_metadata": {
                 "generated_at": datetime.utcnow().isoformat(),
                 "team_id": team_data.get("id"),
-                "report_type": "team"
+                "report_type": "team",
+                "sections": run.sections
             },
-            "performance_analysis": performance,
-            "skill_analysis": skills,
-            "motivation_analysis": motivation,
-            "training_analysis": training
+            **run.results
         }
 
     async def generate_business_report(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """İş raporu oluşturur."""
-        # Pazar analizi
-        market_analysis = await self.bi_service.analyze_market_trends(project_data)
-        
-        # ROI analizi
-        roi_analysis = await self.bi_service.calculate_roi(project_data)
-        
-        # Proje sağlığı
-        project_health = await self.bi_service.analyze_project_health(project_data)
-        
+        project_tags = _project_tags(project_data)
+        market_input = _fields(project_data, PROJECT_FIELDS, MARKET_FIELDS)
+        roi_input = _fields(project_data, PROJECT_FIELDS)
+        health_input = _fields(project_data, PROJECT_FIELDS, SPRINT_FIELDS)
+        run = await ReportExecutor([
+            # Pazar analizi
+            ReportSection("market_analysis", lambda _: self.bi_service.analyze_market_trends(market_input), fallback={},
+                          inputs=market_input, tags=project_tags),
+            # ROI analizi
+            ReportSection("roi_analysis", lambda _: self.bi_service.calculate_roi(roi_input), fallback={},
+                          inputs=roi_input, tags=project_tags),
+            # Proje sağlığı
+            ReportSection("project_health", lambda _: self.bi_service.analyze_project_health(health_input), fallback={},
+                          inputs=health_input, tags=project_tags + _sprint_tags(project_data))
+        ], cache=self.section_cache, namespace="business").run()
+
         return {
             "report_metadata": {
                 "generated_at": datetime.utcnow().isoformat(),
                 "project_id": project_data.get("id"),
-                "report_type": "business"
+                "report_type": "business",
+                "sections": run.sections
             },
-            "market_analysis": market_analysis,
-            "roi_analysis": roi_analysis,
-            "project_health": project_health
+            **run.results
         }
 
-    async def _generate_health_report(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _generate_health_report(self, health_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Sağlık raporu oluşturur."""
-        health_metrics = await self.project_service.calculate_project_health(project_data)
         return {
             "metrics": health_metrics["health_metrics"],
             "trends": health_metrics["trend_analysis"],
@@ -137,9 +192,8 @@ class ReportingService:
             "improvements": health_metrics["improvements"]
         }
 
-    async def _generate_team_report(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _generate_team_report(self, team_performance: Dict[str, Any]) -> Dict[str, Any]:
         """Ekip raporu oluşturur."""
-        team_performance = await self.team_service.analyze_team_performance(project_data)
         return {
             "performance": team_performance["performance_metrics"],
             "skills": team_performance["skill_analysis"],
@@ -147,32 +201,36 @@ class ReportingService:
             "improvements": team_performance["improvement_recommendations"]
         }
 
-    async def _generate_business_report(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _generate_business_report(
+        self,
+        project_data: Dict[str, Any],
+        market_trends: Dict[str, Any],
+        health_metrics: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """İş raporu oluşturur."""
-        market_trends = await self.bi_service.analyze_market_trends(project_data)
         roi = await self.bi_service.calculate_roi(project_data)
         return {
             "market_analysis": market_trends,
             "roi_analysis": roi,
-            "recommendations": self._combine_recommendations(market_trends, roi)
+            "project_health": health_metrics["health_metrics"],
+            "recommendations": self._combine_recommendations(market_trends["recommendations"], roi["recommendations"])
         }
 
-    async def _generate_risk_report(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _generate_risk_report(self, health_metrics: Dict[str, Any], team_performance: Dict[str, Any]) -> Dict[str, Any]:
         """Risk raporu oluşturur."""
-        health_metrics = await self.project_service.calculate_project_health(project_data)
-        team_performance = await self.team_service.analyze_team_performance(project_data)
         return {
             "project_risks": health_metrics["risk_assessment"],
             "team_risks": team_performance.get("risk_assessment", []),
             "mitigation_strategies": self._generate_mitigation_strategies(health_metrics, team_performance)
         }
 
-    async def _generate_recommendations(self, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _generate_recommendations(
+        self,
+        health_metrics: Dict[str, Any],
+        team_performance: Dict[str, Any],
+        market_trends: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
         """Öneriler oluşturur."""
-        health_metrics = await self.project_service.calculate_project_health(project_data)
-        team_performance = await self.team_service.analyze_team_performance(project_data)
-        market_trends = await self.bi_service.analyze_market_trends(project_data)
-        
         return self._combine_recommendations(
             health_metrics["improvements"],
             team_performance["improvement_recommendations"],
@@ -180,31 +238,36 @@ class ReportingService:
         )
 
     async def _calculate_sprint_metrics(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Sprint metriklerini hesaplar."""
-        return {
-            "velocity": 0.0,
-            "story_points_completed": 0,
-            "story_points_planned": 0,
-            "completion_rate": 0.0,
-            "quality_metrics": {}
-        }
+        """Sprint metriklerini task verisinden hesaplar."""
+        sprint = sprint_data.get("sprint") or sprint_data
+        engine = SprintMetricsEngine.from_sprint_data(sprint_data)
+        return engine.sprint_metrics(sprint.get("id") if sprint.get("id") is not None else 0)
 
-    async def _analyze_team_performance(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _analyze_team_performance(self, sprint_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Ekip performansını analiz eder."""
         return {
-            "velocity": 0.0,
+            "velocity": sprint_metrics.get("velocity", 0.0),
+            "average_velocity": sprint_metrics.get("average_velocity", 0.0),
+            "workload": sprint_metrics.get("assignee_load", []),
             "quality_score": 0.0,
             "collaboration_score": 0.0,
             "improvement_areas": []
         }
 
-    async def _analyze_quality_metrics(self, sprint_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Kalite metriklerini analiz eder."""
+    async def _analyze_quality_metrics(self, sprint_metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Kalite metriklerini analiz eder. Kod kalitesi, test kapsamı, hata oranı ve teknik borç
+        için veri kaynağı yok (None); teslimat kalitesi task verisinden türetilir.
+        """
+        tasks = sprint_metrics.get("tasks", 0)
         return {
-            "code_quality": 0.0,
-            "test_coverage": 0.0,
-            "bug_rate": 0.0,
-            "technical_debt": 0.0
+            "code_quality": None,
+            "test_coverage": None,
+            "bug_rate": None,
+            "technical_debt": None,
+            "carry_over_rate": round(sprint_metrics.get("carry_over", {}).get("tasks", 0) / tasks, 4) if tasks else 0.0,
+            "scope_change_rate": round(sprint_metrics.get("scope_added", 0) / tasks, 4) if tasks else 0.0,
+            "cycle_time_hours": sprint_metrics.get("cycle_time_hours", {})
         }
 
     async def _analyze_lessons_learned(self, sprint_data: Dict[str, Any]) -> List[Dict[str, Any]]:
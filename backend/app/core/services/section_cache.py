@@ -0,0 +1,109 @@
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+import hashlib
+import time
+import orjson
+from app.core.config import settings
+
+Tag = Tuple[str, Any]
+
+def section_key(*parts: Any) -> str:
+    """Bölüm adı ve girdilerinden anahtar sırasından bağımsız hash üretir."""
+    data = orjson.dumps(parts, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return hashlib.sha1(data).hexdigest()
+
+class SectionCache:
+    """
+    Rapor bölümleri ve dashboard bileşenleri için process içi önbellek.
+    Anahtar, bölümün girdilerinin hash'idir: girdi değişirse anahtar da değişir.
+    Her kayıt bağlı olduğu veriyle etiketlenir (ör. ("team", 3), ("sprint", 7));
+    invalidate yalnızca o veriye bağlı kayıtları düşürür.
+    Değerler kopyalanmadan paylaşılır, okuyanlar değiştirmemelidir.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        self.max_entries = max_entries or settings.REPORT_SECTION_CACHE_MAX_ENTRIES
+        self.ttl = settings.REPORT_SECTION_CACHE_TTL_SECONDS if ttl is None else ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any, Set[Tag]]]" = OrderedDict()
+        self._tagged: Dict[Tag, Set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(bulundu mu, değer) döner."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                self._drop(key)
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[1]
+
+    def set(self, key: str, value: Any, tags: Iterable[Tag] = ()):
+        if key in self._entries:
+            self._drop(key)
+        tags = set(tags)
+        self._entries[key] = (time.monotonic() + self.ttl, value, tags)
+        for tag in tags:
+            self._tagged.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    async def get_or_build(
+        self,
+        name: Hashable,
+        inputs: Any,
+        build: Callable[[], Awaitable[Any]],
+        tags: Iterable[Tag] = ()
+    ) -> Any:
+        """Aynı girdiyle daha önce üretilmiş değeri döner, yoksa üretip saklar."""
+        key = section_key(name, inputs)
+        found, value = self.get(key)
+        if found:
+            return value
+        value = await build()
+        self.set(key, value, tags)
+        return value
+
+    def invalidate(self, *tags: Tag) -> int:
+        """Verilen veriye bağlı kayıtları siler; silinen kayıt sayısını döner."""
+        keys = set()
+        for tag in tags:
+            keys |= self._tagged.get(tag, set())
+        for key in keys:
+            self._drop(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self):
+        self._entries.clear()
+        self._tagged.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None
+        }
+
+    def _drop(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+
+report_section_cache = SectionCache()
+
+def get_section_cache() -> SectionCache:
+    return report_section_cache
@@ -0,0 +1,305 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.task import Task
+from app.models.sprint import Sprint
+
+DONE_STATUSES = ("DONE",)
+IN_PROGRESS_STATUSES = ("IN_PROGRESS", "IN_REVIEW")
+UNASSIGNED = "unassigned"
+
+TASK_COLUMNS = ("id", "sprint_id", "status", "story_points", "assignee", "created_at", "updated_at")
+SPRINT_COLUMNS = ("id", "start_date", "end_date", "status", "velocity")
+
+_HOUR = np.timedelta64(1, "h")
+
+def _datetimes(values: Any) -> pd.Series:
+    """ISO metin, datetime ya da boş değerleri saat dilimsiz UTC zaman damgasına çevirir."""
+    values = pd.Series(values)
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values.astype(object), errors="coerce", utc=True, format="ISO8601")
+    if values.dt.tz is not None:
+        values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    return values.astype("datetime64[ns]")
+
+def _frame(records: Iterable[Dict[str, Any]], columns: Sequence[str]) -> pd.DataFrame:
+    records = [record for record in records if record.get("id") is not None]
+    # Kolon kolon kurulur; satır başına sözlük üretmekten belirgin hızlı
+    return pd.DataFrame({column: [record.get(column) for record in records] for column in columns}, columns=list(columns))
+
+def _unique(frame: pd.DataFrame) -> pd.DataFrame:
+    # Aynı id birden çok kez gelirse son satır geçerlidir
+    return frame[~frame.index.duplicated(keep="last")]
+
+def _task_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    return _unique(pd.DataFrame({
+        "sprint_id": pd.to_numeric(frame["sprint_id"], errors="coerce").to_numpy(),
+        "status": frame["status"].fillna("TODO").astype(str).to_numpy(),
+        "story_points": pd.to_numeric(frame["story_points"], errors="coerce").fillna(0.0).to_numpy(),
+        "assignee": frame["assignee"].to_numpy(dtype=object),
+        "created_at": _datetimes(frame["created_at"]).to_numpy(),
+        "updated_at": _datetimes(frame["updated_at"]).to_numpy()
+    }, index=pd.Index(frame["id"].astype(np.int64), name="id")))
+
+def _sprint_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    return _unique(pd.DataFrame({
+        "start_date": _datetimes(frame["start_date"]).to_numpy(),
+        "end_date": _datetimes(frame["end_date"]).to_numpy(),
+        "status": frame["status"].fillna("").astype(str).to_numpy(),
+        "velocity": pd.to_numeric(frame["velocity"], errors="coerce").to_numpy()
+    }, index=pd.Index(frame["id"].astype(np.int64), name="id")))
+
+def _round(value: Any, digits: int = 2) -> Optional[float]:
+    return None if value is None or pd.isna(value) else round(float(value), digits)
+
+class SprintMetricsEngine:
+    """
+    Task ve sprint tablolarını sütunlu çerçevelerde tutar; velocity, throughput, cycle time,
+    carry-over ve kişi başı yük satır satır dolaşılmadan, vektörel group-by ile hesaplanır.
+    Sprint başına özetler saklanır; apply() yalnızca değişen task'ların sprint'lerini yeniden toplar.
+
+    Motor yalnızca task satırlarını görür: cycle time, DONE task'ın oluşturulmasından son
+    güncellemesine kadar geçen süreyle yaklaşıklanır (sprint API'si bunun yerine task_events'teki
+    durum geçişlerinden ölçüleni döner); bitişi geçmiş sprint'te DONE olmayan task carry-over sayılır.
+    """
+
+    def __init__(self, tasks: Optional[pd.DataFrame] = None, sprints: Optional[pd.DataFrame] = None):
+        self.tasks = _task_frame(tasks if tasks is not None else _frame([], TASK_COLUMNS))
+        self.sprints = _sprint_frame(sprints if sprints is not None else _frame([], SPRINT_COLUMNS))
+        self._stats = self._aggregate(self.tasks)
+
+    @classmethod
+    def from_records(
+        cls,
+        tasks: Iterable[Dict[str, Any]],
+        sprints: Iterable[Dict[str, Any]] = ()
+    ) -> "SprintMetricsEngine":
+        return cls(_frame(tasks, TASK_COLUMNS), _frame(sprints, SPRINT_COLUMNS))
+
+    @classmethod
+    def from_sprint_data(cls, sprint_data: Dict[str, Any]) -> "SprintMetricsEngine":
+        """
+        Rapor girdisinden ({"sprint": {...}, "stories": [...]} ya da düz sprint + "tasks")
+        motor kurar; sprint_id'si olmayan task'lar bu sprint'e sayılır.
+        """
+        sprint = sprint_data.get("sprint") or sprint_data
+        # Henüz kaydedilmemiş sprint 0 id'siyle hesaplanır
+        sprint_id = sprint.get("id") if sprint.get("id") is not None else 0
+        sprint = {**sprint, "id": sprint_id}
+        tasks = [
+            {**task, "sprint_id": task.get("sprint_id", sprint_id)}
+            for task in sprint_data.get("stories") or sprint_data.get("tasks") or []
+        ]
+        sprints = [sprint] + list(sprint_data.get("previous_sprints") or [])
+        return cls.from_records(tasks, [s for s in sprints if isinstance(s, dict)])
+
+    @classmethod
+    def from_team_data(cls, team_data: Dict[str, Any]) -> "SprintMetricsEngine":
+        """
+        Ekip / proje verisinden motor kurar: task'lar üst düzey "tasks" listesinden ya da
+        her sprint'in kendi "tasks" / "stories" listesinden okunur.
+        """
+        sprints = [sprint for sprint in team_data.get("sprints") or [] if isinstance(sprint, dict)]
+        tasks = list(team_data.get("tasks") or [])
+        for sprint in sprints:
+            tasks.extend(
+                {**task, "sprint_id": task.get("sprint_id", sprint.get("id"))}
+                for task in sprint.get("tasks") or sprint.get("stories") or []
+            )
+        return cls.from_records(tasks, sprints)
+
+    @classmethod
+    async def load(cls, session: AsyncSession, sprint_ids: Optional[Sequence[int]] = None) -> "SprintMetricsEngine":
+        """Gerekli kolonları tek sorguyla okur; ORM nesnesi üretilmez."""
+        task_query = select(*(Task.__table__.c[name] for name in TASK_COLUMNS))
+        sprint_query = select(*(Sprint.__table__.c[name] for name in SPRINT_COLUMNS))
+        if sprint_ids is not None:
+            task_query = task_query.where(Task.sprint_id.in_(sprint_ids))
+            sprint_query = sprint_query.where(Sprint.id.in_(sprint_ids))
+        tasks = (await session.execute(task_query)).all()
+        sprints = (await session.execute(sprint_query)).all()
+        return cls(
+            pd.DataFrame.from_records(tasks, columns=list(TASK_COLUMNS)),
+            pd.DataFrame.from_records(sprints, columns=list(SPRINT_COLUMNS))
+        )
+
+    def apply(
+        self,
+        tasks: Iterable[Dict[str, Any]] = (),
+        sprints: Iterable[Dict[str, Any]] = (),
+        deleted_task_ids: Iterable[int] = ()
+    ) -> Set[int]:
+        """
+        Değişen task / sprint satırlarını (tam satır olarak) işler ve yalnızca etkilenen
+        sprint'lerin özetini yeniden hesaplar. Etkilenen sprint id'lerini döner.
+        """
+        changed = _task_frame(_frame(tasks, TASK_COLUMNS))
+        removed = pd.Index(list(deleted_task_ids), dtype=np.int64)
+        touched = changed.index.union(removed)
+        # Task başka sprint'e taşındıysa eski sprint'i de etkilenir
+        affected = set(self.tasks["sprint_id"].reindex(touched).dropna().astype(np.int64))
+        affected |= set(changed["sprint_id"].dropna().astype(np.int64))
+
+        changed_sprints = _sprint_frame(_frame(sprints, SPRINT_COLUMNS))
+        if len(changed_sprints):
+            self.sprints = pd.concat([self.sprints.drop(changed_sprints.index, errors="ignore"), changed_sprints])
+            affected |= set(changed_sprints.index)
+
+        self.tasks = pd.concat([self.tasks.drop(touched, errors="ignore"), changed])
+        if affected:
+            subset = self.tasks[self.tasks["sprint_id"].isin(list(affected))]
+            self._stats = pd.concat([self._stats.drop(list(affected), errors="ignore"), self._aggregate(subset)])
+        return affected
+
+    def _aggregate(self, tasks: pd.DataFrame) -> pd.DataFrame:
+        """Sprint başına özet: tek group-by, satır döngüsü yok."""
+        tasks = tasks[tasks["sprint_id"].notna()]
+        now = np.datetime64(datetime.utcnow())
+        points = tasks["story_points"].to_numpy()
+        done = tasks["status"].isin(DONE_STATUSES).to_numpy()
+        sprint_ids = tasks["sprint_id"].astype(np.int64)
+        end_dates = self.sprints["end_date"].reindex(sprint_ids.to_numpy()).to_numpy()
+        start_dates = self.sprints["start_date"].reindex(sprint_ids.to_numpy()).to_numpy()
+        carried = ~done & (end_dates <= now)
+        cycle_hours = np.where(done, (tasks["updated_at"] - tasks["created_at"]).to_numpy() / _HOUR, np.nan)
+
+        frame = pd.DataFrame({
+            "sprint_id": sprint_ids.to_numpy(),
+            "points": points,
+            "done": done,
+            "done_points": np.where(done, points, 0.0),
+            "carried": carried,
+            "carried_points": np.where(carried, points, 0.0),
+            # Sprint başladıktan sonra eklenen iş (kapsam değişikliği)
+            "added": tasks["created_at"].to_numpy() > start_dates,
+            "cycle_hours": cycle_hours
+        })
+        grouped = frame.groupby("sprint_id")
+        stats = grouped.agg(
+            tasks=("points", "size"),
+            planned_points=("points", "sum"),
+            completed_points=("done_points", "sum"),
+            throughput=("done", "sum"),
+            carry_over=("carried", "sum"),
+            carry_over_points=("carried_points", "sum"),
+            added=("added", "sum"),
+            cycle_time_mean_hours=("cycle_hours", "mean"),
+            cycle_time_median_hours=("cycle_hours", "median")
+        )
+        stats["cycle_time_p85_hours"] = grouped["cycle_hours"].quantile(0.85)
+        return stats
+
+    def sprint_stats(self) -> pd.DataFrame:
+        """Tüm sprint'lerin özeti; sprint tablosundaki tarih ve kayıtlı velocity ile birlikte."""
+        return self.sprints.join(self._stats, how="outer")
+
+    def velocity_history(self, until: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Bitmiş sprint'lerin (until verilirse o sprint dahil, ondan öncekilerin) başlangıç sırasına
+        göre tamamlanan puanları. Task'ı yüklenmemiş sprint'ler için sprint tablosundaki velocity kullanılır.
+        """
+        stats = self.sprint_stats()
+        ended = (stats["end_date"] <= np.datetime64(datetime.utcnow())) | stats["status"].isin(("COMPLETED", "CLOSED"))
+        if until is not None and until in stats.index:
+            ended = (ended & (stats["start_date"] < stats.at[until, "start_date"])) | (stats.index == until)
+        stats = stats[ended.to_numpy()].sort_values("start_date")
+        velocity = stats["completed_points"].fillna(stats["velocity"]).fillna(0.0)
+        return [
+            {"sprint_id": int(sprint_id), "date": start.isoformat() if not pd.isna(start) else "", "velocity": float(value)}
+            for sprint_id, start, value in zip(stats.index, stats["start_date"], velocity)
+        ]
+
+    def velocity(self, window: int = 3, until: Optional[int] = None) -> Dict[str, Any]:
+        history = self.velocity_history(until)
+        values = np.array([point["velocity"] for point in history], dtype=np.float64)
+        recent = values[-window:]
+        return {
+            "average": _round(recent.mean()) if len(recent) else 0.0,
+            "last": _round(values[-1]) if len(values) else 0.0,
+            "stdev": _round(recent.std()) if len(recent) else 0.0,
+            "history": history
+        }
+
+    def assignee_load(self, sprint_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Kişi başı açık / devam eden / tamamlanan iş; atanmamış task'lar tek grupta toplanır."""
+        tasks = self.tasks if sprint_id is None else self.tasks[self.tasks["sprint_id"] == sprint_id]
+        if tasks.empty:
+            return []
+        done = tasks["status"].isin(DONE_STATUSES).to_numpy()
+        in_progress = tasks["status"].isin(IN_PROGRESS_STATUSES).to_numpy()
+        points = tasks["story_points"].to_numpy()
+        load = pd.DataFrame({
+            "assignee": tasks["assignee"].fillna(UNASSIGNED).to_numpy(),
+            "open": ~done,
+            "open_points": np.where(done, 0.0, points),
+            "in_progress": in_progress,
+            "done_points": np.where(done, points, 0.0)
+        }).groupby("assignee").agg(
+            open_tasks=("open", "sum"),
+            open_points=("open_points", "sum"),
+            in_progress=("in_progress", "sum"),
+            completed_points=("done_points", "sum")
+        ).sort_values("open_points", ascending=False)
+        return [
+            {
+                "assignee": assignee,
+                "open_tasks": int(row.open_tasks),
+                "open_points": float(row.open_points),
+                "in_progress": int(row.in_progress),
+                "completed_points": float(row.completed_points)
+            }
+            for assignee, row in zip(load.index, load.itertuples(index=False))
+        ]
+
+    def sprint_metrics(self, sprint_id: int) -> Dict[str, Any]:
+        """Tek sprint'in metrikleri (raporlardaki sprint_metrics bölümü)."""
+        stats = self._stats.loc[sprint_id] if sprint_id in self._stats.index else None
+        planned = float(stats["planned_points"]) if stats is not None else 0.0
+        completed = float(stats["completed_points"]) if stats is not None else 0.0
+        velocity = self.velocity(until=sprint_id)
+        return {
+            "velocity": completed,
+            "average_velocity": velocity["average"],
+            "velocity_history": velocity["history"],
+            "story_points_completed": completed,
+            "story_points_planned": planned,
+            "completion_rate": _round(completed / planned, 4) if planned else 0.0,
+            "throughput": int(stats["throughput"]) if stats is not None else 0,
+            "tasks": int(stats["tasks"]) if stats is not None else 0,
+            "carry_over": {
+                "tasks": int(stats["carry_over"]) if stats is not None else 0,
+                "points": float(stats["carry_over_points"]) if stats is not None else 0.0
+            },
+            "scope_added": int(stats["added"]) if stats is not None else 0,
+            "cycle_time_hours": {
+                "mean": _round(stats["cycle_time_mean_hours"]) if stats is not None else None,
+                "median": _round(stats["cycle_time_median_hours"]) if stats is not None else None,
+                "p85": _round(stats["cycle_time_p85_hours"]) if stats is not None else None
+            },
+            "assignee_load": self.assignee_load(sprint_id)
+        }
+
+    def team_metrics(self, window: int = 3) -> Dict[str, Any]:
+        """Tüm yüklü sprint'ler üzerinden ekip metrikleri."""
+        stats = self._stats
+        planned = float(stats["planned_points"].sum())
+        done = self.tasks["status"].isin(DONE_STATUSES).to_numpy()
+        cycle_hours = (self.tasks["updated_at"] - self.tasks["created_at"]).to_numpy()[done] / _HOUR
+        cycle_hours = cycle_hours[~np.isnan(cycle_hours)]
+        velocity = self.velocity(window)
+        return {
+            "velocity": velocity["average"],
+            "velocity_stdev": velocity["stdev"],
+            "throughput": int(done.sum()),
+            "completion_rate": _round(stats["completed_points"].sum() / planned, 4) if planned else 0.0,
+            "carry_over_rate": _round(stats["carry_over"].sum() / stats["tasks"].sum(), 4) if len(stats) else 0.0,
+            "cycle_time_hours": {
+                "mean": _round(cycle_hours.mean()) if len(cycle_hours) else None,
+                "median": _round(np.median(cycle_hours)) if len(cycle_hours) else None,
+                "p85": _round(np.percentile(cycle_hours, 85)) if len(cycle_hours) else None
+            },
+            "assignee_load": self.assignee_load()
+        }
@@ -0,0 +1,227 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+from datetime import datetime
+import asyncio
+import contextvars
+import logging
+import os
+import re
+import threading
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sqlalchemy import func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.services.sprint_metrics import DONE_STATUSES
+from app.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+STORY_POINT_SCALE = np.array([1, 2, 3, 5, 8, 13, 21])
+PRIORITY_RANKS = {"LOW": 0, "MEDIUM": 1, "HIGH": 2, "CRITICAL": 3}
+# Karmaşıklık işaretleri; her grup için metindeki eşleşme sayısı bir özelliktir
+KEYWORD_GROUPS = {
+    "integration": ("api", "entegrasyon", "integration", "webhook", "servis", "service", "third-party"),
+    "data": ("veritabanı", "database", "migration", "rapor", "report", "export", "import", "sql"),
+    "security": ("güvenlik", "security", "auth", "yetki", "permission", "şifre", "password", "token"),
+    "interface": ("ekran", "sayfa", "page", "screen", "form", "ui", "dashboard", "grafik", "chart"),
+    "quality": ("test", "performans", "performance", "refactor", "cache", "ölçek", "scale")
+}
+# Özellik vektörü değişirse eski modeller yüklenmez, yeniden eğitilir
+FEATURE_VERSION = 1
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+def story_features(stories: Sequence[Mapping[str, Any]]) -> np.ndarray:
+    """Story başına metin ve meta veriden sayısal özellik matrisi (story x özellik)."""
+    rows = []
+    for story in stories:
+        words = _WORD.findall(f"{story.get('title') or ''} {story.get('description') or ''}".lower())
+        vocabulary = set(words)
+        criteria = story.get("acceptance_criteria") or []
+        rows.append([
+            len(words),
+            len(vocabulary),
+            len(criteria) if isinstance(criteria, (list, tuple)) else 1,
+            PRIORITY_RANKS.get(str(story.get("priority") or "MEDIUM").upper(), 1),
+            *(sum(word in vocabulary for word in keywords) for keywords in KEYWORD_GROUPS.values())
+        ])
+    return np.asarray(rows, dtype=np.float64).reshape(len(rows), 4 + len(KEYWORD_GROUPS))
+
+def snap_to_scale(values: np.ndarray) -> np.ndarray:
+    """Tahminleri en yakın story point değerine yuvarlar."""
+    return STORY_POINT_SCALE[np.abs(np.asarray(values)[:, None] - STORY_POINT_SCALE).argmin(axis=1)]
+
+def training_jobs() -> int:
+    """Eğitimin kullandığı çekirdek sayısı: TORCH_INTRA_OP_THREADS ya da process başına CPU payı."""
+    return settings.TORCH_INTRA_OP_THREADS or max(1, (os.cpu_count() or 1) // max(1, settings.WEB_CONCURRENCY))
+
+class StoryPointPredictor:
+    """
+    Tamamlanmış story'lerin puanlarından eğitilen tahmin modelinin yaşam döngüsü.
+    Eğitim istek yolunda yapılmaz: refresh() arka planda, yeterince yeni örnek birikmişse
+    modeli eğitip diske yazar; predict() diskteki son modeli yükleyip tek çağrıda tüm story'leri tahmin eder.
+    Başka bir process modeli yeniden eğittiğinde dosya değişir ve sonraki predict() onu yükler.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        min_training_samples: Optional[int] = None,
+        refit_min_samples: Optional[int] = None
+    ):
+        self.path = path or settings.STORY_POINT_MODEL_PATH
+        self.min_training_samples = min_training_samples or settings.STORY_POINT_MIN_TRAINING_SAMPLES
+        self.refit_min_samples = refit_min_samples or settings.STORY_POINT_REFIT_MIN_SAMPLES
+        self.model: Optional[RandomForestRegressor] = None
+        self.trained_samples = 0
+        self.trained_at: Optional[datetime] = None
+        self._loaded_mtime: Optional[float] = None
+        self._load_lock = threading.Lock()
+        self._completed_since_check = 0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def info(self) -> Dict[str, Any]:
+        self._ensure_loaded()
+        return {
+            "fitted": self.model is not None,
+            "trained_samples": self.trained_samples,
+            "trained_at": self.trained_at.isoformat() if self.trained_at else None,
+            "path": self.path
+        }
+
+    def _ensure_loaded(self):
+        """Dosya son yüklemeden sonra değiştiyse modeli yeniden yükler; değişmediyse yalnızca stat."""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        with self._load_lock:
+            if mtime == self._loaded_mtime:
+                return
+            try:
+                state = joblib.load(self.path)
+            except Exception:
+                logger.exception("Story point modeli yüklenemedi: %s", self.path)
+                self._loaded_mtime = mtime
+                return
+            self._loaded_mtime = mtime
+            if state.get("feature_version") != FEATURE_VERSION:
+                logger.warning("Story point modeli eski özellik sürümüyle eğitilmiş, yeniden eğitilecek")
+                return
+            self.model = state["model"]
+            self.trained_samples = state["samples"]
+            self.trained_at = state["trained_at"]
+
+    def predict(self, stories: Sequence[Mapping[str, Any]]) -> List[Optional[int]]:
+        """Story'lerin puanlarını tek predict çağrısıyla tahmin eder; model yoksa None döner."""
+        self._ensure_loaded()
+        if self.model is None or not stories:
+            return [None] * len(stories)
+        return snap_to_scale(self.model.predict(story_features(stories))).tolist()
+
+    def needs_refit(self, sample_count: int, new_samples: int) -> bool:
+        """
+        sample_count tüm tamamlanmış story'ler, new_samples son eğitimden sonra tamamlanan ya da
+        değişenlerdir; silinen ve eklenen örnekler birbirini götürmesin diye fark değil bu sayı kullanılır.
+        """
+        if sample_count < self.min_training_samples:
+            return False
+        if self.model is None:
+            return True
+        return new_samples >= self.refit_min_samples
+
+    def fit(
+        self,
+        stories: Sequence[Mapping[str, Any]],
+        sample_count: Optional[int] = None,
+        trained_at: Optional[datetime] = None
+    ):
+        """
+        Modeli eğitir ve atomik olarak diske yazar (yarım dosya okunmaz). trained_at örneklerin
+        okunduğu an olmalıdır; eğitim sürerken tamamlananlar sonraki yenilemede yeni sayılır.
+        """
+        # API process'inde de çalışır: çekirdek payı inference ayarlarıyla sınırlanır
+        model = RandomForestRegressor(n_estimators=200, min_samples_leaf=2, n_jobs=training_jobs(), random_state=0)
+        model.fit(story_features(stories), np.asarray([story["story_points"] for story in stories], dtype=np.float64))
+        # Eğitim paralel; tahmin çağrıları küçük batch'ler, thread havuzu kurmanın maliyeti kazançtan büyük
+        model.set_params(n_jobs=1)
+        state = {
+            "model": model,
+            "samples": len(stories) if sample_count is None else sample_count,
+            "trained_at": trained_at or datetime.utcnow(),
+            "feature_version": FEATURE_VERSION
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        joblib.dump(state, tmp_path)
+        os.replace(tmp_path, self.path)
+        with self._load_lock:
+            self.model = model
+            self.trained_samples = state["samples"]
+            self.trained_at = state["trained_at"]
+            self._loaded_mtime = os.stat(self.path).st_mtime
+
+    async def refresh(self, session: AsyncSession, force: bool = False) -> bool:
+        """
+        Son eğitimden beri yeterince story tamamlandıysa ya da değiştiyse (ya da force) modeli
+        geçmişle yeniden eğitir. Eğitim thread'de çalışır, event loop'u bloklamaz.
+        """
+        self._ensure_loaded()
+        as_of = datetime.utcnow()
+        completed = (Task.status.in_(DONE_STATUSES), Task.story_points.isnot(None))
+        new_since_fit = Task.updated_at > self.trained_at if self.trained_at is not None else true()
+        sample_count, new_samples = (await session.execute(
+            select(func.count(), func.count().filter(new_since_fit)).select_from(Task).where(*completed)
+        )).one()
+        if not (self.needs_refit(sample_count, new_samples) or (force and sample_count >= self.min_training_samples)):
+            return False
+
+        rows = (await session.execute(
+            select(Task.title, Task.description, Task.priority, Task.acceptance_criteria, Task.story_points)
+            .where(*completed)
+            .order_by(Task.updated_at.desc())
+            .limit(settings.STORY_POINT_MAX_TRAINING_SAMPLES)
+        )).mappings().all()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.fit, [dict(row) for row in rows], sample_count, as_of)
+        logger.info("Story point modeli %s örnekle yeniden eğitildi", sample_count)
+        return True
+
+    def note_completed(self, count: int = 1):
+        """
+        Story DONE olaylarını sayar (task yazma yolu commit'te çağırır); her
+        STORY_POINT_REFIT_CHECK_EVERY olayda bir arka planda refresh() başlatır. Hemen döner.
+        """
+        self._completed_since_check += count
+        if self._completed_since_check < settings.STORY_POINT_REFIT_CHECK_EVERY:
+            return
+        if self.schedule_refresh():
+            self._completed_since_check = 0
+
+    def schedule_refresh(self) -> bool:
+        """refresh()'i arka planda başlatır (ör. uygulama açılışında); süren yenileme varsa False."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return False
+        # İsteğin contextvar'larını taşımaması için boş context ile başlatılır
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_in_background(), context=contextvars.Context()
+        )
+        return True
+
+    async def _refresh_in_background(self):
+        from app.database.database import AsyncSessionLocal
+        try:
+            async with AsyncSessionLocal() as session:
+                await self.refresh(session)
+        except Exception:
+            logger.exception("Story point modeli yeniden eğitilemedi")
+
+story_point_predictor = StoryPointPredictor()
+
+def get_story_point_predictor() -> StoryPointPredictor:
+    return story_point_predictor
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from sklearn.preprocessing import StandardScaler
 from sklearn.cluster import KMeans
 from app.core.services.deep_learning_ai_service import DeepLearningAIProductOwner
+from app.core.services.sprint_metrics import SprintMetricsEngine
 
 class TeamManagementService:
     """Ekip yönetimi servisi"""
@@ -94,9 +95,9 @@ class TeamManagementService:
         }
 
     def _calculate_performance_metrics(self, team_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Performans metriklerini hesaplar."""
+        """Performans metriklerini ekibin sprint ve task verisinden hesaplar."""
         return {
-            "velocity": 0.0,
+            **SprintMetricsEngine.from_team_data(team_data).team_metrics(),
             "quality_score": 0.0,
             "collaboration_score": 0.0,
             "innovation_score": 0.0
@@ -1,31 +1,44 @@
-from typing import List, Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
 import plotly.express as px
+from orjson import Fragment
 from datetime import datetime, timedelta
 import json
+from app.core.config import settings
 from app.core.services.reporting_service import ReportingService
+from app.utils.figures import bar, encode_figure, figure, heatmap, indicator, scatter, scatterpolar, timeseries
 
 class VisualizationService:
     """Görselleştirme servisi"""
 
-    def __init__(self, reporting_service: ReportingService):
+    # Zaman serisi grafiklerinin nokta bütçeleri (None: azaltma yok); yoksa CHART_MAX_POINTS
+    DEFAULT_POINT_BUDGETS: Dict[str, Optional[int]] = {
+        "trend_line": 500,
+        "velocity_chart": 500,
+        "improvement_timeline": 1000
+    }
+
+    def __init__(self, reporting_service: ReportingService, point_budgets: Optional[Dict[str, Optional[int]]] = None):
         self.reporting_service = reporting_service
         self.color_palette = px.colors.qualitative.Set3
+        self.point_budgets = {**self.DEFAULT_POINT_BUDGETS, **(point_budgets or {})}
+
+    def _point_budget(self, chart: str) -> Optional[int]:
+        return self.point_budgets.get(chart, settings.CHART_MAX_POINTS)
 
     async def create_dashboard(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
         """Proje dashboard'u oluşturur."""
         # Kapsamlı rapor al
         report = await self.reporting_service.generate_comprehensive_report(project_data)
         
-        # Dashboard bileşenleri
+        # Dashboard bileşenleri; bölümü değişmemiş bileşen yeniden çizilmez
         components = {
-            "project_health": await self._create_health_dashboard(report["health_report"]),
-            "team_performance": await self._create_team_dashboard(report["team_report"]),
-            "business_metrics": await self._create_business_dashboard(report["business_report"]),
-            "risk_analysis": await self._create_risk_dashboard(report["risk_report"]),
-            "recommendations": await self._create_recommendations_dashboard(report["recommendations"])
+            "project_health": await self._component("project_health", report["health_report"], self._create_health_dashboard),
+            "team_performance": await self._component("team_performance", report["team_report"], self._create_team_dashboard),
+            "business_metrics": await self._component("business_metrics", report["business_report"], self._create_business_dashboard),
+            "risk_analysis": await self._component("risk_analysis", report["risk_report"], self._create_risk_dashboard),
+            "recommendations": await self._component("recommendations", report["recommendations"], self._create_recommendations_dashboard)
         }
         
         return {
@@ -44,10 +57,10 @@ class VisualizationService:
         
         # Görselleştirmeler
         visualizations = {
-            "velocity_chart": await self._create_velocity_chart(report["sprint_metrics"]),
-            "quality_metrics": await self._create_quality_metrics_chart(report["quality_metrics"]),
-            "team_performance": await self._create_team_performance_chart(report["team_performance"]),
-            "lessons_learned": await self._create_lessons_learned_chart(report["lessons_learned"])
+            "velocity_chart": await self._component("velocity_chart", report["sprint_metrics"], self._create_velocity_chart),
+            "quality_metrics": await self._component("quality_metrics", report["quality_metrics"], self._create_quality_metrics_chart),
+            "team_performance": await self._component("team_performance", report["team_performance"], self._create_team_performance_chart),
+            "lessons_learned": await self._component("lessons_learned", report["lessons_learned"], self._create_lessons_learned_chart)
         }
         
         return {
@@ -59,6 +72,13 @@ class VisualizationService:
             "visualizations": visualizations
         }
 
+    async def _component(self, name: str, section: Any, create: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Bileşeni, çizdiği rapor bölümünün içeriğiyle anahtarlanmış önbellekten döner."""
+        cache = self.reporting_service.section_cache
+        if cache is None:
+            return await create(section)
+        return await cache.get_or_build(("component", name), section, lambda: create(section))
+
     async def _create_health_dashboard(self, health_report: Dict[str, Any]) -> Dict[str, Any]:
         """Sağlık dashboard'u oluşturur."""
         metrics = health_report["metrics"]
@@ -103,159 +123,195 @@ class VisualizationService:
             "mitigation_strategies": self._create_mitigation_chart(risk_report["mitigation_strategies"])
         }
 
-    def _create_radar_chart(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _create_recommendations_dashboard(self, recommendations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Öneriler dashboard'u oluşturur."""
+        return {
+            "recommendations_chart": self._create_recommendations_chart(recommendations)
+        }
+
+    def _create_radar_chart(self, data: Dict[str, Any]) -> Fragment:
         """Radar chart oluşturur."""
-        fig = go.Figure()
-        fig.add_trace(go.Scatterpolar(
-            r=list(data.values()),
-            theta=list(data.keys()),
-            fill='toself',
-            name='Metrics'
+        return encode_figure(figure(
+            scatterpolar(list(data.values()), list(data.keys()), fill='toself', name='Metrics')
         ))
-        return fig.to_json()
 
-    def _create_trend_line(self, trends: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_trend_line(self, trends: Dict[str, Any]) -> Fragment:
         """Trend çizgisi oluşturur."""
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=list(trends.keys()),
-            y=list(trends.values()),
-            mode='lines+markers',
-            name='Trend'
+        return encode_figure(figure(
+            timeseries(
+                list(trends.keys()),
+                list(trends.values()),
+                max_points=self._point_budget("trend_line"),
+                mode='lines+markers',
+                name='Trend'
+            )
         ))
-        return fig.to_json()
 
-    def _create_risk_heatmap(self, risks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_risk_heatmap(self, risks: List[Dict[str, Any]]) -> Fragment:
         """Risk ısı haritası oluşturur."""
-        fig = go.Figure(data=go.Heatmap(
-            z=[[risk.get("probability", 0), risk.get("impact", 0)] for risk in risks],
-            colorscale='Reds'
+        return encode_figure(figure(
+            heatmap([[risk.get("probability", 0), risk.get("impact", 0)] for risk in risks], colorscale='Reds')
         ))
-        return fig.to_json()
 
-    def _create_improvement_gauge(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_improvement_gauge(self, metrics: Dict[str, Any]) -> Fragment:
         """İyileştirme göstergesi oluşturur."""
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=metrics.get("overall_health", 0),
-            title={'text': "Overall Health"},
-            gauge={'axis': {'range': [0, 100]}}
+        return encode_figure(figure(
+            indicator(
+                metrics.get("overall_health", 0),
+                mode="gauge+number",
+                title={'text': "Overall Health"},
+                gauge={'axis': {'range': [0, 100]}}
+            )
         ))
-        return fig.to_json()
 
-    def _create_skill_matrix(self, skills: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_skill_matrix(self, skills: Dict[str, Any]) -> Fragment:
         """Yetenek matrisi oluşturur."""
-        fig = go.Figure(data=go.Heatmap(
-            z=[[skill.get("level", 0) for skill in skills.values()]],
-            colorscale='Viridis'
+        # Kategoriler seviye sözlüğü ya da (skill_gaps gibi) liste olabilir; seviyesi olmayan 0 çizilir
+        return encode_figure(figure(
+            heatmap(
+                [[skill.get("level", 0) if isinstance(skill, dict) else 0 for skill in skills.values()]],
+                x=list(skills.keys()),
+                colorscale='Viridis'
+            )
         ))
-        return fig.to_json()
 
-    def _create_motivation_chart(self, motivation: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_motivation_chart(self, motivation: Dict[str, Any]) -> Fragment:
         """Motivasyon grafiği oluşturur."""
-        fig = go.Figure(data=[
-            go.Bar(
-                x=list(motivation.keys()),
-                y=list(motivation.values()),
-                marker_color=self.color_palette
-            )
-        ])
-        return fig.to_json()
+        return encode_figure(figure(
+            bar(list(motivation.keys()), list(motivation.values()), marker={'color': self.color_palette})
+        ))
 
-    def _create_improvement_timeline(self, improvements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_improvement_timeline(self, improvements: List[Dict[str, Any]]) -> Fragment:
         """İyileştirme zaman çizelgesi oluşturur."""
-        fig = go.Figure(data=[
-            go.Scatter(
-                x=[imp.get("date", "") for imp in improvements],
-                y=[imp.get("impact", 0) for imp in improvements],
+        return encode_figure(figure(
+            timeseries(
+                [imp.get("date", "") for imp in improvements],
+                [imp.get("impact", 0) for imp in improvements],
+                max_points=self._point_budget("improvement_timeline"),
+                # Etki sıçramaları ortalamada kaybolmasın
+                method='minmax',
                 mode='lines+markers',
                 name='Improvements'
             )
-        ])
-        return fig.to_json()
+        ))
+
+    async def _create_velocity_chart(self, sprint_metrics: Dict[str, Any]) -> Fragment:
+        """Velocity geçmişi grafiği oluşturur."""
+        history = sprint_metrics.get("velocity_history", [])
+        return encode_figure(figure(
+            timeseries(
+                [point.get("date", "") for point in history],
+                [point.get("velocity", 0) for point in history],
+                max_points=self._point_budget("velocity_chart"),
+                mode='lines+markers',
+                name='Velocity'
+            )
+        ))
+
+    async def _create_quality_metrics_chart(self, quality_metrics: Dict[str, Any]) -> Fragment:
+        """Kalite metrikleri grafiği oluşturur; verisi olmayan (None) metrikler çizilmez."""
+        rates = {
+            name: value for name, value in quality_metrics.items()
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        return encode_figure(figure(
+            bar(list(rates.keys()), list(rates.values()), marker={'color': self.color_palette})
+        ))
+
+    async def _create_team_performance_chart(self, team_performance: Dict[str, Any]) -> Fragment:
+        """Kişi başı açık ve tamamlanan puan grafiği oluşturur."""
+        workload = team_performance.get("workload", [])
+        assignees = [load.get("assignee", "") for load in workload]
+        return encode_figure(figure(
+            bar(assignees, [load.get("completed_points", 0) for load in workload], name='Completed'),
+            bar(assignees, [load.get("open_points", 0) for load in workload], name='Open'),
+            layout={'barmode': 'stack'}
+        ))
+
+    async def _create_lessons_learned_chart(self, lessons: List[Dict[str, Any]]) -> Fragment:
+        """Öğrenilen dersler grafiği oluşturur."""
+        return encode_figure(figure(
+            bar(
+                [lesson.get("category", "") for lesson in lessons],
+                [lesson.get("impact", 0) for lesson in lessons],
+                marker={'color': self.color_palette}
+            )
+        ))
 
-    def _create_market_trends_chart(self, market: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_market_trends_chart(self, market: Dict[str, Any]) -> Fragment:
         """Pazar trendleri grafiği oluşturur."""
-        fig = go.Figure()
-        for trend in market.get("trends", []):
-            fig.add_trace(go.Scatter(
-                x=trend.get("dates", []),
-                y=trend.get("values", []),
-                name=trend.get("name", "")
-            ))
-        return fig.to_json()
+        return encode_figure(figure(*[
+            scatter(trend.get("dates", []), trend.get("values", []), name=trend.get("name", ""))
+            for trend in market.get("trends", [])
+        ]))
 
-    def _create_roi_chart(self, roi: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_roi_chart(self, roi: Dict[str, Any]) -> Fragment:
         """ROI grafiği oluşturur."""
-        fig = go.Figure(data=[
-            go.Bar(
-                x=["ROI", "Payback Period", "NPV", "IRR"],
-                y=[
+        return encode_figure(figure(
+            bar(
+                ["ROI", "Payback Period", "NPV", "IRR"],
+                [
                     roi.get("roi", 0),
                     roi.get("payback_period", 0),
                     roi.get("npv", 0),
                     roi.get("irr", 0)
                 ],
-                marker_color=self.color_palette
+                marker={'color': self.color_palette}
             )
-        ])
-        return fig.to_json()
+        ))
 
-    def _create_project_health_chart(self, health: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_project_health_chart(self, health: Dict[str, Any]) -> Fragment:
         """Proje sağlığı grafiği oluşturur."""
-        fig = go.Figure(data=[
-            go.Indicator(
+        return encode_figure(figure(
+            indicator(
+                health.get("overall_health", 0),
                 mode="gauge+number",
-                value=health.get("overall_health", 0),
                 title={'text': "Project Health"},
                 gauge={'axis': {'range': [0, 100]}}
             )
-        ])
-        return fig.to_json()
+        ))
 
-    def _create_recommendations_chart(self, recommendations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_recommendations_chart(self, recommendations: List[Dict[str, Any]]) -> Fragment:
         """Öneriler grafiği oluşturur."""
-        fig = go.Figure(data=[
-            go.Bar(
-                x=[rec.get("category", "") for rec in recommendations],
-                y=[rec.get("impact", 0) for rec in recommendations],
-                marker_color=self.color_palette
+        return encode_figure(figure(
+            bar(
+                [rec.get("category", "") for rec in recommendations],
+                [rec.get("impact", 0) for rec in recommendations],
+                marker={'color': self.color_palette}
             )
-        ])
-        return fig.to_json()
+        ))
 
-    def _create_risk_matrix(self, risks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_risk_matrix(self, risks: List[Dict[str, Any]]) -> Fragment:
         """Risk matrisi oluşturur."""
-        fig = go.Figure(data=go.Scatter(
-            x=[risk.get("probability", 0) for risk in risks],
-            y=[risk.get("impact", 0) for risk in risks],
-            mode='markers',
-            marker=dict(
-                size=[risk.get("severity", 1) * 10 for risk in risks],
-                color=[risk.get("severity", 1) for risk in risks],
-                colorscale='Reds'
+        return encode_figure(figure(
+            scatter(
+                [risk.get("probability", 0) for risk in risks],
+                [risk.get("impact", 0) for risk in risks],
+                mode='markers',
+                marker={
+                    'size': [risk.get("severity", 1) * 10 for risk in risks],
+                    'color': [risk.get("severity", 1) for risk in risks],
+                    'colorscale': 'Reds'
+                }
             )
         ))
-        return fig.to_json()
 
-    def _create_team_risk_chart(self, risks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_team_risk_chart(self, risks: List[Dict[str, Any]]) -> Fragment:
         """Ekip risk grafiği oluşturur."""
-        fig = go.Figure(data=[
-            go.Bar(
-                x=[risk.get("category", "") for risk in risks],
-                y=[risk.get("severity", 0) for risk in risks],
-                marker_color=self.color_palette
+        return encode_figure(figure(
+            bar(
+                [risk.get("category", "") for risk in risks],
+                [risk.get("severity", 0) for risk in risks],
+                marker={'color': self.color_palette}
             )
-        ])
-        return fig.to_json()
+        ))
 
-    def _create_mitigation_chart(self, strategies: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_mitigation_chart(self, strategies: List[Dict[str, Any]]) -> Fragment:
         """Risk azaltma stratejileri grafiği oluşturur."""
-        fig = go.Figure(data=[
-            go.Bar(
-                x=[strategy.get("category", "") for strategy in strategies],
-                y=[strategy.get("effectiveness", 0) for strategy in strategies],
-                marker_color=self.color_palette
+        return encode_figure(figure(
+            bar(
+                [strategy.get("category", "") for strategy in strategies],
+                [strategy.get("effectiveness", 0) for strategy in strategies],
+                marker={'color': self.color_palette}
             )
-        ])
-        return fig.to_json() 
\ No newline at end of file
+        ))
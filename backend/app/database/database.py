@@ -1,18 +1,117 @@
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from typing import Any, Callable, Dict, List, Optional
+import logging
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base, sessionmaker
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_async_database_url(url: str) -> str:
+    """Senkron veritabanı URL'sini async sürücüsüne çevirir (asyncpg / aiosqlite)."""
+    scheme, _, rest = url.partition("://")
+    if scheme in ("postgresql", "postgres", "postgresql+psycopg2"):
+        return f"postgresql+asyncpg://{rest}"
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    return url
+
+ASYNC_SQLALCHEMY_DATABASE_URL = settings.ASYNC_DATABASE_URL or get_async_database_url(SQLALCHEMY_DATABASE_URL)
 
+# Tüm modeller (User, JiraToken, Task, Sprint) bu metadata üzerinde tanımlanır
 Base = declarative_base()
 
+PoolMetricsHook = Callable[[str, str, Dict[str, Any]], None]
+_pool_metrics_hooks: List[PoolMetricsHook] = []
+_engines: Dict[str, Engine] = {}
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """Settings'teki havuz ayarlarından engine parametrelerini oluşturur."""
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if url.startswith("sqlite"):
+        # SQLite sürücüleri kendi havuz sınıflarını kullanır, boyut ayarları uygulanmaz
+        return options
+    options.update(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
+def _register_engine(name: str, engine: Engine):
+    """Engine havuzunu metrik kancalarına bağlar."""
+    _engines[name] = engine
+
+    def _notify(action: str):
+        if not _pool_metrics_hooks:
+            return
+        status = _pool_status(engine)
+        for hook in _pool_metrics_hooks:
+            try:
+                hook(name, action, status)
+            except Exception:
+                logger.exception("Pool metrics hook failed")
+
+    event.listen(engine, "checkout", lambda *args: _notify("checkout"))
+    event.listen(engine, "checkin", lambda *args: _notify("checkin"))
+    logger.info("Veritabanı havuzu '%s': %s", name, _pool_status(engine))
+
+def _pool_status(engine: Engine) -> Dict[str, Any]:
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if hasattr(pool, "checkedout"):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return status
+
+def add_pool_metrics_hook(hook: PoolMetricsHook):
+    """Her bağlantı checkout/checkin'inde (engine adı, aksiyon, havuz durumu) ile çağrılacak kancayı ekler."""
+    _pool_metrics_hooks.append(hook)
+
+def get_pool_status() -> Dict[str, Dict[str, Any]]:
+    """Bu worker'daki tüm engine havuzlarının anlık kullanımını döner."""
+    return {name: _pool_status(engine) for name, engine in _engines.items()}
+
+# Async engine: istek yolundaki tüm DB I/O bu havuzu kullanır
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, **_engine_options(ASYNC_SQLALCHEMY_DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+_register_engine("async", async_engine.sync_engine)
+
+# Senkron engine yalnızca ilk kullanımda açılır, böylece sadece async yolu kullanan worker tek havuz tutar
+_sync_engine: Optional[Engine] = None
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+def get_engine() -> Engine:
+    global _sync_engine
+    if _sync_engine is None:
+        options = _engine_options(SQLALCHEMY_DATABASE_URL)
+        if SQLALCHEMY_DATABASE_URL.startswith("sqlite"):
+            options["connect_args"] = {"check_same_thread": False}
+        _sync_engine = create_engine(SQLALCHEMY_DATABASE_URL, **options)
+        _register_engine("sync", _sync_engine)
+    return _sync_engine
+
 def get_db():
-    db = SessionLocal()
+    db = SessionLocal(bind=get_engine())
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Yanıt akarken de veritabanı okuması gereken endpoint'ler (streaming) session'ı kendisi açar."""
+    return AsyncSessionLocal
@@ -0,0 +1,70 @@
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+import asyncio
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFn = Callable[[List[K]], Awaitable[Dict[K, V]]]
+
+class BatchLoader(Generic[K, V]):
+    """
+    DataLoader tarzı yükleyici: aynı event loop turunda istenen anahtarları tek
+    batch_fn çağrısında toplar ve sonuçları istek boyunca kimlik önbelleğinde tutar.
+    Her istek (session) için ayrı bir örnek oluşturulmalıdır.
+    """
+
+    def __init__(self, batch_fn: BatchFn, max_batch_size: int = 500):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._pending: List[Tuple[K, asyncio.Future]] = []
+
+    async def load(self, key: K) -> Optional[V]:
+        """Anahtarın değerini döner; bulunamazsa None."""
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            if not self._pending:
+                # Aynı turdaki diğer load çağrılarının kuyruğa girmesi beklenir
+                loop.call_soon(self._dispatch)
+            self._pending.append((key, future))
+        # Paylaşılan future, bekleyenlerden biri iptal edilince iptal olmasın
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Sequence[K]) -> List[Optional[V]]:
+        """Anahtarları tek batch'te yükler, sonucu giriş sırasıyla döner."""
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def prime(self, key: K, value: Optional[V]):
+        """Başka bir sorguyla okunmuş değeri önbelleğe koyar (varsa üzerine yazar)."""
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: K):
+        self._cache.pop(key, None)
+
+    def clear_all(self):
+        self._cache.clear()
+
+    def _dispatch(self):
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_batch_size):
+            asyncio.ensure_future(self._run_batch(pending[start:start + self.max_batch_size]))
+
+    async def _run_batch(self, pending: List[Tuple[K, asyncio.Future]]):
+        try:
+            values = await self.batch_fn([key for key, _ in pending])
+        except Exception as e:
+            for key, future in pending:
+                # Hatalı sonuç önbellekte tutulmaz, sonraki load tekrar dener
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in pending:
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,277 @@
+from typing import Any, Dict, Generic, List, Optional, Sequence, Set, Type, TypeVar
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from fastapi import Depends
+from pydantic import BaseModel
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.domain import entities
+from app.core.domain.repositories import (
+    UserStoryRepository,
+    SprintRepository,
+    ProductBacklogRepository,
+    StakeholderRepository,
+    FeedbackRepository
+)
+from app.database.database import get_async_db
+from app.database.loaders import BatchLoader
+from app.models.task import Task
+from app.models.sprint import Sprint
+from app.models.backlog_item import BacklogItem
+from app.models.stakeholder import Stakeholder
+from app.models.feedback import Feedback
+from app.services.cache import ReadThroughCache, TASKS, SPRINTS, get_cache
+from app.services.task_events import load_task_states, record_task_changes, sprint_view_keys, task_state
+
+E = TypeVar("E", bound=BaseModel)
+
+class SqlRepository(Generic[E]):
+    """
+    Domain repository'leri için ortak async SQL implementasyonu.
+    get_by_id / get_many BatchLoader üzerinden gider: aynı turda istenen id'ler tek
+    IN sorgusunda okunur ve istek boyunca kimlik önbelleğinde tutulur.
+    """
+
+    model: Type[Any]
+    entity: Type[E]
+    # Veritabanında NULL olabilen ama entity'de zorunlu olan alanlar
+    defaults: Dict[str, Any] = {}
+
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock):
+        self.session = session
+        # AsyncSession eşzamanlı sorgu desteklemez; aynı session'ı paylaşan repository'ler sıraya girer
+        self._lock = lock
+        self.loader: BatchLoader[int, E] = BatchLoader(self._load_by_ids)
+
+    async def create(self, item: E) -> E:
+        async with self._lock:
+            row = self.model(**self._to_values(item))
+            self.session.add(row)
+            await self.session.flush()
+            await self._journal({}, [row])
+            await self.session.commit()
+            await self.session.refresh(row)
+        created = self._to_entity(row)
+        self.loader.prime(created.id, created)
+        await self._after_write([created.id])
+        return created
+
+    async def get_by_id(self, item_id: int) -> Optional[E]:
+        return await self.loader.load(item_id)
+
+    async def get_many(self, item_ids: Sequence[int]) -> List[Optional[E]]:
+        return await self.loader.load_many(item_ids)
+
+    async def get_all(self, skip: int = 0, limit: int = 100) -> List[E]:
+        return await self._find(offset=skip, limit=limit)
+
+    async def update(self, item: E) -> E:
+        stmt = (
+            update(self.model)
+            .where(self.model.id == item.id)
+            .values(**self._update_values(item))
+            .returning(self.model)
+        )
+        async with self._lock:
+            before = await self._capture([item.id])
+            row = (await self.session.scalars(stmt)).first()
+            if row is None:
+                await self.session.rollback()
+                raise ValueError(f"{self.entity.__name__} {item.id} not found")
+            updated = self._to_entity(row)
+            await self._journal(before, [row])
+            await self.session.commit()
+        self.loader.prime(updated.id, updated)
+        await self._after_write([updated.id])
+        return updated
+
+    async def delete(self, item_id: int) -> bool:
+        async with self._lock:
+            before = await self._capture([item_id])
+            result = await self.session.execute(
+                delete(self.model).where(self.model.id == item_id).returning(self.model.id)
+            )
+            deleted = result.first() is not None
+            await self._journal(before, [])
+            await self.session.commit()
+        self.loader.prime(item_id, None)
+        if deleted:
+            await self._after_write([item_id])
+        return deleted
+
+    async def _find(self, *criteria, order_by=None, offset: int = 0, limit: Optional[int] = None) -> List[E]:
+        """Filtreli sorgu; okunan satırlar get_by_id önbelleğine de yazılır."""
+        stmt = select(self.model).where(*criteria).order_by(order_by if order_by is not None else self.model.id)
+        if offset:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        async with self._lock:
+            rows = (await self.session.scalars(stmt)).all()
+        items = [self._to_entity(row) for row in rows]
+        for item in items:
+            self.loader.prime(item.id, item)
+        return items
+
+    async def _load_by_ids(self, item_ids: List[int]) -> Dict[int, E]:
+        async with self._lock:
+            rows = (await self.session.scalars(select(self.model).where(self.model.id.in_(item_ids)))).all()
+        return {row.id: self._to_entity(row) for row in rows}
+
+    def _group_loader(self, column) -> BatchLoader[Any, List[E]]:
+        """Bir kolona göre (ör. sprint_id) gruplanmış listeleri tek IN sorgusunda yükleyen loader."""
+        async def load_groups(keys: List[Any]) -> Dict[Any, List[E]]:
+            groups: Dict[Any, List[E]] = defaultdict(list)
+            for item in await self._find(column.in_(keys)):
+                groups[getattr(item, column.key)].append(item)
+            return {key: groups.get(key, []) for key in keys}
+        return BatchLoader(load_groups)
+
+    def _to_entity(self, row: Any) -> E:
+        values = {name: getattr(row, name) for name in self.entity.model_fields if hasattr(row, name)}
+        for name, default in self.defaults.items():
+            if values.get(name) is None:
+                values[name] = default
+        return self.entity(**values)
+
+    def _to_values(self, item: E) -> Dict[str, Any]:
+        columns = self.model.__table__.c
+        return {name: value for name, value in item.dict(exclude={"id"}).items() if name in columns}
+
+    def _update_values(self, item: E) -> Dict[str, Any]:
+        return self._to_values(item)
+
+    async def _capture(self, item_ids: List[int]) -> Any:
+        """Alt sınıflar güncelleme / silmeden önceki durumu okuyabilir; sonuç _journal'a verilir."""
+        return None
+
+    async def _journal(self, before: Any, rows: List[Any]):
+        """Alt sınıflar yazmayı commit'ten önce, aynı transaction içinde kaydedebilir."""
+
+    async def _after_write(self, item_ids: List[int]):
+        """Alt sınıflar yazma sonrası ek geçersiz kılma yapabilir."""
+
+class SqlUserStoryRepository(SqlRepository[entities.UserStory], UserStoryRepository):
+    """User story'ler tasks tablosunda tutulur."""
+
+    model = Task
+    entity = entities.UserStory
+    defaults = {"description": "", "acceptance_criteria": [], "story_points": 0}
+
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock, cache: Optional[ReadThroughCache] = None):
+        super().__init__(session, lock)
+        self.cache = cache
+        self.sprint_loader = self._group_loader(Task.sprint_id)
+        self._changed_sprints: Set[int] = set()
+
+    async def get_by_sprint(self, sprint_id: int) -> List[entities.UserStory]:
+        return await self.sprint_loader.load(sprint_id)
+
+    async def get_by_status(self, status: str) -> List[entities.UserStory]:
+        return await self._find(Task.status == status)
+
+    def _update_values(self, item: entities.UserStory) -> Dict[str, Any]:
+        return {**self._to_values(item), "version": Task.version + 1}
+
+    async def _capture(self, item_ids: List[int]) -> Any:
+        return await load_task_states(self.session, item_ids, for_update=True)
+
+    async def _journal(self, before: Any, rows: List[Any]):
+        # Durum geçişleri task API'siyle aynı olay günlüğüne yazılır
+        self._changed_sprints |= await record_task_changes(
+            self.session, before, {row.id: task_state(row) for row in rows}
+        )
+
+    async def _after_write(self, item_ids: List[int]):
+        # Sprint gruplamaları değişmiş olabilir; task API önbelleği de aynı tabloyu okur
+        self.sprint_loader.clear_all()
+        changed_sprints, self._changed_sprints = self._changed_sprints, set()
+        if self.cache is not None:
+            await self.cache.invalidate(TASKS, item_ids)
+            if changed_sprints:
+                await self.cache.invalidate(SPRINTS, sprint_view_keys(changed_sprints))
+
+class SqlSprintRepository(SqlRepository[entities.Sprint], SprintRepository):
+    model = Sprint
+    entity = entities.Sprint
+    defaults = {"goal": "", "velocity": 0.0}
+
+    async def get_active(self) -> Optional[entities.Sprint]:
+        sprints = await self._find(Sprint.status == "ACTIVE", order_by=Sprint.start_date.desc(), limit=1)
+        return sprints[0] if sprints else None
+
+    async def get_by_status(self, status: str) -> List[entities.Sprint]:
+        return await self._find(Sprint.status == status, order_by=Sprint.start_date)
+
+    async def get_recent(self, limit: int, before: Optional[datetime] = None) -> List[entities.Sprint]:
+        criteria = [Sprint.start_date < before] if before is not None else []
+        return await self._find(*criteria, order_by=Sprint.start_date.desc(), limit=limit)
+
+class SqlProductBacklogRepository(SqlRepository[entities.ProductBacklog], ProductBacklogRepository):
+    model = BacklogItem
+    entity = entities.ProductBacklog
+    defaults = {"description": "", "story_points": 0}
+
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock):
+        super().__init__(session, lock)
+        self.sprint_loader = self._group_loader(BacklogItem.sprint_id)
+
+    async def get_by_sprint(self, sprint_id: int) -> List[entities.ProductBacklog]:
+        return await self.sprint_loader.load(sprint_id)
+
+    async def get_by_status(self, status: str) -> List[entities.ProductBacklog]:
+        return await self._find(BacklogItem.status == status)
+
+    async def _after_write(self, item_ids: List[int]):
+        self.sprint_loader.clear_all()
+
+class SqlStakeholderRepository(SqlRepository[entities.Stakeholder], StakeholderRepository):
+    model = Stakeholder
+    entity = entities.Stakeholder
+    defaults = {"role": "", "email": ""}
+
+class SqlFeedbackRepository(SqlRepository[entities.Feedback], FeedbackRepository):
+    model = Feedback
+    entity = entities.Feedback
+    defaults = {"type": ""}
+
+    def __init__(self, session: AsyncSession, lock: asyncio.Lock):
+        super().__init__(session, lock)
+        self.stakeholder_loader = self._group_loader(Feedback.stakeholder_id)
+
+    async def get_by_stakeholder(self, stakeholder_id: int) -> List[entities.Feedback]:
+        return await self.stakeholder_loader.load(stakeholder_id)
+
+    async def get_by_status(self, status: str) -> List[entities.Feedback]:
+        return await self._find(Feedback.status == status)
+
+    async def _after_write(self, item_ids: List[int]):
+        self.stakeholder_loader.clear_all()
+
+class SqlRepositories:
+    """Bir istek boyunca tek AsyncSession'ı paylaşan repository seti."""
+
+    def __init__(self, session: AsyncSession, cache: Optional[ReadThroughCache] = None):
+        lock = asyncio.Lock()
+        self.user_stories = SqlUserStoryRepository(session, lock, cache)
+        self.sprints = SqlSprintRepository(session, lock)
+        self.backlog = SqlProductBacklogRepository(session, lock)
+        self.stakeholders = SqlStakeholderRepository(session, lock)
+        self.feedback = SqlFeedbackRepository(session, lock)
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        """Use case kurucularının beklediği isimlerle repository'leri döner."""
+        return {
+            "user_story_repo": self.user_stories,
+            "sprint_repo": self.sprints,
+            "backlog_repo": self.backlog,
+            "stakeholder_repo": self.stakeholders,
+            "feedback_repo": self.feedback
+        }
+
+def get_repositories(
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+) -> SqlRepositories:
+    return SqlRepositories(db, cache)
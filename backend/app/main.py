@@ -2,10 +2,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.core.logger import init_logging
-from app.database.session import engine
-from app.database.base import Base
-from app.routers import auth, users, requirements, feedback, jira, reports, tasks
-from redis.asyncio import Redis
+from app.database.database import Base, async_engine
+from app.models import user, jira_token, task, task_event, sprint, backlog_item, stakeholder, feedback  # noqa: F401  (tüm tablolar tek metadata'ya kaydolur)
+from app.routers import auth, users, requirements, feedback, jira, reports, tasks, metrics, jobs, dashboards, exports, sprints
+from app.database.redis import redis
+from app.core.services.story_point_predictor import get_story_point_predictor
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -16,9 +17,6 @@ app = FastAPI(
 # Initialize logging
 init_logging()
 
-# Initialize DB models
-Base.metadata.create_all(bind=engine)
-
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -36,20 +34,29 @@ app.include_router(feedback.router, prefix="/feedback", tags=["Feedback"])
 app.include_router(jira.router, prefix="/jira", tags=["Jira"])
 app.include_router(reports.router, prefix="/reports", tags=["Reports"])
 app.include_router(tasks.router, prefix=f"{settings.API_V1_STR}/tasks", tags=["tasks"])
+app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
+app.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+app.include_router(dashboards.router, prefix="/dashboards", tags=["Dashboards"])
+app.include_router(exports.router, prefix="/exports", tags=["Exports"])
+app.include_router(sprints.router, prefix=f"{settings.API_V1_STR}/sprints", tags=["sprints"])
 
 @app.on_event("startup")
 async def startup_event():
-    app.state.redis = Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=0,
-        decode_responses=True
-    )
-    await app.state.redis.ping()
+    # Initialize DB models
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    # Önbellek ve diğer servisler aynı Redis bağlantı havuzunu kullanır
+    app.state.redis = redis
+    await redis.ping()
+
+    # Story point modeli yoksa ya da son eğitimden beri yeterince story tamamlandıysa arka planda eğitilir
+    get_story_point_predictor().schedule_refresh()
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    await app.state.redis.close()
+    await redis.close()
+    await async_engine.dispose()
 
 @app.get("/")
 def read_root():
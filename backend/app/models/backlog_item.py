@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from datetime import datetime
+from app.database.database import Base
+
+class BacklogItem(Base):
+    __tablename__ = "backlog_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(255), nullable=False)
+    description = Column(Text)
+    priority = Column(String(50), default="MEDIUM")
+    status = Column(String(50), default="TODO", index=True)
+    story_points = Column(Integer, default=0)
+    sprint_id = Column(Integer, ForeignKey("sprints.id"), nullable=True, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
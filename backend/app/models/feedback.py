@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from app.database.database import Base
+
+class Feedback(Base):
+    __tablename__ = "feedbacks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stakeholder_id = Column(Integer, ForeignKey("stakeholders.id"), nullable=False, index=True)
+    content = Column(Text, nullable=False)
+    type = Column(String(50))
+    priority = Column(String(50), default="MEDIUM")
+    status = Column(String(50), default="NEW", index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    stakeholder = relationship("Stakeholder", back_populates="feedbacks")
@@ -1,6 +1,6 @@
 from sqlalchemy import Column, String, Integer, ForeignKey
 from sqlalchemy.orm import relationship
-from app.database.base import Base
+from app.database.database import Base
 
 class JiraToken(Base):
     __tablename__ = "jira_tokens"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.database import Base
@@ -8,9 +8,11 @@ class Sprint(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
-    start_date = Column(DateTime, nullable=False)
+    start_date = Column(DateTime, nullable=False, index=True)
     end_date = Column(DateTime, nullable=False)
-    status = Column(String(50), default="PLANNING")
+    goal = Column(Text)
+    status = Column(String(50), default="PLANNING", index=True)
+    velocity = Column(Float, default=0.0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
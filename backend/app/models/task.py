@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.database import Base
@@ -11,9 +11,26 @@ class Task(Base):
     description = Column(Text)
     status = Column(String(50), default="TODO")
     priority = Column(String(50), default="MEDIUM")
+    # Domain'deki UserStory de bu tabloya eşlenir
+    story_points = Column(Integer, nullable=True)
+    assignee = Column(String(255), nullable=True, index=True)
+    acceptance_criteria = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # İyimser eşzamanlılık: her yazmada bir artar, If-Match ile karşılaştırılır
+    version = Column(Integer, nullable=False, default=1)
     
     # Relationships
     sprint_id = Column(Integer, ForeignKey("sprints.id"), nullable=True)
-    sprint = relationship("Sprint", back_populates="tasks") 
\ No newline at end of file
+    sprint = relationship("Sprint", back_populates="tasks")
+
+    __table_args__ = (
+        # Keyset sayfalama (updated_at DESC, id DESC) ve filtreli varyantları
+        Index(
+            "ix_tasks_updated_at_id", "updated_at", "id",
+            postgresql_include=["status", "priority", "sprint_id"]
+        ),
+        Index("ix_tasks_status_updated_at_id", "status", "updated_at", "id"),
+        Index("ix_tasks_priority_updated_at_id", "priority", "updated_at", "id"),
+        Index("ix_tasks_sprint_id_updated_at_id", "sprint_id", "updated_at", "id"),
+    )
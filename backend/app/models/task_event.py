@@ -0,0 +1,37 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from datetime import datetime
+from app.database.database import Base
+
+class TaskEvent(Base):
+    """
+    Task durum / sprint / puan değişikliklerinin yalnızca eklenen günlüğü.
+    Her satır tek bir sprint içindeki geçiştir: from_status NULL ise task sprint'e girdi
+    (oluşturuldu ya da taşındı), to_status NULL ise sprint'ten çıktı (silindi ya da taşındı).
+    """
+    __tablename__ = "task_events"
+
+    id = Column(Integer, primary_key=True)
+    # Silinen task'ların geçmişi de kalır; bu yüzden foreign key yok
+    task_id = Column(Integer, nullable=False)
+    sprint_id = Column(Integer, nullable=True)
+    ts = Column(DateTime, nullable=False, default=datetime.utcnow)
+    from_status = Column(String(50), nullable=True)
+    to_status = Column(String(50), nullable=True)
+    from_points = Column(Integer, nullable=True)
+    to_points = Column(Integer, nullable=True)
+
+    __table_args__ = (
+        # Burndown / CFD: bir sprint'in olayları zaman sırasıyla, tablo taranmadan
+        Index("ix_task_events_sprint_id_ts", "sprint_id", "ts"),
+        # Cycle time: bir task'ın geçişleri
+        Index("ix_task_events_task_id_ts", "task_id", "ts"),
+    )
+
+class SprintStatusTotal(Base):
+    """Sprint başına durum bazında task sayısı ve puan; her olayla artımlı güncellenir."""
+    __tablename__ = "sprint_status_totals"
+
+    sprint_id = Column(Integer, primary_key=True)
+    status = Column(String(50), primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0)
+    points = Column(Integer, nullable=False, default=0)
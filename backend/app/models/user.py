@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, Integer
-from app.database.base import Base
+from app.database.database import Base
 
 class User(Base):
     __tablename__ = "users"
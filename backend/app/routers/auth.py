@@ -2,25 +2,19 @@ from fastapi import APIRouter, Depends, HTTPException, Body
 from app.schemas.user import UserLogin, UserOut
 from app.utils.token import create_access_token, verify_token
 from app.models.user import User
-from app.database.session import SessionLocal
-from sqlalchemy.orm import Session
+from app.database.database import get_async_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 
-# DB bağımlılığı
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/login", response_model=UserOut)
-def login(user: UserLogin, db: Session = Depends(get_db)):
+async def login(user: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Kullanıcı adı ve şifre ile login → JWT üret
     """
-    db_user = db.query(User).filter(User.username == user.username).first()
+    result = await db.execute(select(User).where(User.username == user.username))
+    db_user = result.scalar_one_or_none()
     if not db_user or db_user.password != user.password:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     token = create_access_token({"sub": db_user.username})
@@ -0,0 +1,63 @@
+from typing import Any, Dict, Optional
+import orjson
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Response
+from app.services.dashboard_snapshots import DashboardSnapshotStore, get_dashboard_store
+from app.utils.etag import etag_matches, not_modified
+
+router = APIRouter()
+
+@router.get("/{project_id}")
+async def get_dashboard(
+    project_id: int,
+    if_none_match: Optional[str] = Header(None),
+    store: DashboardSnapshotStore = Depends(get_dashboard_store)
+):
+    """
+    Önceden hesaplanmış dashboard'u tek anahtar okumasıyla döner.
+    Snapshot henüz üretilmediyse 404; içeriği değişmemişse gövdesiz 304.
+    """
+    snapshot = await store.get(project_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Dashboard snapshot not ready")
+
+    # ETag içerikten gelir: aynı içerikle yeniden hesaplanan snapshot istemci önbelleğini düşürmez.
+    # Gövdedeki sürüm yine de ilerleyebildiği için zayıf ETag
+    etag = f'W/"{snapshot["digest"]}"'
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    # Saklanan JSON yeniden çözülüp kodlanmadan yanıta gömülür
+    content = orjson.dumps({
+        "project_id": project_id,
+        "version": snapshot["version"],
+        "generated_at": snapshot["generated_at"],
+        "dashboard": orjson.Fragment(snapshot["dashboard"])
+    })
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+@router.put("/{project_id}", status_code=202)
+async def register_dashboard_project(
+    project_id: int,
+    project_data: Dict[str, Any] = Body(...),
+    store: DashboardSnapshotStore = Depends(get_dashboard_store)
+):
+    """
+    Proje verisini kaydeder / günceller; snapshot scheduler tarafından kısa süre içinde yeniden hesaplanır.
+    """
+    await store.register_project({**project_data, "id": project_id})
+    return {"project_id": project_id, "status": "scheduled"}
+
+@router.post("/{project_id}/refresh", status_code=202)
+async def refresh_dashboard(
+    project_id: int,
+    changes: Optional[Dict[str, Any]] = Body(None),
+    store: DashboardSnapshotStore = Depends(get_dashboard_store)
+):
+    """
+    Proje verisinin değişen alanlarını (ör. {"sprints": [...]}) kayıtlı veriye işler ve snapshot'ın
+    yeniden hesaplanmasını ister. Dashboard yalnızca kayıtlı veriden üretilir; gövdesiz çağrı
+    aynı veriyle yeniden hesaplar (içerik değişmezse ETag de değişmez).
+    """
+    if not await store.mark_changed(project_id, changes):
+        raise HTTPException(status_code=404, detail="Project not registered")
+    return {"project_id": project_id, "status": "scheduled"}
@@ -0,0 +1,119 @@
+from typing import Any, List, Optional
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.database.database import get_async_session_factory
+from app.services.cache import ReadThroughCache, REPORTS, get_cache
+from app.services.exports import (
+    ARROW,
+    EXPORT_TABLES,
+    FILE_EXTENSIONS,
+    MEDIA_TYPES,
+    encode_batches,
+    issues_table,
+    iter_table_batches,
+    project_schema,
+    table_stream
+)
+
+router = APIRouter()
+
+FORMAT_PATTERN = "^(arrow|parquet)$"
+
+def _columns(columns: Optional[str]) -> Optional[List[str]]:
+    if not columns:
+        return None
+    return [name.strip() for name in columns.split(",") if name.strip()]
+
+def _stream(body, fmt: str, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{FILE_EXTENSIONS[fmt]}"'}
+    )
+
+def _table_export(
+    name: str,
+    criteria: List[Any],
+    fmt: str,
+    columns: Optional[str],
+    session_factory: async_sessionmaker
+) -> StreamingResponse:
+    table, schema = EXPORT_TABLES[name]
+    try:
+        schema = project_schema(schema, _columns(columns))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    batches = iter_table_batches(session_factory, table, schema, criteria)
+    return _stream(encode_batches(batches, schema, fmt), fmt, name)
+
+@router.get("/tasks")
+async def export_tasks(
+    format: str = Query(ARROW, pattern=FORMAT_PATTERN),
+    columns: Optional[str] = Query(None, description="Virgülle ayrılmış kolon listesi"),
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    sprint_id: Optional[int] = None,
+    updated_since: Optional[datetime] = None,
+    updated_before: Optional[datetime] = None,
+    session_factory: async_sessionmaker = Depends(get_async_session_factory)
+):
+    """
+    Task'ları Arrow IPC stream ya da Parquet olarak akıtır; satırlar batch batch okunup yazılır.
+    """
+    table = EXPORT_TABLES["tasks"][0]
+    criteria = []
+    if status is not None:
+        criteria.append(table.c.status == status)
+    if priority is not None:
+        criteria.append(table.c.priority == priority)
+    if sprint_id is not None:
+        criteria.append(table.c.sprint_id == sprint_id)
+    if updated_since is not None:
+        criteria.append(table.c.updated_at >= updated_since)
+    if updated_before is not None:
+        criteria.append(table.c.updated_at < updated_before)
+    return _table_export("tasks", criteria, format, columns, session_factory)
+
+@router.get("/sprints")
+async def export_sprints(
+    format: str = Query(ARROW, pattern=FORMAT_PATTERN),
+    columns: Optional[str] = Query(None, description="Virgülle ayrılmış kolon listesi"),
+    status: Optional[str] = None,
+    start_from: Optional[datetime] = None,
+    start_to: Optional[datetime] = None,
+    session_factory: async_sessionmaker = Depends(get_async_session_factory)
+):
+    """
+    Sprint'leri Arrow IPC stream ya da Parquet olarak akıtır.
+    """
+    table = EXPORT_TABLES["sprints"][0]
+    criteria = []
+    if status is not None:
+        criteria.append(table.c.status == status)
+    if start_from is not None:
+        criteria.append(table.c.start_date >= start_from)
+    if start_to is not None:
+        criteria.append(table.c.start_date < start_to)
+    return _table_export("sprints", criteria, format, columns, session_factory)
+
+@router.get("/reports/{report_id}")
+async def export_report_issues(
+    report_id: str,
+    format: str = Query(ARROW, pattern=FORMAT_PATTERN),
+    columns: Optional[str] = Query(None, description="Virgülle ayrılmış kolon listesi"),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Önbellekteki sprint raporunun ham issue listesini kolon formatında döner;
+    rapor özeti ve takım verisi dosya metadata'sındadır.
+    """
+    cached = await cache.peek_item(REPORTS, report_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Report not found or expired")
+    try:
+        table = issues_table(cached["report"], _columns(columns))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _stream(table_stream(table, format), format, f"report-{report_id}")
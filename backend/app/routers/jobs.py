@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from app.schemas.job import JobSubmitRequest, JobSubmitResponse, JobStatusResponse, JobResultResponse
+from app.services.jobs import JobQueue, get_job_queue, registered_job_types
+import app.services.job_handlers  # noqa: F401  (iş tipleri kaydolur)
+
+router = APIRouter()
+
+@router.post("/", response_model=JobSubmitResponse, status_code=202)
+async def submit_job(request: JobSubmitRequest, response: Response, queue: JobQueue = Depends(get_job_queue)):
+    """
+    Uzun süren bir analizi kuyruğa ekler; sonuç /jobs/{job_id}/result üzerinden okunur.
+    """
+    try:
+        job_id = await queue.submit(
+            request.type,
+            request.payload,
+            priority=request.priority,
+            max_attempts=request.max_attempts,
+            result_ttl=request.result_ttl
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"{e}. Available: {', '.join(registered_job_types())}")
+    response.headers["Location"] = f"/jobs/{job_id}"
+    return {"job_id": job_id, "status": "queued"}
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str, queue: JobQueue = Depends(get_job_queue)):
+    job = await queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.get("/{job_id}/result", response_model=JobResultResponse)
+async def get_job_result(job_id: str, queue: JobQueue = Depends(get_job_queue)):
+    """
+    Tamamlanmış işin sonucunu döner; iş bitmediyse 409.
+    """
+    job = await queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] != "succeeded":
+        raise HTTPException(status_code=409, detail={"status": job["status"], "error": job["error"]})
+
+    found, result = await queue.get_result(job_id)
+    if not found:
+        raise HTTPException(status_code=404, detail="Job result expired")
+    return {"job_id": job_id, "result": result}
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str, queue: JobQueue = Depends(get_job_queue)):
+    """
+    Kuyruktaki işi iptal eder; çalışan iş worker tarafından bir sonraki kontrolde durdurulur.
+    """
+    status = await queue.cancel(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"job_id": job_id, "status": status}
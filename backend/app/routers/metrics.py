@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from app.database.database import get_pool_status
+from app.services.cache import cache
+
+router = APIRouter()
+
+@router.get("/db-pool")
+def db_pool_metrics():
+    """
+    Bu worker'daki veritabanı bağlantı havuzlarının kullanımı
+    """
+    return get_pool_status()
+
+@router.get("/cache")
+def cache_metrics():
+    """
+    Bu worker'daki Redis önbelleğinin hit oranı ve gecikmeleri
+    """
+    return cache.metrics.snapshot()
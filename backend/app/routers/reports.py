@@ -1,23 +1,78 @@
-from fastapi import APIRouter, HTTPException, Body
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Body, Depends, Header, Response
+from app.core.config import settings
+from app.services.cache import ReadThroughCache, REPORTS, get_cache
+from app.services.jobs import JobQueue, get_job_queue
+import app.services.job_handlers  # noqa: F401  (iş tipleri kaydolur)
 from app.services.report_engine import generate_sprint_report
+from app.utils.etag import content_hash, content_etag, etag_matches, not_modified
 
 router = APIRouter()
 
 @router.post("/sprint")
 async def get_sprint_report(
+    response: Response,
     team_data: dict = Body(...),
     issues: list = Body(...),
-    historical_velocity: float = Body(0.0)
+    historical_velocity: float = Body(0.0),
+    cache: ReadThroughCache = Depends(get_cache)
 ):
     """
     AI destekli sprint performans raporu üretir.
+    Aynı girdi için rapor önbellekten döner; report_id ile GET üzerinden koşullu okunabilir.
     """
-    try:
+    report_id = content_hash(team_data, issues, historical_velocity)
+
+    async def load_report():
         report = await generate_sprint_report(
             team_data=team_data,
             issues=issues,
             historical_velocity=historical_velocity
         )
-        return {"report": report}
+        return {"report": report, "etag": content_etag(report)}
+
+    try:
+        cached = await cache.get_item(REPORTS, report_id, load_report, ttl=settings.REPORT_CACHE_TTL_SECONDS)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+    response.headers["ETag"] = cached["etag"]
+    return {"report_id": report_id, "report": cached["report"]}
+
+@router.get("/sprint/{report_id}")
+async def get_cached_sprint_report(
+    report_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Daha önce üretilmiş raporu döner; değişmemişse gövdesiz 304.
+    """
+    cached = await cache.peek_item(REPORTS, report_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="Report not found or expired")
+
+    if etag_matches(if_none_match, cached["etag"]):
+        return not_modified(cached["etag"])
+    response.headers["ETag"] = cached["etag"]
+    return {"report_id": report_id, "report": cached["report"]}
+
+@router.post("/sprint/jobs", status_code=202)
+async def submit_sprint_report_job(
+    response: Response,
+    team_data: dict = Body(...),
+    issues: list = Body(...),
+    historical_velocity: float = Body(0.0),
+    queue: JobQueue = Depends(get_job_queue)
+):
+    """
+    Sprint raporunu arka planda üretir; durum /jobs/{job_id} üzerinden izlenir.
+    """
+    job_id = await queue.submit("sprint_report", {
+        "team_data": team_data,
+        "issues": issues,
+        "historical_velocity": historical_velocity
+    })
+    response.headers["Location"] = f"/jobs/{job_id}"
+    return {"job_id": job_id, "status": "queued"}
@@ -0,0 +1,147 @@
+from typing import Any, Awaitable, Callable, Dict
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.services.sprint_metrics import DONE_STATUSES, SPRINT_COLUMNS, SprintMetricsEngine
+from app.database.database import get_async_db
+from app.models.sprint import Sprint
+from app.services.cache import ReadThroughCache, SPRINTS, get_cache
+from app.services import task_events
+
+router = APIRouter()
+
+# Sprint metriklerindeki ortalama velocity için okunan önceki sprint sayısı
+VELOCITY_HISTORY_SPRINTS = 6
+
+async def _sprint_view(
+    view: str,
+    sprint_id: int,
+    db: AsyncSession,
+    cache: ReadThroughCache,
+    build: Callable[[Any], Awaitable[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """Görünümü önbellekten okur; yoksa sprint'i yükleyip hesaplar. Task yazmaları anahtarı siler."""
+    async def load():
+        sprint = (await db.execute(
+            select(Sprint.id, Sprint.start_date, Sprint.end_date).where(Sprint.id == sprint_id)
+        )).first()
+        if sprint is None:
+            return None
+        return {"sprint_id": sprint_id, **await build(sprint)}
+
+    result = await cache.get_item(SPRINTS, f"{sprint_id}:{view}", load)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Sprint not found")
+    return result
+
+async def _velocity(db: AsyncSession, sprint_id: int, metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ortalama velocity ve geçmişi her istekte hesaplanır; önceki sprint'lerin task yazmaları bu
+    sprint'in önbelleğini silmez. Task tablosu yerine sprint satırları ve durum toplamları okunur.
+    """
+    start = select(Sprint.start_date).where(Sprint.id == sprint_id).scalar_subquery()
+    sprints = (await db.execute(
+        select(*(Sprint.__table__.c[name] for name in SPRINT_COLUMNS))
+        .where(or_(Sprint.id == sprint_id, Sprint.start_date < start))
+        .order_by(Sprint.start_date.desc())
+        .limit(VELOCITY_HISTORY_SPRINTS + 1)
+    )).mappings().all()
+    completed = await task_events.completed_points(db, [row["id"] for row in sprints if row["id"] != sprint_id])
+    # Task'ı olmayan sprint'te motor gibi sprint tablosundaki velocity kullanılır
+    records = [
+        {**row, "velocity": metrics["velocity"] if metrics["tasks"] else row["velocity"]}
+        if row["id"] == sprint_id else {**row, "velocity": completed.get(row["id"], row["velocity"])}
+        for row in sprints
+    ]
+    velocity = SprintMetricsEngine.from_records([], records).velocity(until=sprint_id)
+    return {"average_velocity": velocity["average"], "velocity_history": velocity["history"]}
+
+@router.get("/{sprint_id}/status")
+async def get_sprint_status(
+    sprint_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Durum başına task sayısı ve puan; artımlı tutulan toplamlardan okunur, task tablosu taranmaz.
+    """
+    async def build(sprint):
+        totals = await task_events.sprint_totals(db, sprint_id)
+        completed = sum(total["points"] for status, total in totals.items() if status in DONE_STATUSES)
+        return {
+            "statuses": totals,
+            "completed_points": completed,
+            "remaining_points": sum(total["points"] for total in totals.values()) - completed
+        }
+
+    return await _sprint_view("status", sprint_id, db, cache, build)
+
+@router.get("/{sprint_id}/metrics")
+async def get_sprint_metrics(
+    sprint_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Velocity, tamamlanma oranı, carry-over, cycle time ve kişi başı yük. Yalnızca bu sprint'in
+    task kolonları okunup önbelleğe alınır; velocity ortalaması önceki VELOCITY_HISTORY_SPRINTS
+    sprint'in toplamlarından her istekte hesaplanır. Cycle time /cycle-time ile aynı, durum
+    geçişlerinden ölçülen değerdir.
+    """
+    async def build(sprint):
+        engine = await SprintMetricsEngine.load(db, [sprint_id])
+        cycle = task_events.cycle_times(await task_events.sprint_events(db, sprint_id))
+        metrics = engine.sprint_metrics(sprint_id)
+        # Geçmiş, önceki sprint'lerin yazmalarıyla değişir; önbellekteki görünümde tutulmaz
+        del metrics["average_velocity"], metrics["velocity_history"]
+        return {
+            **metrics,
+            "cycle_time_hours": {"mean": cycle["mean_hours"], "median": cycle["median_hours"], "p85": cycle["p85_hours"]}
+        }
+
+    metrics = await _sprint_view("metrics", sprint_id, db, cache, build)
+    return {**metrics, **await _velocity(db, sprint_id, metrics)}
+
+@router.get("/{sprint_id}/burndown")
+async def get_sprint_burndown(
+    sprint_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Günlük kalan puan, kapsam ve ideal çizgi; yalnızca sprint'in olaylarından hesaplanır.
+    """
+    async def build(sprint):
+        events = await task_events.sprint_events(db, sprint_id)
+        return task_events.burndown(events, sprint.start_date, sprint.end_date)
+
+    return await _sprint_view("burndown", sprint_id, db, cache, build)
+
+@router.get("/{sprint_id}/cumulative-flow")
+async def get_sprint_cumulative_flow(
+    sprint_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Kümülatif akış diyagramı: her gün sonunda durum başına task sayısı.
+    """
+    async def build(sprint):
+        events = await task_events.sprint_events(db, sprint_id)
+        return task_events.cumulative_flow(events, sprint.start_date, sprint.end_date)
+
+    return await _sprint_view("cumulative_flow", sprint_id, db, cache, build)
+
+@router.get("/{sprint_id}/cycle-time")
+async def get_sprint_cycle_time(
+    sprint_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Sprint'te tamamlanan task'ların durum geçişlerinden ölçülen cycle time.
+    """
+    async def build(sprint):
+        return task_events.cycle_times(await task_events.sprint_events(db, sprint_id))
+
+    return await _sprint_view("cycle_time", sprint_id, db, cache, build)
@@ -1,51 +1,442 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.database.database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
+from sqlalchemy import select, insert, update, delete, bindparam, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from app.database.database import get_async_db
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskResponse
+from app.models.sprint import Sprint
+from app.schemas.task import (
+    TaskCreate,
+    TaskResponse,
+    TaskPage,
+    TaskUpdate,
+    TaskBulkUpdateItem,
+    TaskBulkDeleteRequest,
+    TaskBulkResponse,
+    TaskBulkDeleteResponse,
+    BulkItemError
+)
+from app.services.cache import ReadThroughCache, TASKS, SPRINTS, get_cache
+from app.services.task_events import (
+    TRACKED_FIELDS,
+    TaskState,
+    load_task_states,
+    record_task_changes,
+    sprint_view_keys,
+    task_state
+)
+from app.utils.etag import content_etag, version_etag, parse_version_etag, etag_matches, not_modified
+from app.utils.pagination import encode_cursor, decode_cursor
 
 router = APIRouter()
 
+TASK_FIELDS = list(TaskResponse.model_fields)
+MAX_BULK_ITEMS = 1000
+# tasks.sprint_id yabancı anahtarının PostgreSQL'deki varsayılan adı
+SPRINT_FK_CONSTRAINT = "tasks_sprint_id_fkey"
+
+def _check_bulk_size(count: int):
+    if count > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} items per request")
+
+async def _existing_sprint_ids(db: AsyncSession, sprint_ids: Iterable[Optional[int]]) -> Set[int]:
+    """Verilen sprint id'lerinden var olanları tek sorguda döner."""
+    wanted = {sprint_id for sprint_id in sprint_ids if sprint_id is not None}
+    if not wanted:
+        return set()
+    result = await db.scalars(select(Sprint.id).where(Sprint.id.in_(wanted)))
+    return set(result)
+
+def _constraint_name(error: IntegrityError) -> Optional[str]:
+    """İhlal edilen kısıtın adı (asyncpg: sarılan istisnada, psycopg: diag'da; SQLite vermez)."""
+    for source in (error.orig, getattr(error.orig, "__cause__", None), getattr(error.orig, "diag", None)):
+        name = getattr(source, "constraint_name", None)
+        if name:
+            return name
+    return None
+
+def _integrity_error(error: IntegrityError) -> HTTPException:
+    """Yalnızca sprint yabancı anahtarı ihlali "Sprint not found"dır; diğerleri kısıt adıyla 409 döner."""
+    name = _constraint_name(error)
+    # SQLite kısıt adı vermez; tasks tablosundaki tek yabancı anahtar sprint_id'dir
+    if name == SPRINT_FK_CONSTRAINT or (name is None and "FOREIGN KEY" in str(error.orig).upper()):
+        return HTTPException(status_code=400, detail="Sprint not found")
+    return HTTPException(status_code=409, detail=f"Constraint violated: {name or error.orig}")
+
+async def _invalidate(cache: ReadThroughCache, task_ids: Iterable[int], sprint_ids: Set[int]):
+    """Task önbelleği ve değişen sprint'lerin burndown / akış görünümleri."""
+    await cache.invalidate(TASKS, task_ids)
+    if sprint_ids:
+        await cache.invalidate(SPRINTS, sprint_view_keys(sprint_ids))
+
 @router.post("/", response_model=TaskResponse)
-def create_task(task: TaskCreate, db: Session = Depends(get_db)):
+async def create_task(
+    task: TaskCreate,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
     db_task = Task(**task.dict())
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    await db.flush()
+    sprint_ids = await record_task_changes(db, {}, {db_task.id: task_state(db_task)})
+    await db.commit()
+    await db.refresh(db_task)
+    await _invalidate(cache, [], sprint_ids)
     return db_task
 
-@router.get("/", response_model=List[TaskResponse])
-def get_tasks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    tasks = db.query(Task).offset(skip).limit(limit).all()
-    return tasks
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def create_tasks_bulk(
+    tasks: List[TaskCreate],
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Task'ları tek transaction içinde, tek bir çok satırlı INSERT ... RETURNING ile oluşturur.
+    """
+    _check_bulk_size(len(tasks))
+    sprint_ids = await _existing_sprint_ids(db, (task.sprint_id for task in tasks))
+
+    errors = []
+    rows = []
+    for index, task in enumerate(tasks):
+        if task.sprint_id is not None and task.sprint_id not in sprint_ids:
+            errors.append(BulkItemError(index=index, detail="Sprint not found"))
+            continue
+        rows.append(task.dict())
+
+    created = []
+    if rows:
+        result = await db.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows)
+        created = result.all()
+        sprint_ids = await record_task_changes(db, {}, {task.id: task_state(task) for task in created})
+        await db.commit()
+        await _invalidate(cache, [], sprint_ids)
+    return {"items": created, "errors": errors}
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+async def update_tasks_bulk(
+    items: List[TaskBulkUpdateItem],
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Kısmi güncellemeleri tek transaction içinde uygular; aynı alan setine sahip satırlar tek executemany UPDATE olur.
+    """
+    _check_bulk_size(len(items))
+    ids = [item.id for item in items]
+    # Varlık kontrolü aynı zamanda olay günlüğü için önceki durumu okur
+    before = await load_task_states(db, ids, for_update=True)
+    sprint_ids = await _existing_sprint_ids(db, (item.sprint_id for item in items))
+
+    errors = []
+    seen: Set[int] = set()
+    updated_ids: List[int] = []
+    groups: Dict[Tuple[str, ...], List[dict]] = {}
+    for index, item in enumerate(items):
+        changes = item.dict(exclude_unset=True, exclude={"id"})
+        if item.id in seen:
+            errors.append(BulkItemError(index=index, id=item.id, detail="Duplicate id in request"))
+            continue
+        seen.add(item.id)
+        if item.id not in before:
+            errors.append(BulkItemError(index=index, id=item.id, detail="Task not found"))
+            continue
+        if "title" in changes and changes["title"] is None:
+            errors.append(BulkItemError(index=index, id=item.id, detail="title cannot be null"))
+            continue
+        if changes.get("sprint_id") is not None and changes["sprint_id"] not in sprint_ids:
+            errors.append(BulkItemError(index=index, id=item.id, detail="Sprint not found"))
+            continue
+
+        updated_ids.append(item.id)
+        if changes:
+            columns = tuple(sorted(changes))
+            params = {f"v_{column}": value for column, value in changes.items()}
+            params["b_id"] = item.id
+            groups.setdefault(columns, []).append(params)
+
+    tasks_table = Task.__table__
+    now = datetime.utcnow()
+    for columns, params in groups.items():
+        stmt = (
+            update(tasks_table)
+            .where(tasks_table.c.id == bindparam("b_id"))
+            .values({
+                **{column: bindparam(f"v_{column}") for column in columns},
+                "updated_at": now,
+                "version": tasks_table.c.version + 1
+            })
+        )
+        await db.execute(stmt, params)
+
+    updated = []
+    if updated_ids:
+        # UPDATE executemany RETURNING desteklemez; sonuçlar tek SELECT ile okunur
+        rows = {task.id: task for task in await db.scalars(select(Task).where(Task.id.in_(updated_ids)))}
+        updated = [rows[task_id] for task_id in updated_ids]
+        changed_sprints = await record_task_changes(
+            db,
+            {task_id: before[task_id] for task_id in updated_ids},
+            {task_id: task_state(task) for task_id, task in rows.items()}
+        )
+        await db.commit()
+        await _invalidate(cache, updated_ids, changed_sprints)
+    return {"items": updated, "errors": errors}
+
+@router.delete("/bulk", response_model=TaskBulkDeleteResponse)
+async def delete_tasks_bulk(
+    request: TaskBulkDeleteRequest,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Task'ları tek DELETE ... RETURNING ile siler; bulunamayan id'ler hata olarak raporlanır.
+    """
+    _check_bulk_size(len(request.ids))
+    ids = list(dict.fromkeys(request.ids))
+    deleted: Set[int] = set()
+    if ids:
+        result = await db.execute(
+            delete(Task)
+            .where(Task.id.in_(ids))
+            .returning(Task.id, Task.sprint_id, Task.status, Task.story_points)
+            .execution_options(synchronize_session=False)
+        )
+        removed = {row.id: task_state(row._mapping) for row in result}
+        deleted = set(removed)
+        sprint_ids = await record_task_changes(db, removed, {})
+        await db.commit()
+        await _invalidate(cache, deleted, sprint_ids)
+
+    errors = [
+        BulkItemError(index=index, id=task_id, detail="Task not found")
+        for index, task_id in enumerate(request.ids)
+        if task_id not in deleted
+    ]
+    return {"deleted": [task_id for task_id in ids if task_id in deleted], "errors": errors}
+
+@router.get("/", response_model=TaskPage)
+async def get_tasks(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    sprint_id: Optional[int] = None,
+    fields: Optional[str] = Query(None, description="Virgülle ayrılmış alan listesi, ör. id,title,status"),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    (updated_at, id) üzerinde cursor tabanlı sayfalama; en son güncellenen task'lar önce gelir.
+    ETag sayfadaki (id, version) çiftlerinden türetilir; değişmeyen sayfa için 304 döner.
+    """
+    requested = TASK_FIELDS
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = set(requested) - set(TASK_FIELDS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    cursor_key = None
+    if cursor:
+        try:
+            cursor_key = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    async def load_page():
+        # Cursor ve ETag için sıralama kolonları ve version her zaman seçilir
+        columns = list(dict.fromkeys(requested + ["updated_at", "id", "version"]))
+        query = select(*[Task.__table__.c[name] for name in columns])
+
+        if status is not None:
+            query = query.where(Task.status == status)
+        if priority is not None:
+            query = query.where(Task.priority == priority)
+        if sprint_id is not None:
+            query = query.where(Task.sprint_id == sprint_id)
+        if cursor_key is not None:
+            query = query.where(tuple_(Task.updated_at, Task.id) < tuple_(*cursor_key))
+
+        query = query.order_by(Task.updated_at.desc(), Task.id.desc()).limit(limit + 1)
+        rows = (await db.execute(query)).mappings().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["updated_at"], rows[-1]["id"])
+
+        return {
+            "etag": content_etag(requested, next_cursor, [(row["id"], row["version"]) for row in rows]),
+            "page": {
+                "items": [{name: row[name] for name in requested} for row in rows],
+                "next_cursor": next_cursor
+            }
+        }
+
+    params = {
+        "cursor": cursor,
+        "limit": limit,
+        "status": status,
+        "priority": priority,
+        "sprint_id": sprint_id,
+        "fields": requested
+    }
+    cached = await cache.get_list(TASKS, params, load_page)
+    if etag_matches(if_none_match, cached["etag"]):
+        return not_modified(cached["etag"])
+    response.headers["ETag"] = cached["etag"]
+    return cached["page"]
 
 @router.get("/{task_id}", response_model=TaskResponse)
-def get_task(task_id: int, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
+async def get_task(
+    task_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    async def load_task():
+        task = await db.get(Task, task_id)
+        return TaskResponse.model_validate(task).model_dump() if task is not None else None
+
+    task = await cache.get_item(TASKS, task_id, load_task)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
+
+    etag = version_etag(task["id"], task["version"])
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     return task
 
 @router.put("/{task_id}", response_model=TaskResponse)
-def update_task(task_id: int, task: TaskCreate, db: Session = Depends(get_db)):
-    db_task = db.query(Task).filter(Task.id == task_id).first()
+async def update_task(
+    task_id: int,
+    task: TaskCreate,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    db_task = await db.get(Task, task_id)
     if db_task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
+
+    before = task_state(db_task)
     for key, value in task.dict().items():
         setattr(db_task, key, value)
-    
-    db.commit()
-    db.refresh(db_task)
+    db_task.version = Task.version + 1
+
+    sprint_ids = await record_task_changes(db, {task_id: before}, {task_id: task_state(db_task)})
+    await db.commit()
+    await db.refresh(db_task)
+    await _invalidate(cache, [task_id], sprint_ids)
     return db_task
 
+def _patch_statement(task_id: int, changes: Dict, expected_version: Optional[int], returning_prior: bool):
+    """
+    PATCH'in UPDATE ... RETURNING sorgusu. returning_prior ile (PostgreSQL) satır alt sorguda
+    FOR UPDATE ile kilitlenir ve önceki sprint/durum/puan old_ önekiyle aynı sorgudan döner.
+    """
+    tasks_table = Task.__table__
+    returning = list(tasks_table.c)
+    stmt = update(tasks_table)
+    if returning_prior:
+        old = (
+            select(tasks_table.c.id, tasks_table.c.sprint_id, tasks_table.c.status, tasks_table.c.story_points)
+            .where(tasks_table.c.id == task_id)
+            .with_for_update()
+            .subquery("old")
+        )
+        stmt = stmt.where(tasks_table.c.id == old.c.id)
+        returning += [old.c[name].label(f"old_{name}") for name in ("sprint_id", "status", "story_points")]
+    else:
+        stmt = stmt.where(tasks_table.c.id == task_id)
+    if expected_version is not None:
+        stmt = stmt.where(tasks_table.c.version == expected_version)
+    return stmt.values(
+        **changes,
+        updated_at=datetime.utcnow(),
+        version=tasks_table.c.version + 1
+    ).returning(*returning)
+
+def _parse_if_match(task_id: int, if_match: Optional[str]) -> Optional[int]:
+    """If-Match başlığındaki version değerini okur (GET'in ETag'i ya da yalnızca version)."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        etag_id, version = parse_version_etag(if_match)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid If-Match header")
+    if etag_id is not None and etag_id != task_id:
+        # Başka bir kaynağın ETag'i: hiçbir version ile eşleşmez
+        return 0
+    return version
+
+@router.patch("/{task_id}", response_model=TaskResponse)
+async def patch_task(
+    task_id: int,
+    task: TaskUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    """
+    Yalnızca gönderilen kolonları tek UPDATE ... RETURNING ile yazar.
+    If-Match verilirse satır sadece version eşleşiyorsa güncellenir, aksi halde 412 döner.
+    """
+    changes = task.dict(exclude_unset=True)
+    if "title" in changes and changes["title"] is None:
+        raise HTTPException(status_code=400, detail="title cannot be null")
+    expected_version = _parse_if_match(task_id, if_match)
+
+    # Olay üreten alanlar değişiyorsa önceki durum gerekir: PostgreSQL'de UPDATE'in kendisinden
+    # döner, RETURNING'de FROM tablosuna izin vermeyen diğer veritabanlarında kilitlenerek okunur
+    tracked = bool(TRACKED_FIELDS & changes.keys())
+    returning_prior = tracked and db.get_bind().dialect.name == "postgresql"
+    before = await load_task_states(db, [task_id], for_update=True) if tracked and not returning_prior else {}
+    stmt = _patch_statement(task_id, changes, expected_version, returning_prior)
+    tasks_table = Task.__table__
+
+    try:
+        row = (await db.execute(stmt)).mappings().first()
+    except IntegrityError as error:
+        await db.rollback()
+        raise _integrity_error(error)
+
+    if row is None:
+        # Eşleşme yoksa 404 ile 412'yi ayırmak için yalnızca bu durumda ek sorgu yapılır
+        exists = expected_version is not None and await db.scalar(
+            select(tasks_table.c.id).where(tasks_table.c.id == task_id)
+        )
+        if exists:
+            raise HTTPException(status_code=412, detail="Task was modified by another request")
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if returning_prior:
+        before = {task_id: TaskState(row["old_sprint_id"], row["old_status"], row["old_story_points"])}
+    sprint_ids = await record_task_changes(db, before, {task_id: task_state(row)}) if before else set()
+    await db.commit()
+    await _invalidate(cache, [task_id], sprint_ids)
+    response.headers["ETag"] = version_etag(row["id"], row["version"])
+    return row
+
 @router.delete("/{task_id}")
-def delete_task(task_id: int, db: Session = Depends(get_db)):
-    task = db.query(Task).filter(Task.id == task_id).first()
+async def delete_task(
+    task_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    cache: ReadThroughCache = Depends(get_cache)
+):
+    task = await db.get(Task, task_id)
     if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
-    
-    db.delete(task)
-    db.commit()
-    return {"message": "Task deleted successfully"} 
\ No newline at end of file
+
+    await db.delete(task)
+    sprint_ids = await record_task_changes(db, {task_id: task_state(task)}, {})
+    await db.commit()
+    await _invalidate(cache, [task_id], sprint_ids)
+    return {"message": "Task deleted successfully"}
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Literal, Optional
+
+class JobSubmitRequest(BaseModel):
+    type: str
+    payload: Dict[str, Any] = {}
+    priority: Literal["high", "normal", "low"] = "normal"
+    max_attempts: Optional[int] = Field(None, ge=1, le=10)
+    result_ttl: Optional[int] = Field(None, ge=60, description="Sonucun saklanma süresi (saniye)")
+
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: str
+
+class JobStatusResponse(BaseModel):
+    id: str
+    type: str
+    status: str
+    priority: str
+    attempts: int
+    max_attempts: int
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+class JobResultResponse(BaseModel):
+    job_id: str
+    result: Any
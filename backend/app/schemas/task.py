@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from typing import List
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 class FeatureRequest(BaseModel):
     feature_description: str
@@ -21,6 +21,8 @@ class TaskBase(BaseModel):
     status: str = "TODO"
     priority: str = "MEDIUM"
     sprint_id: Optional[int] = None
+    story_points: Optional[int] = None
+    assignee: Optional[str] = None
 
 class TaskCreate(TaskBase):
     pass
@@ -29,6 +31,40 @@ class TaskResponse(TaskBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    version: int
 
     class Config:
         from_attributes = True
+
+class TaskUpdate(BaseModel):
+    """Kısmi güncelleme: yalnızca gönderilen alanlar değişir."""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    priority: Optional[str] = None
+    sprint_id: Optional[int] = None
+    story_points: Optional[int] = None
+    assignee: Optional[str] = None
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+class TaskBulkDeleteRequest(BaseModel):
+    ids: List[int]
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[int] = None
+    detail: str
+
+class TaskBulkResponse(BaseModel):
+    items: List[TaskResponse]
+    errors: List[BulkItemError] = []
+
+class TaskBulkDeleteResponse(BaseModel):
+    deleted: List[int]
+    errors: List[BulkItemError] = []
+
+class TaskPage(BaseModel):
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
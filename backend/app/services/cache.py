@@ -0,0 +1,234 @@
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+import asyncio
+import hashlib
+import logging
+import math
+import time
+import orjson
+from redis.exceptions import RedisError
+from app.core.config import settings
+from app.database.redis import redis
+
+logger = logging.getLogger(__name__)
+
+# Önbellekteki payload formatı değişirse artırılır; eski anahtarlar okunmaz, TTL ile düşer
+CACHE_SCHEMA_VERSION = 2
+
+TASKS = "task"
+SPRINTS = "sprint"
+REPORTS = "report"
+
+Loader = Callable[[], Awaitable[Any]]
+
+class CacheMetrics:
+    """Hit/miss sayaçları ve önbellek / kaynak okuma gecikmeleri (worker başına)."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.coalesced = 0
+        self.cache_seconds = 0.0
+        self.load_seconds = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "avg_cache_ms": round(self.cache_seconds * 1000 / lookups, 3) if lookups else None,
+            "avg_load_ms": round(self.load_seconds * 1000 / self.misses, 3) if self.misses else None
+        }
+
+class ReadThroughCache:
+    """
+    Redis üzerinde read-through önbellek.
+    Tekil kayıtlar kendi sürümleriyle, liste sorguları namespace sürümüyle damgalanır;
+    bir yazma INCR ile ilgili anahtarları geçersiz kılar. Yazmadan önce başlamış bir yükleme
+    eski sürümün anahtarına yazar, bayat değer yeni anahtardan okunmaz.
+    """
+
+    def __init__(
+        self,
+        redis_client=redis,
+        ttl: Optional[int] = None,
+        lock_ttl_ms: Optional[int] = None,
+        lock_wait_ms: Optional[int] = None
+    ):
+        self.redis = redis_client
+        self.ttl = ttl or settings.CACHE_TTL_SECONDS
+        self.lock_ttl_ms = lock_ttl_ms or settings.CACHE_LOCK_TTL_MS
+        self.lock_wait = (settings.CACHE_LOCK_WAIT_MS if lock_wait_ms is None else lock_wait_ms) / 1000
+        # Sürüm sayaçları, altlarında yazılmış en uzun ömürlü kayıttan (raporlar) ve bir yüklemeden uzun yaşar
+        self.generation_ttl = max(self.ttl, settings.REPORT_CACHE_TTL_SECONDS) + math.ceil(self.lock_ttl_ms / 1000)
+        self.metrics = CacheMetrics()
+        # Aynı anahtar için process içindeki eşzamanlı kaçırmalar tek yüklemede birleşir
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    def item_key(self, namespace: str, item_id: Any, generation: int = 0) -> str:
+        return f"cache:v{CACHE_SCHEMA_VERSION}:{namespace}:item:{item_id}:g{generation}"
+
+    def _item_generation_key(self, namespace: str, item_id: Any) -> str:
+        # Kayıt başına tek küçük sayaç; yazma ve okumada generation_ttl'e uzatılır, düştüğünde
+        # altındaki kayıtların süresi çoktan dolduğu için sıfırdan başlaması eski değeri geri getirmez
+        return f"cache:v{CACHE_SCHEMA_VERSION}:{namespace}:item:{item_id}:gen"
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"cache:v{CACHE_SCHEMA_VERSION}:{namespace}:gen"
+
+    async def get_item(self, namespace: str, item_id: Any, loader: Loader, ttl: Optional[int] = None) -> Any:
+        """Tekil kaydı önbellekten, yoksa loader'dan okur."""
+        if not self.enabled:
+            return await loader()
+        try:
+            # Okuma sayacın ömrünü de uzatır: bu sürümle yazılacak kayıt sayaçtan önce düşer
+            generation = int(await self.redis.getex(self._item_generation_key(namespace, item_id), ex=self.generation_ttl) or 0)
+        except RedisError as e:
+            self._record_error(e)
+            return await loader()
+        return await self._get_or_load(self.item_key(namespace, item_id, generation), loader, ttl)
+
+    async def peek_item(self, namespace: str, item_id: Any) -> Any:
+        """Tekil kaydı yalnızca önbellekten okur; yoksa None döner."""
+        if not self.enabled:
+            return None
+        try:
+            generation = int(await self.redis.get(self._item_generation_key(namespace, item_id)) or 0)
+        except RedisError as e:
+            self._record_error(e)
+            return None
+        cached = await self._fetch(self.item_key(namespace, item_id, generation))
+        return orjson.loads(cached) if cached is not None else None
+
+    async def get_list(self, namespace: str, params: Dict[str, Any], loader: Loader) -> Any:
+        """Liste sorgusunu parametre hash'i ve güncel namespace sürümüyle anahtarlayıp okur."""
+        if not self.enabled:
+            return await loader()
+        try:
+            generation = int(await self.redis.get(self._generation_key(namespace)) or 0)
+        except RedisError as e:
+            self._record_error(e)
+            return await loader()
+        digest = hashlib.sha1(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        key = f"cache:v{CACHE_SCHEMA_VERSION}:{namespace}:list:g{generation}:{digest}"
+        return await self._get_or_load(key, loader)
+
+    async def invalidate(self, namespace: str, item_ids: Iterable[Any] = ()):
+        """Yazma sonrası: verilen kayıtların ve liste sorgularının sürümünü artırır (eski anahtarlar TTL ile düşer)."""
+        if not self.enabled:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for item_id in item_ids:
+                    key = self._item_generation_key(namespace, item_id)
+                    pipe.incr(key)
+                    pipe.expire(key, self.generation_ttl)
+                pipe.incr(self._generation_key(namespace))
+                await pipe.execute()
+        except RedisError as e:
+            self._record_error(e)
+
+    async def _get_or_load(self, key: str, loader: Loader, ttl: Optional[int] = None) -> Any:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.metrics.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await self._read_through(key, loader, ttl or self.ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Bekleyen yoksa "exception never retrieved" uyarısı basılmasın
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _read_through(self, key: str, loader: Loader, ttl: int) -> Any:
+        cached = await self._fetch(key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        # Process'ler arası stampede koruması: yalnızca kilidi alan kaynaktan yükler
+        lock_key = f"{key}:lock"
+        try:
+            locked = await self.redis.set(lock_key, "1", nx=True, px=self.lock_ttl_ms)
+        except RedisError as e:
+            self._record_error(e)
+            locked = False
+
+        if not locked:
+            cached = await self._wait_for_fill(key)
+            if cached is not None:
+                return orjson.loads(cached)
+
+        try:
+            start = time.perf_counter()
+            value = await loader()
+            self.metrics.load_seconds += time.perf_counter() - start
+            if value is not None:
+                try:
+                    await self.redis.set(key, orjson.dumps(value), ex=ttl)
+                except RedisError as e:
+                    self._record_error(e)
+            return value
+        finally:
+            if locked:
+                try:
+                    await self.redis.delete(lock_key)
+                except RedisError as e:
+                    self._record_error(e)
+
+    async def _fetch(self, key: str) -> Optional[bytes]:
+        start = time.perf_counter()
+        try:
+            cached = await self.redis.get(key)
+        except RedisError as e:
+            self._record_error(e)
+            cached = None
+        self.metrics.cache_seconds += time.perf_counter() - start
+        if cached is None:
+            self.metrics.misses += 1
+        else:
+            self.metrics.hits += 1
+        return cached
+
+    async def _wait_for_fill(self, key: str) -> Optional[bytes]:
+        """Kilidi başka bir process tutarken değerin yazılmasını kısa bir süre bekler."""
+        deadline = time.monotonic() + self.lock_wait
+        delay = 0.005
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.05)
+            try:
+                cached = await self.redis.get(key)
+            except RedisError as e:
+                self._record_error(e)
+                return None
+            if cached is not None:
+                return cached
+        return None
+
+    def _record_error(self, error: Exception):
+        self.metrics.errors += 1
+        logger.warning("Redis önbellek hatası, veritabanına düşülüyor: %s", error)
+
+cache = ReadThroughCache()
+
+def get_cache() -> ReadThroughCache:
+    return cache
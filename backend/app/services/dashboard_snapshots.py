@@ -0,0 +1,242 @@
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from datetime import datetime
+import asyncio
+import hashlib
+import logging
+import time
+import orjson
+from redis.exceptions import WatchError
+from app.core.config import settings
+from app.database.redis import redis
+
+logger = logging.getLogger(__name__)
+
+# Snapshot formatı değişirse artırılır; eski snapshot'lar okunmaz, yeniden hesaplanır
+DASHBOARD_SCHEMA_VERSION = 2
+
+PROJECTS_KEY = "dashboards:projects"  # project_id -> project_data (JSON)
+DIRTY_KEY = "dashboards:dirty"  # değişen projeler, skor: son değişiklik zamanı (ms)
+
+DashboardBuilder = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# Yalnızca daha yeni sürüm yazılır: geç biten eski bir hesaplama yeni snapshot'ı ezmez.
+# İçerik (digest) aynıysa yalnızca sürüm ilerler; dashboard, generated_at ve ETag korunur.
+_SAVE_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'version') or '0')
+if tonumber(ARGV[1]) <= current then return 0 end
+if redis.call('HGET', KEYS[1], 'digest') == ARGV[5] then
+  redis.call('HSET', KEYS[1], 'version', ARGV[1])
+else
+  redis.call('HSET', KEYS[1], 'version', ARGV[1], 'generated_at', ARGV[2], 'dashboard', ARGV[3], 'digest', ARGV[5])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+# Son değişikliğin üzerinden debounce süresi geçmiş projeleri alır (birden çok scheduler'da tek alıcı)
+_TAKE_DIRTY_SCRIPT = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, id in ipairs(ids) do
+  redis.call('ZREM', KEYS[1], id)
+end
+return ids
+"""
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def _encode(value: Any) -> bytes:
+    return orjson.dumps(value, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def dashboard_digest(dashboard: Dict[str, Any]) -> str:
+    """Üretim zamanı hariç dashboard içeriğinin hash'i; içerik değişmedikçe aynı kalır."""
+    metadata = dashboard.get("dashboard_metadata")
+    if isinstance(metadata, dict):
+        dashboard = {**dashboard, "dashboard_metadata": {k: v for k, v in metadata.items() if k != "generated_at"}}
+    return hashlib.sha1(_encode(dashboard)).hexdigest()
+
+class DashboardSnapshotStore:
+    """
+    Önceden hesaplanmış dashboard'lar proje başına tek bir Redis hash'inde, sürüm sayacı,
+    yazılan sürüm ve içerik digest'iyle birlikte tutulur; okuma tek HGETALL'dır.
+
+    Snapshot yalnızca kayıtlı proje verisinden üretilir: veri PUT ile (tamamı) ya da
+    değişiklik olayıyla (değişen alanlar) güncellenmedikçe yeniden hesaplama aynı içeriği verir.
+    """
+
+    def __init__(self, redis_client=redis):
+        self.redis = redis_client
+        self._save = self.redis.register_script(_SAVE_SCRIPT)
+        self._take_dirty = self.redis.register_script(_TAKE_DIRTY_SCRIPT)
+
+    def snapshot_key(self, project_id: Any) -> str:
+        return f"dashboard:v{DASHBOARD_SCHEMA_VERSION}:{project_id}"
+
+    async def get(self, project_id: Any) -> Optional[Dict[str, Any]]:
+        """Snapshot'ı döner; dashboard alanı ham JSON metnidir, yeniden çözülmez."""
+        data = await self.redis.hgetall(self.snapshot_key(project_id))
+        # İlk hesaplama sürerken hash'te yalnızca sürüm sayacı bulunur
+        if "dashboard" not in data:
+            return None
+        return {
+            "version": int(data["version"]),
+            "generated_at": data["generated_at"],
+            "digest": data["digest"],
+            "dashboard": data["dashboard"]
+        }
+
+    async def register_project(self, project_data: Dict[str, Any]):
+        """Proje verisini kaydeder (ya da günceller) ve yeniden hesaplama ister."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(PROJECTS_KEY, str(project_data["id"]), orjson.dumps(project_data, default=_json_default))
+            pipe.zadd(DIRTY_KEY, {str(project_data["id"]): int(time.time() * 1000)})
+            await pipe.execute()
+
+    async def mark_changed(self, project_id: Any, changes: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Veri değişikliği olayı: verilen alanları kayıtlı proje verisine işler ve yeniden hesaplama
+        ister. Proje kayıtlı değilse False.
+        """
+        project_id = str(project_id)
+        if not changes:
+            if not await self.redis.hexists(PROJECTS_KEY, project_id):
+                return False
+            await self.redis.zadd(DIRTY_KEY, {project_id: int(time.time() * 1000)})
+            return True
+
+        # Eşzamanlı olaylar birbirinin alanlarını ezmesin diye iyimser kilit (WATCH) ile birleştirilir
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(PROJECTS_KEY)
+                    raw = await pipe.hget(PROJECTS_KEY, project_id)
+                    if raw is None:
+                        await pipe.unwatch()
+                        return False
+                    current = orjson.loads(raw)
+                    project_data = {**current, **changes, "id": current["id"]}
+                    pipe.multi()
+                    pipe.hset(PROJECTS_KEY, project_id, orjson.dumps(project_data, default=_json_default))
+                    pipe.zadd(DIRTY_KEY, {project_id: int(time.time() * 1000)})
+                    await pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+
+    async def load_project(self, project_id: Any) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.hget(PROJECTS_KEY, str(project_id))
+        return orjson.loads(raw) if raw is not None else None
+
+    async def load_projects(self) -> List[Dict[str, Any]]:
+        return [orjson.loads(raw) for raw in (await self.redis.hgetall(PROJECTS_KEY)).values()]
+
+    async def take_dirty(self, settle_seconds: float, limit: int = 100) -> List[str]:
+        cutoff = int((time.time() - settle_seconds) * 1000)
+        return await self._take_dirty(keys=[DIRTY_KEY], args=[cutoff, limit])
+
+    async def next_version(self, project_id: Any) -> int:
+        # Sayaç snapshot hash'inde tutulur, snapshot'la birlikte süresi dolar
+        key = self.snapshot_key(project_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hincrby(key, "seq", 1)
+            pipe.expire(key, settings.DASHBOARD_SNAPSHOT_TTL_SECONDS)
+            version, _ = await pipe.execute()
+        return version
+
+    async def save(self, project_id: Any, version: int, dashboard: Dict[str, Any]) -> bool:
+        return bool(await self._save(
+            keys=[self.snapshot_key(project_id)],
+            args=[
+                version, datetime.utcnow().isoformat(), _encode(dashboard),
+                settings.DASHBOARD_SNAPSHOT_TTL_SECONDS, dashboard_digest(dashboard)
+            ]
+        ))
+
+class DashboardSnapshotScheduler:
+    """
+    Kayıtlı projelerin dashboard'larını belirli aralıklarla ve veri değişikliği
+    olaylarından sonra (olaylar debounce süresi kadar durulunca) yeniden hesaplar.
+    """
+
+    def __init__(
+        self,
+        store: DashboardSnapshotStore,
+        build_dashboard: DashboardBuilder,
+        interval_seconds: Optional[float] = None,
+        debounce_seconds: Optional[float] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.store = store
+        self.build_dashboard = build_dashboard
+        self.interval = settings.DASHBOARD_REFRESH_INTERVAL_SECONDS if interval_seconds is None else interval_seconds
+        self.debounce = settings.DASHBOARD_EVENT_DEBOUNCE_SECONDS if debounce_seconds is None else debounce_seconds
+        self._slots = asyncio.Semaphore(concurrency or settings.DASHBOARD_SCHEDULER_CONCURRENCY)
+        self._refreshing: Set[str] = set()
+        self._stopping = asyncio.Event()
+
+    async def refresh(self, project_data: Dict[str, Any]) -> Optional[int]:
+        """Projenin snapshot'ını üretir; yazılan sürümü döner (daha yenisi varsa None)."""
+        project_id = str(project_data["id"])
+        if project_id in self._refreshing:
+            # Süren hesaplama eski veriyi görmüş olabilir; bir sonraki turda tekrar
+            await self.store.mark_changed(project_id)
+            return None
+        self._refreshing.add(project_id)
+        try:
+            async with self._slots:
+                # Sürüm hesaplamadan önce alınır ki sonradan başlayan hesaplama kazansın
+                version = await self.store.next_version(project_id)
+                dashboard = await self.build_dashboard(project_data)
+                if not await self.store.save(project_id, version, dashboard):
+                    return None
+                return version
+        finally:
+            self._refreshing.discard(project_id)
+
+    async def refresh_all(self) -> int:
+        projects = await self.store.load_projects()
+        results = await asyncio.gather(*(self.refresh(p) for p in projects), return_exceptions=True)
+        self._log_failures(projects, results)
+        return sum(1 for result in results if isinstance(result, int))
+
+    async def refresh_dirty(self) -> int:
+        projects = []
+        for project_id in await self.store.take_dirty(self.debounce):
+            project_data = await self.store.load_project(project_id)
+            if project_data is not None:
+                projects.append(project_data)
+        results = await asyncio.gather(*(self.refresh(p) for p in projects), return_exceptions=True)
+        self._log_failures(projects, results)
+        return sum(1 for result in results if isinstance(result, int))
+
+    def stop(self):
+        self._stopping.set()
+
+    async def run(self, poll_seconds: float = 1.0):
+        """Periyodik tam yenileme ve değişen projeleri izleyen döngü."""
+        next_full = time.monotonic()
+        while not self._stopping.is_set():
+            try:
+                if time.monotonic() >= next_full:
+                    next_full = time.monotonic() + self.interval
+                    refreshed = await self.refresh_all()
+                    logger.info("Dashboard snapshot'ları yenilendi (%s proje)", refreshed)
+                await self.refresh_dirty()
+            except Exception:
+                logger.exception("Dashboard snapshot turu başarısız")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def _log_failures(self, projects: List[Dict[str, Any]], results: List[Any]):
+        for project_data, result in zip(projects, results):
+            if isinstance(result, Exception):
+                logger.error("Proje %s dashboard'u üretilemedi: %s", project_data.get("id"), result)
+
+dashboard_store = DashboardSnapshotStore()
+
+def get_dashboard_store() -> DashboardSnapshotStore:
+    return dashboard_store
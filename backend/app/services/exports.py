@@ -0,0 +1,182 @@
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
+import io
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Table, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.config import settings
+from app.models.task import Task
+from app.models.sprint import Sprint
+
+ARROW = "arrow"
+PARQUET = "parquet"
+MEDIA_TYPES = {
+    ARROW: "application/vnd.apache.arrow.stream",
+    PARQUET: "application/vnd.apache.parquet"
+}
+FILE_EXTENSIONS = {ARROW: "arrows", PARQUET: "parquet"}
+
+# Kolon tipleri açıkça verilir: boş ya da tamamı NULL batch'lerde de şema sabit kalır
+TASK_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("title", pa.string()),
+    ("description", pa.string()),
+    ("status", pa.dictionary(pa.int8(), pa.string())),
+    ("priority", pa.dictionary(pa.int8(), pa.string())),
+    ("story_points", pa.int32()),
+    ("assignee", pa.string()),
+    ("acceptance_criteria", pa.list_(pa.string())),
+    ("sprint_id", pa.int64()),
+    ("version", pa.int32()),
+    ("created_at", pa.timestamp("us")),
+    ("updated_at", pa.timestamp("us"))
+])
+
+SPRINT_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("name", pa.string()),
+    ("goal", pa.string()),
+    ("status", pa.dictionary(pa.int8(), pa.string())),
+    ("velocity", pa.float64()),
+    ("start_date", pa.timestamp("us")),
+    ("end_date", pa.timestamp("us")),
+    ("created_at", pa.timestamp("us")),
+    ("updated_at", pa.timestamp("us"))
+])
+
+EXPORT_TABLES = {
+    "tasks": (Task.__table__, TASK_SCHEMA),
+    "sprints": (Sprint.__table__, SPRINT_SCHEMA)
+}
+
+def project_schema(schema: pa.Schema, columns: Optional[Sequence[str]]) -> pa.Schema:
+    """İstenen kolonlarla şemayı daraltır; bilinmeyen kolon için ValueError."""
+    if not columns:
+        return schema
+    unknown = set(columns) - set(schema.names)
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+    return pa.schema([schema.field(name) for name in dict.fromkeys(columns)])
+
+def _column_values(field: pa.Field, values: List[Any]) -> pa.Array:
+    if pa.types.is_list(field.type):
+        values = [[str(item) for item in value] if isinstance(value, list) else None for value in values]
+    return pa.array(values, type=field.type)
+
+def rows_to_batch(schema: pa.Schema, rows: Sequence[Any]) -> pa.RecordBatch:
+    columns = list(zip(*rows)) if rows else [[] for _ in schema]
+    return pa.RecordBatch.from_arrays(
+        [_column_values(field, list(values)) for field, values in zip(schema, columns)],
+        schema=schema
+    )
+
+async def iter_table_batches(
+    session_factory: async_sessionmaker,
+    table: Table,
+    schema: pa.Schema,
+    criteria: Iterable[Any] = (),
+    batch_rows: Optional[int] = None
+) -> AsyncIterator[pa.RecordBatch]:
+    """
+    Tabloyu id üzerinde keyset sayfalama ile batch batch okur; tüm sonuç belleğe alınmaz.
+    Her batch kısa bir sorgudur, bağlantı export boyunca tutulmaz.
+    """
+    batch_rows = batch_rows or settings.EXPORT_BATCH_ROWS
+    criteria = list(criteria)
+    columns = [table.c[name] for name in schema.names]
+    last_id = None
+    while True:
+        # Keyset için id her zaman seçilir, projeksiyonda yoksa sonda atılır
+        query = select(*columns, table.c.id).where(*criteria).order_by(table.c.id).limit(batch_rows)
+        if last_id is not None:
+            query = query.where(table.c.id > last_id)
+        async with session_factory() as session:
+            rows = (await session.execute(query)).all()
+        if not rows:
+            return
+        last_id = rows[-1][-1]
+        yield rows_to_batch(schema, [row[:-1] for row in rows])
+        if len(rows) < batch_rows:
+            return
+
+def issues_table(report: Dict[str, Any], columns: Optional[Sequence[str]] = None) -> pa.Table:
+    """
+    Sprint raporundaki ham issue listesini tabloya çevirir; iç içe alanlar struct/list olarak kalır.
+    Rapor özeti ve takım verisi şema metadata'sında taşınır.
+    """
+    raw = report.get("raw", {})
+    table = pa.Table.from_pylist(raw.get("issues") or [])
+    if columns:
+        unknown = set(columns) - set(table.column_names)
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+        table = table.select(list(dict.fromkeys(columns)))
+    return table.replace_schema_metadata({
+        "summary": report.get("summary") or "",
+        "team_data": orjson.dumps(raw.get("team_data")),
+        "velocity_reference": str(raw.get("velocity_reference", ""))
+    })
+
+async def _single_table(table: pa.Table) -> AsyncIterator[pa.RecordBatch]:
+    for batch in table.to_batches(max_chunksize=settings.EXPORT_BATCH_ROWS):
+        yield batch
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Yazılan baytları bir sonraki boşaltmaya kadar biriktirir. Konum (tell) boşaltmadan
+    etkilenmez; Parquet footer'ındaki row group offset'leri doğru kalır.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+async def encode_batches(
+    batches: AsyncIterator[pa.RecordBatch],
+    schema: pa.Schema,
+    fmt: str
+) -> AsyncIterator[bytes]:
+    """
+    Batch'leri Arrow IPC stream ya da Parquet olarak kodlar ve her batch'ten sonra
+    yazılan baytları döner; yanıt tamamı üretilmeden akmaya başlar.
+    """
+    sink = _ChunkSink()
+    if fmt == ARROW:
+        writer = pa.ipc.new_stream(sink, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+        write = writer.write_batch
+    elif fmt == PARQUET:
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+        write = writer.write_batch
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    try:
+        async for batch in batches:
+            if batch.num_rows:
+                write(batch)
+                chunk = sink.drain()
+                if chunk:
+                    yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+def table_stream(table: pa.Table, fmt: str) -> AsyncIterator[bytes]:
+    return encode_batches(_single_table(table), table.schema, fmt)
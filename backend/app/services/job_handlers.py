@@ -0,0 +1,36 @@
+from typing import Any, Dict
+from app.services.jobs import JobContext, job_handler
+
+# Uzun süren analizler: HTTP yolundan çıkarılıp worker'larda çalışır
+
+@job_handler("sprint_report")
+async def sprint_report(payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """POST /reports/sprint ile aynı girdiyle LLM sprint raporu."""
+    from app.services.report_engine import generate_sprint_report
+    return await generate_sprint_report(
+        team_data=payload["team_data"],
+        issues=payload["issues"],
+        historical_velocity=payload.get("historical_velocity", 0.0)
+    )
+
+@job_handler("comprehensive_report")
+async def comprehensive_report(payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """Use case üzerinden kapsamlı sprint raporu; iş kendi veritabanı session'ını açar."""
+    from app.core.domain.use_cases.ai_product_owner_use_case import AIProductOwnerUseCase
+    from app.database.database import AsyncSessionLocal
+    from app.database.repositories import SqlRepositories
+
+    async with AsyncSessionLocal() as session:
+        use_case = AIProductOwnerUseCase(**SqlRepositories(session).as_kwargs())
+        return await use_case.generate_comprehensive_report(payload["sprint_id"])
+
+@job_handler("story_point_model_refit")
+async def story_point_model_refit(payload: Dict[str, Any], context: JobContext) -> Dict[str, Any]:
+    """Story point modelini tamamlanmış story'lerle yeniden eğitir; yeterli yeni örnek yoksa atlar."""
+    from app.core.services.story_point_predictor import get_story_point_predictor
+    from app.database.database import AsyncSessionLocal
+
+    predictor = get_story_point_predictor()
+    async with AsyncSessionLocal() as session:
+        refitted = await predictor.refresh(session, force=payload.get("force", False))
+    return {"refitted": refitted, **predictor.info()}
@@ -0,0 +1,281 @@
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from datetime import datetime
+import time
+import uuid
+import orjson
+from pydantic import BaseModel
+from app.core.config import settings
+from app.database.redis import redis
+
+JOB_PRIORITIES = {"high": 0, "normal": 1, "low": 2}
+
+QUEUE_KEY = "jobs:queue"  # hazır işler, skor: öncelik + kuyruğa giriş zamanı
+DELAYED_KEY = "jobs:delayed"  # yeniden denemeyi bekleyen işler, skor: hazır olma zamanı (ms)
+RUNNING_KEY = "jobs:running"  # çalışan işler, skor: lease bitişi (ms)
+JOB_KEY_PREFIX = "job:"
+
+# Bir önceliğin tüm işleri bir sonrakinden önce gelir; aynı öncelikte FIFO
+_PRIORITY_SPAN = 10 ** 13
+
+JobHandler = Callable[[Dict[str, Any], "JobContext"], Awaitable[Any]]
+_handlers: Dict[str, JobHandler] = {}
+
+def job_handler(job_type: str):
+    """Bir fonksiyonu verilen iş tipinin işleyicisi olarak kaydeder."""
+    def register(fn: JobHandler) -> JobHandler:
+        _handlers[job_type] = fn
+        return fn
+    return register
+
+def get_job_handler(job_type: str) -> Optional[JobHandler]:
+    return _handlers.get(job_type)
+
+def registered_job_types():
+    return sorted(_handlers)
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+def _queue_score(priority_rank: int, enqueued_ms: int) -> int:
+    return priority_rank * _PRIORITY_SPAN + enqueued_ms
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+# Kuyruktan en öncelikli işi alır ve lease ile "running" durumuna geçirir (atomik)
+_CLAIM_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1])
+if #popped == 0 then return nil end
+local id = popped[1]
+local key = ARGV[3] .. id
+redis.call('ZADD', KEYS[2], ARGV[1], id)
+redis.call('HSET', key, 'status', 'running', 'started_at', ARGV[2])
+redis.call('HINCRBY', key, 'attempts', 1)
+return id
+"""
+
+# Zamanı gelen yeniden denemeleri ve lease'i dolmuş (worker'ı ölmüş) işleri kuyruğa geri koyar
+_PROMOTE_SCRIPT = """
+local moved = 0
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 100)
+for _, id in ipairs(due) do
+  redis.call('ZREM', KEYS[1], id)
+  local rank = tonumber(redis.call('HGET', ARGV[2] .. id, 'priority_rank') or '1')
+  redis.call('ZADD', KEYS[3], rank * ARGV[3] + ARGV[1], id)
+  redis.call('HSET', ARGV[2] .. id, 'status', 'queued')
+  moved = moved + 1
+end
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1], 'LIMIT', 0, 100)
+for _, id in ipairs(expired) do
+  redis.call('ZREM', KEYS[2], id)
+  local key = ARGV[2] .. id
+  local attempts = tonumber(redis.call('HGET', key, 'attempts') or '0')
+  local max_attempts = tonumber(redis.call('HGET', key, 'max_attempts') or '1')
+  if redis.call('HGET', key, 'cancel_requested') == '1' then
+    redis.call('HSET', key, 'status', 'cancelled', 'finished_at', ARGV[4])
+    redis.call('EXPIRE', key, ARGV[5])
+  elseif attempts >= max_attempts then
+    redis.call('HSET', key, 'status', 'failed', 'error', 'worker lease expired', 'finished_at', ARGV[4])
+    redis.call('EXPIRE', key, ARGV[5])
+  else
+    local rank = tonumber(redis.call('HGET', key, 'priority_rank') or '1')
+    redis.call('ZADD', KEYS[3], rank * ARGV[3] + ARGV[1], id)
+    redis.call('HSET', key, 'status', 'queued')
+  end
+  moved = moved + 1
+end
+return moved
+"""
+
+class JobContext:
+    """İşleyiciye verilen bağlam: iş bilgisi ve iptal kontrolü."""
+
+    def __init__(self, queue: "JobQueue", job_id: str, attempt: int):
+        self.queue = queue
+        self.job_id = job_id
+        self.attempt = attempt
+
+    async def cancel_requested(self) -> bool:
+        return await self.queue.is_cancel_requested(self.job_id)
+
+class JobQueue:
+    """
+    Redis üzerinde öncelikli iş kuyruğu.
+    İş durumu job:{id} hash'inde, sonuç TTL'li job:{id}:result anahtarında tutulur.
+    """
+
+    def __init__(self, redis_client=redis):
+        self.redis = redis_client
+        self._claim = self.redis.register_script(_CLAIM_SCRIPT)
+        self._promote = self.redis.register_script(_PROMOTE_SCRIPT)
+
+    async def submit(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        priority: str = "normal",
+        max_attempts: Optional[int] = None,
+        result_ttl: Optional[int] = None
+    ) -> str:
+        if get_job_handler(job_type) is None:
+            raise ValueError(f"Unknown job type: {job_type}")
+        if priority not in JOB_PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        job_id = uuid.uuid4().hex
+        now_ms = _now_ms()
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(job_id), mapping={
+                "id": job_id,
+                "type": job_type,
+                "payload": orjson.dumps(payload, default=_json_default),
+                "status": "queued",
+                "priority": priority,
+                "priority_rank": JOB_PRIORITIES[priority],
+                "attempts": 0,
+                "max_attempts": max_attempts or settings.JOB_MAX_ATTEMPTS,
+                "result_ttl": result_ttl or settings.JOB_RESULT_TTL_SECONDS,
+                "created_at": datetime.utcnow().isoformat()
+            })
+            pipe.zadd(QUEUE_KEY, {job_id: _queue_score(JOB_PRIORITIES[priority], now_ms)})
+            await pipe.execute()
+        return job_id
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """İşin durumunu döner (payload hariç); yoksa None."""
+        data = await self.redis.hgetall(self._key(job_id))
+        if not data:
+            return None
+        return {
+            "id": data["id"],
+            "type": data["type"],
+            "status": data["status"],
+            "priority": data["priority"],
+            "attempts": int(data.get("attempts", 0)),
+            "max_attempts": int(data["max_attempts"]),
+            "error": data.get("error"),
+            "cancel_requested": data.get("cancel_requested") == "1",
+            "created_at": data["created_at"],
+            "started_at": data.get("started_at"),
+            "finished_at": data.get("finished_at")
+        }
+
+    async def get_result(self, job_id: str) -> Tuple[bool, Any]:
+        """(bulundu mu, sonuç) döner; sonuç TTL'i dolmuşsa bulunamaz."""
+        raw = await self.redis.get(self._result_key(job_id))
+        if raw is None:
+            return False, None
+        return True, orjson.loads(raw)
+
+    async def cancel(self, job_id: str) -> Optional[str]:
+        """Kuyruktaki işi hemen iptal eder, çalışan iş için iptal ister. Yeni durumu döner."""
+        key = self._key(job_id)
+        status = await self.redis.hget(key, "status")
+        if status is None:
+            return None
+        if status in ("queued", "retrying"):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.zrem(QUEUE_KEY, job_id)
+                pipe.zrem(DELAYED_KEY, job_id)
+                removed = await pipe.execute()
+            if any(removed):
+                await self._finish(job_id, "cancelled")
+                return "cancelled"
+            # Bu arada bir worker almış olabilir
+            status = await self.redis.hget(key, "status")
+        if status == "running":
+            await self.redis.hset(key, "cancel_requested", 1)
+        return status
+
+    async def is_cancel_requested(self, job_id: str) -> bool:
+        return await self.redis.hget(self._key(job_id), "cancel_requested") == "1"
+
+    # Worker tarafı
+
+    async def promote(self) -> int:
+        """Zamanı gelen yeniden denemeleri ve süresi dolmuş lease'leri kuyruğa taşır."""
+        return await self._promote(
+            keys=[DELAYED_KEY, RUNNING_KEY, QUEUE_KEY],
+            args=[
+                _now_ms(), JOB_KEY_PREFIX, _PRIORITY_SPAN,
+                datetime.utcnow().isoformat(), settings.JOB_RESULT_TTL_SECONDS
+            ]
+        )
+
+    async def claim(self) -> Optional[Dict[str, Any]]:
+        """Sıradaki işi lease ile alır; iş yoksa None."""
+        job_id = await self._claim(
+            keys=[QUEUE_KEY, RUNNING_KEY],
+            args=[self._lease_deadline(), datetime.utcnow().isoformat(), JOB_KEY_PREFIX]
+        )
+        if job_id is None:
+            return None
+        data = await self.redis.hgetall(self._key(job_id))
+        return {
+            "id": job_id,
+            "type": data["type"],
+            "payload": orjson.loads(data["payload"]),
+            "attempts": int(data["attempts"]),
+            "max_attempts": int(data["max_attempts"]),
+            "result_ttl": int(data["result_ttl"])
+        }
+
+    async def extend_lease(self, job_id: str) -> bool:
+        """Lease'i uzatır; iş artık bu worker'da değilse False."""
+        return bool(await self.redis.zadd(RUNNING_KEY, {job_id: self._lease_deadline()}, xx=True, ch=True))
+
+    async def complete(self, job: Dict[str, Any], result: Any) -> bool:
+        if not await self._release(job["id"]):
+            return False
+        await self.redis.set(
+            self._result_key(job["id"]), orjson.dumps(result, default=_json_default), ex=job["result_ttl"]
+        )
+        await self._finish(job["id"], "succeeded", ttl=job["result_ttl"])
+        return True
+
+    async def fail(self, job: Dict[str, Any], error: str) -> str:
+        """Deneme hakkı varsa geri çekilmeli olarak yeniden planlar, yoksa failed yapar."""
+        if not await self._release(job["id"]):
+            return "lost"
+        if job["attempts"] < job["max_attempts"] and not await self.is_cancel_requested(job["id"]):
+            backoff_ms = settings.JOB_RETRY_BACKOFF_SECONDS * 1000 * 2 ** (job["attempts"] - 1)
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(self._key(job["id"]), mapping={"status": "retrying", "error": error})
+                pipe.zadd(DELAYED_KEY, {job["id"]: _now_ms() + backoff_ms})
+                await pipe.execute()
+            return "retrying"
+        await self._finish(job["id"], "failed", error=error, ttl=job["result_ttl"])
+        return "failed"
+
+    async def mark_cancelled(self, job: Dict[str, Any]):
+        if await self._release(job["id"]):
+            await self._finish(job["id"], "cancelled", ttl=job["result_ttl"])
+
+    async def _release(self, job_id: str) -> bool:
+        # Lease başka bir worker'a geçtiyse bu worker'ın sonucu yazılmaz
+        return bool(await self.redis.zrem(RUNNING_KEY, job_id))
+
+    async def _finish(self, job_id: str, status: str, error: Optional[str] = None, ttl: Optional[int] = None):
+        fields = {"status": status, "finished_at": datetime.utcnow().isoformat()}
+        if error is not None:
+            fields["error"] = error
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(job_id), mapping=fields)
+            pipe.expire(self._key(job_id), ttl or settings.JOB_RESULT_TTL_SECONDS)
+            await pipe.execute()
+
+    def _lease_deadline(self) -> int:
+        return _now_ms() + settings.JOB_LEASE_SECONDS * 1000
+
+    def _key(self, job_id: str) -> str:
+        return f"{JOB_KEY_PREFIX}{job_id}"
+
+    def _result_key(self, job_id: str) -> str:
+        return f"{JOB_KEY_PREFIX}{job_id}:result"
+
+job_queue = JobQueue()
+
+def get_job_queue() -> JobQueue:
+    return job_queue
@@ -0,0 +1,302 @@
+"""
+Task olay günlüğü: yazma yollarında (tasks router, domain repository) geçişler aynı transaction
+içinde kaydedilir, sprint durum toplamları artımlı güncellenir. Burndown, kümülatif akış ve
+cycle time yalnızca ilgili sprint'in olaylarından, (sprint_id, ts) indeksiyle hesaplanır.
+Puanlı task'ların DONE geçişleri commit'ten sonra story point modeline yeni örnek olarak bildirilir.
+"""
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from sqlalchemy import case, event, select, update, insert, delete, func, exists, literal, null
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.services.sprint_metrics import DONE_STATUSES, IN_PROGRESS_STATUSES
+from app.models.task import Task
+from app.models.task_event import TaskEvent, SprintStatusTotal
+
+# Olay üreten task alanları; diğer alanlardaki değişiklikler günlüğe yazılmaz
+TRACKED_FIELDS = frozenset({"sprint_id", "status", "story_points"})
+
+# Önbellekte sprint başına tutulan görünümler (SPRINTS namespace'inde "{sprint_id}:{görünüm}")
+SPRINT_VIEWS = ("status", "metrics", "burndown", "cumulative_flow", "cycle_time")
+
+WORKFLOW_ORDER = ("TODO",) + IN_PROGRESS_STATUSES + DONE_STATUSES
+
+_UPSERT_DIALECTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Transaction içinde DONE'a geçen puanlı task sayısı (session.info'da, commit'te bildirilir)
+_COMPLETED_KEY = "task_events.completed"
+
+class TaskState(NamedTuple):
+    sprint_id: Optional[int]
+    status: Optional[str]
+    points: Optional[int]
+
+def task_state(task: Any) -> TaskState:
+    """ORM nesnesi ya da satır mapping'inden olayda kullanılan alanları okur."""
+    if isinstance(task, Mapping):
+        return TaskState(task.get("sprint_id"), task.get("status"), task.get("story_points"))
+    return TaskState(task.sprint_id, task.status, task.story_points)
+
+def sprint_view_keys(sprint_ids: Iterable[int]) -> List[str]:
+    return [f"{sprint_id}:{view}" for sprint_id in sprint_ids for view in SPRINT_VIEWS]
+
+async def load_task_states(session: AsyncSession, task_ids: Iterable[int], for_update: bool = False) -> Dict[int, TaskState]:
+    """Yazmadan önceki durum; for_update ile satırlar transaction sonuna kadar kilitlenir."""
+    ids = list(task_ids)
+    if not ids:
+        return {}
+    query = select(Task.id, Task.sprint_id, Task.status, Task.story_points).where(Task.id.in_(ids))
+    if for_update:
+        query = query.with_for_update()
+    return {row.id: TaskState(row.sprint_id, row.status, row.story_points) for row in await session.execute(query)}
+
+def _transitions(task_id: int, before: Optional[TaskState], after: Optional[TaskState], ts: datetime) -> List[Dict[str, Any]]:
+    if before == after:
+        return []
+    if before is not None and after is not None and before.sprint_id == after.sprint_id:
+        return [{
+            "task_id": task_id, "sprint_id": after.sprint_id, "ts": ts,
+            "from_status": before.status, "to_status": after.status,
+            "from_points": before.points, "to_points": after.points
+        }]
+    # Sprint değişti (ya da task oluşturuldu / silindi): eski sprint'ten çıkış, yenisine giriş
+    events = []
+    if before is not None:
+        events.append({
+            "task_id": task_id, "sprint_id": before.sprint_id, "ts": ts,
+            "from_status": before.status, "to_status": None,
+            "from_points": before.points, "to_points": None
+        })
+    if after is not None:
+        events.append({
+            "task_id": task_id, "sprint_id": after.sprint_id, "ts": ts,
+            "from_status": None, "to_status": after.status,
+            "from_points": None, "to_points": after.points
+        })
+    return events
+
+async def record_task_changes(
+    session: AsyncSession,
+    before: Mapping[int, TaskState],
+    after: Mapping[int, TaskState],
+    ts: Optional[datetime] = None
+) -> Set[int]:
+    """
+    Yazmadan önceki ve sonraki durumlardan olayları üretir, tek executemany INSERT ile ekler ve
+    sprint toplamlarını günceller. Commit çağıranındır. Etkilenen sprint id'lerini döner.
+    before'da olup after'da olmayan task silinmiş, tersi yeni oluşturulmuş sayılır.
+    """
+    ts = ts or datetime.utcnow()
+    completed = sum(
+        1 for task_id, state in after.items()
+        if state.status in DONE_STATUSES and state.points is not None
+        and (before.get(task_id) is None or before[task_id].status not in DONE_STATUSES)
+    )
+    if completed:
+        session.info[_COMPLETED_KEY] = session.info.get(_COMPLETED_KEY, 0) + completed
+    events = [
+        event
+        for task_id in dict.fromkeys([*before, *after])
+        for event in _transitions(task_id, before.get(task_id), after.get(task_id), ts)
+    ]
+    if not events:
+        return set()
+    await session.execute(insert(TaskEvent), events)
+
+    deltas: Dict[Tuple[int, str], List[int]] = {}
+    for event in events:
+        if event["sprint_id"] is None:
+            continue
+        if event["from_status"] is not None:
+            delta = deltas.setdefault((event["sprint_id"], event["from_status"]), [0, 0])
+            delta[0] -= 1
+            delta[1] -= event["from_points"] or 0
+        if event["to_status"] is not None:
+            delta = deltas.setdefault((event["sprint_id"], event["to_status"]), [0, 0])
+            delta[0] += 1
+            delta[1] += event["to_points"] or 0
+    await _apply_totals(session, deltas)
+    return {event["sprint_id"] for event in events if event["sprint_id"] is not None}
+
+@event.listens_for(Session, "after_commit")
+def _notify_completed(session: Session):
+    """Commit edilen DONE geçişlerini story point modeline bildirir (yeterince birikince yeniden eğitilir)."""
+    completed = session.info.pop(_COMPLETED_KEY, 0)
+    if completed:
+        from app.core.services.story_point_predictor import get_story_point_predictor
+        get_story_point_predictor().note_completed(completed)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_completed(session: Session):
+    session.info.pop(_COMPLETED_KEY, None)
+
+async def _apply_totals(session: AsyncSession, deltas: Dict[Tuple[int, str], List[int]]):
+    # Sabit sıra: eşzamanlı transaction'lar satırları aynı sırayla kilitler
+    rows = [
+        {"sprint_id": sprint_id, "status": status, "task_count": count, "points": points}
+        for (sprint_id, status), (count, points) in sorted(deltas.items())
+        if count or points
+    ]
+    if not rows:
+        return
+    upsert = _UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+    if upsert is not None:
+        stmt = upsert(SprintStatusTotal)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SprintStatusTotal.sprint_id, SprintStatusTotal.status],
+            set_={
+                "task_count": SprintStatusTotal.task_count + stmt.excluded.task_count,
+                "points": SprintStatusTotal.points + stmt.excluded.points
+            }
+        )
+        await session.execute(stmt, rows)
+        return
+    for row in rows:
+        result = await session.execute(
+            update(SprintStatusTotal)
+            .where(SprintStatusTotal.sprint_id == row["sprint_id"], SprintStatusTotal.status == row["status"])
+            .values(
+                task_count=SprintStatusTotal.task_count + row["task_count"],
+                points=SprintStatusTotal.points + row["points"]
+            )
+        )
+        if result.rowcount == 0:
+            await session.execute(insert(SprintStatusTotal).values(**row))
+
+async def backfill(session: AsyncSession):
+    """
+    Günlük tutulmadan önce oluşturulmuş task'lar için created_at anında giriş olayı yazar ve
+    sprint toplamlarını task tablosundan yeniden kurar. Tek seferlik; commit çağıranındır.
+    """
+    missing = ~exists().where(TaskEvent.task_id == Task.id)
+    await session.execute(insert(TaskEvent).from_select(
+        ["task_id", "sprint_id", "ts", "from_status", "to_status", "from_points", "to_points"],
+        select(
+            Task.id, Task.sprint_id, func.coalesce(Task.created_at, literal(datetime.utcnow())),
+            null(), Task.status, null(), Task.story_points
+        ).where(missing)
+    ))
+    await session.execute(delete(SprintStatusTotal))
+    await session.execute(insert(SprintStatusTotal).from_select(
+        ["sprint_id", "status", "task_count", "points"],
+        select(Task.sprint_id, Task.status, func.count(), func.coalesce(func.sum(Task.story_points), 0))
+        .where(Task.sprint_id.is_not(None))
+        .group_by(Task.sprint_id, Task.status)
+    ))
+
+async def sprint_totals(session: AsyncSession, sprint_id: int) -> Dict[str, Dict[str, int]]:
+    rows = await session.execute(
+        select(SprintStatusTotal.status, SprintStatusTotal.task_count, SprintStatusTotal.points)
+        .where(SprintStatusTotal.sprint_id == sprint_id, SprintStatusTotal.task_count != 0)
+    )
+    return {row.status: {"tasks": row.task_count, "points": row.points} for row in rows}
+
+async def completed_points(session: AsyncSession, sprint_ids: Iterable[int]) -> Dict[int, int]:
+    """Task'ı olan sprint'lerin DONE puanları; task tablosu yerine artımlı toplamlardan okunur."""
+    ids = list(sprint_ids)
+    if not ids:
+        return {}
+    rows = await session.execute(
+        select(
+            SprintStatusTotal.sprint_id,
+            func.sum(case((SprintStatusTotal.status.in_(DONE_STATUSES), SprintStatusTotal.points), else_=0))
+        )
+        .where(SprintStatusTotal.sprint_id.in_(ids), SprintStatusTotal.task_count != 0)
+        .group_by(SprintStatusTotal.sprint_id)
+    )
+    return {sprint_id: int(points or 0) for sprint_id, points in rows}
+
+async def sprint_events(session: AsyncSession, sprint_id: int) -> pd.DataFrame:
+    """Sprint'in olayları zaman sırasıyla; (sprint_id, ts) indeksinden okunur."""
+    rows = (await session.execute(
+        select(
+            TaskEvent.ts, TaskEvent.task_id, TaskEvent.from_status, TaskEvent.to_status,
+            TaskEvent.from_points, TaskEvent.to_points
+        )
+        .where(TaskEvent.sprint_id == sprint_id)
+        .order_by(TaskEvent.ts, TaskEvent.id)
+    )).all()
+    return pd.DataFrame.from_records(
+        rows, columns=["ts", "task_id", "from_status", "to_status", "from_points", "to_points"]
+    )
+
+def _days(start: datetime, end: datetime, now: Optional[datetime]) -> pd.DatetimeIndex:
+    last = min(pd.Timestamp(end), pd.Timestamp(now or datetime.utcnow())).normalize()
+    return pd.date_range(pd.Timestamp(start).normalize(), max(last, pd.Timestamp(start).normalize()), freq="D")
+
+def _daily(values: pd.Series, ts: pd.Series, days: pd.DatetimeIndex) -> np.ndarray:
+    """Olay değişimlerini güne toplar ve kümülatif toplar; sprint başlangıcından önceki olaylar ilk güne yazılır."""
+    if values.empty:
+        return np.zeros(len(days))
+    day = pd.to_datetime(ts).dt.normalize().clip(lower=days[0])
+    keep = (day <= days[-1]).to_numpy()
+    return values[keep].groupby(day[keep].to_numpy()).sum().reindex(days, fill_value=0).cumsum().to_numpy()
+
+def _counted(events: pd.DataFrame, side: str, excluding: Tuple[str, ...] = ()) -> np.ndarray:
+    """Olayın from / to tarafı sprint'te bir durumu (excluding dışında) gösteriyor mu."""
+    status = events[f"{side}_status"]
+    return (status.notna() & ~status.isin(excluding)).to_numpy()
+
+def burndown(events: pd.DataFrame, start: datetime, end: datetime, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Günlük kalan puan, toplam kapsam ve ideal çizgi."""
+    days = _days(start, end, now)
+    from_points = events["from_points"].fillna(0).astype(float)
+    to_points = events["to_points"].fillna(0).astype(float)
+    # Kalan = DONE olmayan durumlardaki puan; kapsam = sprint'teki tüm puan
+    remaining = to_points * _counted(events, "to", DONE_STATUSES) - from_points * _counted(events, "from", DONE_STATUSES)
+    scope = to_points * _counted(events, "to") - from_points * _counted(events, "from")
+    remaining_daily = _daily(remaining, events["ts"], days)
+    scope_daily = _daily(scope, events["ts"], days)
+    sprint_days = max(len(pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize(), freq="D")) - 1, 1)
+    initial = remaining_daily[0] if len(remaining_daily) else 0.0
+    ideal = np.maximum(initial * (1 - np.arange(len(days)) / sprint_days), 0.0)
+    return {
+        "dates": [day.date().isoformat() for day in days],
+        "remaining_points": remaining_daily.tolist(),
+        "scope_points": scope_daily.tolist(),
+        "ideal_points": np.round(ideal, 2).tolist()
+    }
+
+def cumulative_flow(events: pd.DataFrame, start: datetime, end: datetime, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Her gün sonunda durum başına task sayısı."""
+    days = _days(start, end, now)
+    changes = pd.concat([
+        pd.DataFrame({"ts": events["ts"], "status": events["from_status"], "delta": -1}),
+        pd.DataFrame({"ts": events["ts"], "status": events["to_status"], "delta": 1})
+    ]).dropna(subset=["status"])
+    statuses = sorted(changes["status"].unique(), key=lambda s: (WORKFLOW_ORDER.index(s) if s in WORKFLOW_ORDER else len(WORKFLOW_ORDER), s))
+    return {
+        "dates": [day.date().isoformat() for day in days],
+        "statuses": {
+            status: _daily(group["delta"], group["ts"], days).astype(int).tolist()
+            for status, group in ((status, changes[changes["status"] == status]) for status in statuses)
+        }
+    }
+
+def cycle_times(events: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Şu an DONE olan task'lar için ilk devam eden duruma geçişten son DONE'a geçişe kadar geçen süre (saat).
+    Hiç devam eden duruma geçmeden kapanan task'larda başlangıç sprint'e giriş anıdır.
+    """
+    if events.empty:
+        return {"tasks": 0, "mean_hours": None, "median_hours": None, "p85_hours": None}
+    ts = pd.to_datetime(events["ts"])
+    grouped = events.assign(ts=ts).groupby("task_id")
+    # Son olay sprint'ten çıkış olabilir (to_status NULL); last() NULL'ları atladığı için kullanılmaz
+    last_status = events.drop_duplicates("task_id", keep="last").set_index("task_id")["to_status"]
+    started = events.assign(ts=ts.where(events["to_status"].isin(IN_PROGRESS_STATUSES))).groupby("task_id")["ts"].min()
+    entered = grouped["ts"].min()
+    finished = events.assign(ts=ts.where(events["to_status"].isin(DONE_STATUSES))).groupby("task_id")["ts"].max()
+    done = last_status.isin(DONE_STATUSES)
+    hours = ((finished - started.fillna(entered))[done] / pd.Timedelta(hours=1)).dropna().to_numpy()
+    if not len(hours):
+        return {"tasks": 0, "mean_hours": None, "median_hours": None, "p85_hours": None}
+    return {
+        "tasks": int(len(hours)),
+        "mean_hours": round(float(hours.mean()), 2),
+        "median_hours": round(float(np.median(hours)), 2),
+        "p85_hours": round(float(np.percentile(hours, 85)), 2)
+    }
@@ -0,0 +1,83 @@
+"""
+Zaman serisi grafikleri için sunucu tarafı nokta azaltma.
+Seçim indeks olarak yapılır; orijinal x değerleri (tarih metinleri dahil) korunur.
+"""
+from typing import Any, Tuple
+import numpy as np
+
+METHODS = ("lttb", "minmax")
+
+def _numeric_x(x: np.ndarray) -> np.ndarray:
+    """x eksenini sayıya çevirir: sayılar olduğu gibi, tarihler epoch olarak, diğerleri sıra numarası olarak."""
+    if x.dtype.kind in "iuf":
+        return x.astype(np.float64)
+    if x.dtype.kind == "M":
+        return x.astype("datetime64[ns]").astype(np.int64).astype(np.float64)
+    try:
+        return np.asarray(x, dtype="datetime64[ns]").astype(np.int64).astype(np.float64)
+    except (TypeError, ValueError):
+        return np.arange(len(x), dtype=np.float64)
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: her kovadan, bir önceki seçilen nokta ve sonraki
+    kovanın ortalamasıyla en büyük üçgeni oluşturan noktayı seçer. Tepe ve dipler korunur.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # İlk ve son nokta sabit, aradaki n-2 nokta n_out-2 kovaya bölünür
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_end = edges[i + 2]
+            avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        # Üçgen alanı (sabit 1/2 çarpanı olmadan)
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Her kovadan en küçük ve en büyük noktayı seçer (uç değerler hiç kaybolmaz)."""
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    buckets = np.array_split(np.arange(n), n_out // 2)
+    picks = [
+        index
+        for bucket in buckets
+        for index in (bucket[np.argmin(y[bucket])], bucket[np.argmax(y[bucket])])
+    ]
+    return np.unique(np.asarray(picks, dtype=np.int64))
+
+def downsample(x: Any, y: Any, max_points: int, method: str = "lttb") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Seriyi en fazla max_points noktaya indirir. Sayı olmayan (NaN) y değerleri seçimde yer almaz.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown downsampling method: {method}")
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length")
+    finite = np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if len(y) <= max_points:
+        return x, y
+
+    if method == "lttb":
+        indices = lttb_indices(_numeric_x(x), y, max_points)
+    else:
+        indices = minmax_indices(y, max_points)
+    return x[indices], y[indices]
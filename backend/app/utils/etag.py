@@ -0,0 +1,50 @@
+import hashlib
+from typing import Any, Optional, Tuple
+import orjson
+from fastapi import Response
+
+def content_hash(*parts: Any) -> str:
+    """
+    JSON'a çevrilebilir parçaların anahtar sırasından bağımsız hash'i.
+    """
+    return hashlib.sha1(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def content_etag(*parts: Any) -> str:
+    """
+    Verilen parçaların (sürümler, id'ler veya içerik) hash'inden güçlü bir ETag üretir.
+    """
+    return f'"{content_hash(*parts)}"'
+
+def version_etag(row_id: int, version: int) -> str:
+    """
+    Tekil kayıt için satır sürümünden ETag üretir; If-Match'te geri okunabilir.
+    """
+    return f'"{row_id}.{version}"'
+
+def parse_version_etag(value: str) -> Tuple[Optional[int], int]:
+    """
+    version_etag çıktısını (ya da yalnızca sürüm numarasını) (id, version) olarak çözer.
+    Geçersizse ValueError fırlatır.
+    """
+    value = value.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    row_id, _, version = value.strip('"').rpartition(".")
+    return (int(row_id) if row_id else None), int(version)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match başlığını ETag ile zayıf karşılaştırma kuralına göre eşleştirir.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    strip = lambda tag: tag.strip().removeprefix("W/")
+    return strip(etag) in {strip(tag) for tag in if_none_match.split(",")}
+
+def not_modified(etag: str) -> Response:
+    """
+    Gövdesiz 304 yanıtı döner.
+    """
+    return Response(status_code=304, headers={"ETag": etag})
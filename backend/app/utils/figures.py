@@ -0,0 +1,72 @@
+"""
+Plotly figürlerini go.Figure kurmadan, doğrudan plotly.js'in beklediği sözlükler olarak üretir.
+go.Figure her özelliği doğrular ve to_json() stdlib json ile kodlar; dashboard'larda bu maliyet
+figür başına milisaniyeler sürer. Buradaki yardımcılar doğrulama yapmaz: özellik adları
+plotly.js şemasındaki gibi iç içe yazılmalıdır (marker_color değil marker={"color": ...}).
+"""
+from typing import Any, Dict, Optional
+import numpy as np
+import orjson
+from app.core.config import settings
+from app.utils.downsampling import downsample
+
+Figure = Dict[str, Any]
+
+_ENCODE_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def trace(trace_type: str, **attributes: Any) -> Dict[str, Any]:
+    """Tek bir trace; None değerli özellikler yazılmaz (plotly.js varsayılanı kullanılır)."""
+    return {"type": trace_type, **{key: value for key, value in attributes.items() if value is not None}}
+
+def scatter(x: Any, y: Any, **attributes: Any) -> Dict[str, Any]:
+    return trace("scatter", x=x, y=y, **attributes)
+
+def timeseries(
+    x: Any,
+    y: Any,
+    max_points: Optional[int] = None,
+    method: str = "lttb",
+    webgl_threshold: Optional[int] = None,
+    **attributes: Any
+) -> Dict[str, Any]:
+    """
+    Uzun seriler için scatter: en fazla max_points noktaya indirilir (None: azaltma yok) ve
+    nokta sayısı eşiği aşarsa tarayıcıda WebGL ile çizilen scattergl kullanılır.
+    Sayısal olmayan seriler azaltılamaz, olduğu gibi düz scatter olarak çizilir.
+    """
+    if max_points is not None and len(y) > max_points:
+        try:
+            values = np.asarray(y, dtype=np.float64)
+        except (TypeError, ValueError):
+            return trace("scatter", x=x, y=y, **attributes)
+        x, y = downsample(x, values, max_points, method)
+    threshold = settings.CHART_WEBGL_THRESHOLD if webgl_threshold is None else webgl_threshold
+    return trace("scattergl" if len(y) > threshold else "scatter", x=x, y=y, **attributes)
+
+def bar(x: Any, y: Any, **attributes: Any) -> Dict[str, Any]:
+    return trace("bar", x=x, y=y, **attributes)
+
+def heatmap(z: Any, **attributes: Any) -> Dict[str, Any]:
+    return trace("heatmap", z=z, **attributes)
+
+def scatterpolar(r: Any, theta: Any, **attributes: Any) -> Dict[str, Any]:
+    return trace("scatterpolar", r=r, theta=theta, **attributes)
+
+def indicator(value: Any, **attributes: Any) -> Dict[str, Any]:
+    return trace("indicator", value=value, **attributes)
+
+def figure(*traces: Dict[str, Any], layout: Optional[Dict[str, Any]] = None) -> Figure:
+    return {"data": list(traces), "layout": layout or {}}
+
+def _default(value: Any) -> Any:
+    # pandas Series / Index gibi dizi benzerleri
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def encode_figure(fig: Figure) -> orjson.Fragment:
+    """
+    Figürü bir kez orjson ile kodlar (NumPy dizileri dahil). Dönen Fragment, yanıt
+    orjson ile kodlanırken olduğu gibi gömülür; figür tekrar çözülüp kodlanmaz.
+    """
+    return orjson.Fragment(orjson.dumps(fig, default=_default, option=_ENCODE_OPTIONS))
@@ -0,0 +1,21 @@
+import base64
+from datetime import datetime
+from typing import Tuple
+
+def encode_cursor(updated_at: datetime, row_id: int) -> str:
+    """
+    Keyset sayfalama için (updated_at, id) çiftini opak bir cursor'a çevirir.
+    """
+    raw = f"{updated_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    encode_cursor ile üretilmiş cursor'ı çözer, geçersizse ValueError fırlatır.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(updated_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -0,0 +1,29 @@
+"""
+Task olay günlüğü öncesinde oluşturulmuş task'lar için başlangıç olaylarını yazar ve
+sprint durum toplamlarını task tablosundan yeniden kurar. Tek seferlik çalıştırılır.
+
+Kullanım (backend dizininden):
+    python -m app.workers.backfill_task_events
+"""
+import argparse
+import asyncio
+from app.core.logger import init_logging
+from app.database.database import AsyncSessionLocal, Base, async_engine
+from app.models import task, task_event, sprint  # noqa: F401
+from app.services.task_events import backfill
+
+async def _main():
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as session:
+        await backfill(session)
+        await session.commit()
+    await async_engine.dispose()
+
+def main():
+    argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter).parse_args()
+    init_logging()
+    asyncio.run(_main())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Dashboard snapshot scheduler'ı.
+
+Kullanım (backend dizininden):
+    python -m app.workers.dashboard_scheduler --interval 900
+"""
+import argparse
+import asyncio
+import signal
+from app.core.config import settings
+from app.core.logger import init_logging
+from app.services.dashboard_snapshots import DashboardSnapshotScheduler, DashboardSnapshotStore
+
+def build_visualization_service():
+    # Model yüklemesi ağır, yalnızca scheduler process'inde bir kez yapılır
+    from app.core.services.deep_learning_ai_service import DeepLearningAIProductOwner
+    from app.core.services.business_intelligence_service import BusinessIntelligenceService
+    from app.core.services.team_management_service import TeamManagementService
+    from app.core.services.project_management_service import ProjectManagementService
+    from app.core.services.reporting_service import ReportingService
+    from app.core.services.visualization_service import VisualizationService
+
+    ai_service = DeepLearningAIProductOwner()
+    reporting_service = ReportingService(
+        ai_service,
+        BusinessIntelligenceService(ai_service),
+        TeamManagementService(ai_service),
+        ProjectManagementService(ai_service)
+    )
+    return VisualizationService(reporting_service)
+
+async def _main(interval: float):
+    visualization = build_visualization_service()
+    scheduler = DashboardSnapshotScheduler(
+        DashboardSnapshotStore(),
+        visualization.create_dashboard,
+        interval_seconds=interval
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, scheduler.stop)
+    await scheduler.run()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--interval", type=float, default=settings.DASHBOARD_REFRESH_INTERVAL_SECONDS)
+    args = parser.parse_args()
+    init_logging()
+    asyncio.run(_main(args.interval))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Redis iş kuyruğu worker'ı.
+
+Kullanım (backend dizininden):
+    python -m app.workers.job_worker --concurrency 4
+"""
+from typing import Any, Dict, Set
+import argparse
+import asyncio
+import logging
+import signal
+from app.core.config import settings
+from app.core.logger import init_logging
+from app.services.jobs import JobContext, JobQueue, get_job_handler
+import app.services.job_handlers  # noqa: F401  (işleyiciler kaydolur)
+
+logger = logging.getLogger(__name__)
+
+class JobWorker:
+    """Kuyruktan işleri alıp en fazla `concurrency` tanesini aynı anda çalıştırır."""
+
+    def __init__(self, queue: JobQueue, concurrency: int):
+        self.queue = queue
+        self.concurrency = max(1, concurrency)
+        self._stopping = asyncio.Event()
+        self._tasks: Set[asyncio.Task] = set()
+
+    def stop(self):
+        self._stopping.set()
+
+    async def run(self):
+        slots = asyncio.Semaphore(self.concurrency)
+        logger.info("Job worker başladı (concurrency=%s)", self.concurrency)
+        while not self._stopping.is_set():
+            await slots.acquire()
+            try:
+                await self.queue.promote()
+                job = await self.queue.claim()
+            except Exception:
+                slots.release()
+                logger.exception("Kuyruktan iş alınamadı")
+                await self._sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+                continue
+            if job is None:
+                slots.release()
+                await self._sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+                continue
+
+            task = asyncio.create_task(self._execute(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _: slots.release())
+
+        # Çalışan işler bitirilir; bitmeyenlerin lease'i dolunca başka worker alır
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info("Job worker durdu")
+
+    async def _execute(self, job: Dict[str, Any]):
+        handler = get_job_handler(job["type"])
+        if handler is None:
+            await self.queue.fail({**job, "attempts": job["max_attempts"]}, f"No handler for {job['type']}")
+            return
+
+        context = JobContext(self.queue, job["id"], job["attempts"])
+        run = asyncio.create_task(handler(job["payload"], context))
+        heartbeat = asyncio.create_task(self._heartbeat(job, run))
+        try:
+            result = await run
+        except asyncio.CancelledError:
+            if await self.queue.is_cancel_requested(job["id"]):
+                await self.queue.mark_cancelled(job)
+                logger.info("İş %s iptal edildi", job["id"])
+            else:
+                await self.queue.fail(job, "cancelled by worker shutdown")
+        except Exception as e:
+            status = await self.queue.fail(job, f"{type(e).__name__}: {e}")
+            logger.exception("İş %s başarısız (%s)", job["id"], status)
+        else:
+            if not await self.queue.complete(job, result):
+                logger.warning("İş %s lease'i kaybedildi, sonuç yazılmadı", job["id"])
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job: Dict[str, Any], run: asyncio.Task):
+        """Lease'i yeniler ve iptal isteğini izler."""
+        interval = max(1.0, settings.JOB_LEASE_SECONDS / 3)
+        while not run.done():
+            await asyncio.sleep(interval)
+            try:
+                if await self.queue.is_cancel_requested(job["id"]):
+                    run.cancel()
+                    return
+                if not await self.queue.extend_lease(job["id"]):
+                    # İş başka worker'a geçti, bu çalıştırma boşa devam etmesin
+                    run.cancel()
+                    return
+            except Exception:
+                logger.exception("İş %s lease yenilenemedi", job["id"])
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+async def _main(concurrency: int):
+    worker = JobWorker(JobQueue(), concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    await worker.run()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY)
+    args = parser.parse_args()
+    init_logging()
+    asyncio.run(_main(args.concurrency))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Monte Carlo tahmin motoru benchmark'ı: sentetik velocity / throughput geçmişiyle sürüm tahmini.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.forecasting_benchmark --samples 20000 --points 120 300 800
+"""
+import argparse
+import numpy as np
+from app.core.services.forecasting import MonteCarloForecaster
+from benchmarks.sprint_metrics_benchmark import measure
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=20_000)
+    parser.add_argument("--history", type=int, default=12, help="geçmiş sprint sayısı")
+    parser.add_argument("--points", type=int, nargs="+", default=[120, 300, 800], help="kalan puanlar")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    velocities = rng.integers(10, 60, args.history)
+    throughputs = rng.integers(2, 15, args.history)
+    forecaster = MonteCarloForecaster(velocities, throughputs, samples=args.samples)
+
+    print(f"samples={args.samples} history={args.history} mean_velocity={velocities.mean():.1f}")
+    for points in args.points:
+        items = int(points / velocities.mean() * throughputs.mean())
+        elapsed = measure(lambda: forecaster.forecast(points, items), args.repeats)
+        print(f"forecast {points:5d} pts / {items:4d} items : {elapsed * 1000:7.1f} ms")
+    print(f"velocity bands (6 sprints)        : {measure(forecaster.velocity_bands, args.repeats) * 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
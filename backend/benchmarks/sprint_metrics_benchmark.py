@@ -0,0 +1,72 @@
+"""
+Sprint metrik motoru benchmark'ı: sentetik task tablosunda tam hesaplama ve artımlı güncelleme.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.sprint_metrics_benchmark --tasks 100000 --sprints 200
+"""
+import argparse
+import time
+from typing import Callable
+import numpy as np
+import pandas as pd
+from app.core.services.sprint_metrics import SprintMetricsEngine
+
+def synthetic_tables(tasks: int, sprints: int, seed: int = 0):
+    """Veritabanından okunmuş gibi kolonlu task ve sprint çerçeveleri üretir."""
+    rng = np.random.default_rng(seed)
+    starts = pd.Timestamp("2022-01-03") + pd.to_timedelta(np.arange(sprints) * 14, unit="D")
+    sprint_frame = pd.DataFrame({
+        "id": np.arange(1, sprints + 1),
+        "start_date": starts,
+        "end_date": starts + pd.Timedelta(days=14),
+        "status": ["COMPLETED"] * (sprints - 1) + ["ACTIVE"],
+        "velocity": 0.0
+    })
+    sprint_ids = rng.integers(1, sprints + 1, tasks)
+    created = starts[sprint_ids - 1] + pd.to_timedelta(rng.integers(-72, 240, tasks), unit="h")
+    task_frame = pd.DataFrame({
+        "id": np.arange(1, tasks + 1),
+        "sprint_id": sprint_ids,
+        "status": rng.choice(["TODO", "IN_PROGRESS", "DONE"], tasks, p=[0.15, 0.1, 0.75]),
+        "story_points": rng.choice([1, 2, 3, 5, 8, 13], tasks),
+        "assignee": rng.choice([f"dev-{i}" for i in range(25)] + [None], tasks),
+        "created_at": created,
+        "updated_at": created + pd.to_timedelta(rng.integers(1, 200, tasks), unit="h")
+    })
+    return task_frame, sprint_frame
+
+def measure(fn: Callable[[], None], repeats: int) -> float:
+    """En iyi çalışma süresini saniye cinsinden döner."""
+    fn()  # ısınma
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--sprints", type=int, default=200)
+    parser.add_argument("--changes", type=int, default=100, help="artımlı güncellemedeki task sayısı")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    tasks, sprints = synthetic_tables(args.tasks, args.sprints)
+    engine = SprintMetricsEngine(tasks, sprints)
+    changed = tasks.sample(args.changes, random_state=0).assign(status="DONE").to_dict("records")
+
+    build = measure(lambda: SprintMetricsEngine(tasks, sprints), args.repeats)
+    team = measure(engine.team_metrics, args.repeats)
+    sprint = measure(lambda: engine.sprint_metrics(args.sprints - 1), args.repeats)
+    apply = measure(lambda: engine.apply(tasks=changed), args.repeats)
+
+    print(f"tasks={args.tasks} sprints={args.sprints} changes={args.changes}")
+    print(f"build + aggregate : {build * 1000:9.1f} ms")
+    print(f"team metrics      : {team * 1000:9.1f} ms")
+    print(f"sprint metrics    : {sprint * 1000:9.1f} ms")
+    print(f"incremental apply : {apply * 1000:9.1f} ms")
+
+if __name__ == "__main__":
+    main()
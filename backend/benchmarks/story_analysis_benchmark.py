@@ -0,0 +1,87 @@
+"""
+Story analizi benchmark'ı: eski çok geçişli yol ile tek geçişli StoryAnalysisNetwork karşılaştırması.
+
+Kullanım (backend dizininden):
+    python -m benchmarks.story_analysis_benchmark --stories 64 --batch-size 16
+"""
+import argparse
+import time
+from typing import Callable, List, Tuple
+import torch
+from transformers import AutoTokenizer, AutoModel
+from app.core.services.deep_learning_ai_service import DeepLearningModel, StoryAnalysisNetwork
+
+SAMPLE_STORIES = [
+    "As a user, I want to reset my password so that I can access my account if I forget it.",
+    "As an admin, I want to export sprint reports as PDF so that I can share them with stakeholders.",
+    "As a product owner, I want to see velocity trends so that I can plan upcoming sprints.",
+    "As a developer, I want Jira issues to sync automatically so that the backlog stays up to date.",
+]
+
+def build_network() -> Tuple[AutoTokenizer, StoryAnalysisNetwork]:
+    """Servisteki ile aynı boyutlarda analiz grafını kurar."""
+    tokenizer = AutoTokenizer.from_pretrained('bert-base-uncased')
+    bert_model = AutoModel.from_pretrained('bert-base-uncased')
+    bert_model.requires_grad_(False)
+    network = StoryAnalysisNetwork(
+        bert_model,
+        DeepLearningModel(768, 512, 256),
+        DeepLearningModel(256, 128, 3),
+        DeepLearningModel(256, 128, 3),
+        DeepLearningModel(256, 128, 1)
+    ).eval()
+    return tokenizer, network
+
+def legacy_path(tokenizer: AutoTokenizer, network: StoryAnalysisNetwork, stories: List[str]):
+    """Eski akış: story başına BERT, özellik ağı iki kez ve başlıklar ayrı ayrı."""
+    for story in stories:
+        inputs = tokenizer(story, return_tensors="pt", padding=True, truncation=True)
+        with torch.no_grad():
+            embedding = network.encoder(**inputs).last_hidden_state.mean(dim=1)
+            features = network.story_analyzer(embedding)
+            # _analyze_complexity özellik ağını tekrar çalıştırıyordu
+            network.complexity_head(network.story_analyzer(embedding))
+            network.risk_head(features)
+            network.points_head(features)
+
+def fused_path(tokenizer: AutoTokenizer, network: StoryAnalysisNetwork, stories: List[str], batch_size: int):
+    """Yeni akış: batch başına tek tokenizer çağrısı ve tek ileri geçiş."""
+    for start in range(0, len(stories), batch_size):
+        inputs = tokenizer(stories[start:start + batch_size], return_tensors="pt", padding=True, truncation=True)
+        with torch.inference_mode():
+            network(**inputs)
+
+def measure(fn: Callable[[], None], repeats: int) -> float:
+    """En iyi çalışma süresini saniye cinsinden döner."""
+    fn()  # ısınma
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stories", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=None, help="torch intra-op thread sayısı")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    stories = [SAMPLE_STORIES[i % len(SAMPLE_STORIES)] for i in range(args.stories)]
+    tokenizer, network = build_network()
+
+    legacy = measure(lambda: legacy_path(tokenizer, network, stories), args.repeats)
+    fused = measure(lambda: fused_path(tokenizer, network, stories, args.batch_size), args.repeats)
+
+    print(f"stories={args.stories} batch_size={args.batch_size} threads={torch.get_num_threads()}")
+    print(f"legacy : {legacy * 1000:9.1f} ms  ({args.stories / legacy:7.1f} stories/s)")
+    print(f"fused  : {fused * 1000:9.1f} ms  ({args.stories / fused:7.1f} stories/s)")
+    print(f"speedup: {legacy / fused:.2f}x")
+
+if __name__ == "__main__":
+    main()
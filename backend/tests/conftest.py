@@ -1,15 +1,18 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.core.config import settings
-from app.database.database import Base, get_db
+from app.database.database import Base, get_db, get_async_db, get_async_session_factory
 from app.main import app
+from app.services.cache import ReadThroughCache, get_cache
 
 # Test veritabanı URL'si
 TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 # Test veritabanı engine'i
 engine = create_engine(
@@ -21,6 +24,10 @@ engine = create_engine(
 # Test session factory
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async test engine'i (TestClient her testte yeni event loop açtığı için bağlantı havuzlanmaz)
+async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 @pytest.fixture(scope="function")
 def db_session():
     """Test veritabanı session'ı oluşturur."""
@@ -41,7 +48,15 @@ def client(db_session):
         finally:
             db_session.close()
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_factory] = lambda: TestingAsyncSessionLocal
+    # Testler arası veritabanı sıfırlandığı için önbellek kapalı çalışır
+    app.dependency_overrides[get_cache] = lambda: ReadThroughCache(redis_client=None)
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
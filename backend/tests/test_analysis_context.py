@@ -0,0 +1,48 @@
+import asyncio
+from app.core.domain.analysis_context import analysis_scope, memoized
+
+def test_memoized_within_scope():
+    """Kapsam içinde aynı anahtar bir kez hesaplanır, iç içe kapsamlar aynı sonucu paylaşır."""
+    calls = []
+
+    async def analyze():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return {"velocity": 21}
+
+    async def nested():
+        async with analysis_scope():
+            return await memoized(("sprint_performance", 1), analyze)
+
+    async def scenario():
+        async with analysis_scope():
+            first = await memoized(("sprint_performance", 1), analyze)
+            second, third = await asyncio.gather(nested(), nested())
+            return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first is second is third
+    assert len(calls) == 1
+
+def test_memoized_outside_scope_and_errors():
+    """Kapsam dışında saklama yapılmaz; hatalar saklanmaz."""
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("LLM timeout")
+        return "ok"
+
+    async def scenario():
+        await memoized("key", lambda: asyncio.sleep(0, result=1))
+        await memoized("key", lambda: asyncio.sleep(0, result=2))
+        async with analysis_scope():
+            try:
+                await memoized("report", flaky)
+            except RuntimeError:
+                pass
+            return await memoized("report", flaky)
+
+    assert asyncio.run(scenario()) == "ok"
+    assert len(calls) == 2
@@ -0,0 +1,162 @@
+import asyncio
+from app.core.config import settings
+from app.services.cache import ReadThroughCache, TASKS
+
+class InMemoryRedis:
+    """Önbellek testleri için kullanılan komutları taklit eden basit Redis."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def getex(self, key, ex=None):
+        if ex is not None and key in self.data:
+            self.ttls[key] = ex
+        return self.data.get(key)
+
+    async def expire(self, key, seconds):
+        if key not in self.data:
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+    def pipeline(self, transaction=True):
+        return InMemoryPipeline(self)
+
+class InMemoryPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def delete(self, *keys):
+        self.commands.append(self.redis.delete(*keys))
+
+    def incr(self, key):
+        self.commands.append(self.redis.incr(key))
+
+    def expire(self, key, seconds):
+        self.commands.append(self.redis.expire(key, seconds))
+
+    async def execute(self):
+        return [await command for command in self.commands]
+
+def test_cache_read_through_and_invalidate():
+    """İlk okuma kaynaktan, ikincisi önbellekten gelir; invalidate sonrası tekrar yüklenir."""
+    cache = ReadThroughCache(redis_client=InMemoryRedis())
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return {"id": 1, "status": "TODO"}
+
+    async def scenario():
+        assert await cache.get_item(TASKS, 1, loader) == {"id": 1, "status": "TODO"}
+        assert await cache.get_item(TASKS, 1, loader) == {"id": 1, "status": "TODO"}
+        await cache.invalidate(TASKS, [1])
+        await cache.get_item(TASKS, 1, loader)
+
+    asyncio.run(scenario())
+    assert len(loads) == 2
+    assert cache.metrics.snapshot()["hits"] == 1
+
+def test_item_generation_counters_expire_after_cached_items():
+    """Kayıt sürüm sayacı sonsuza kadar tutulmaz; TTL'i önbellekteki kayıtlardan ve kilitten uzundur."""
+    redis_client = InMemoryRedis()
+    cache = ReadThroughCache(redis_client=redis_client, ttl=300, lock_ttl_ms=2000)
+
+    async def loader():
+        return {"id": 1}
+
+    async def scenario():
+        await cache.invalidate(TASKS, [1, 2])
+        for item_id in (1, 2):
+            assert redis_client.ttls[cache._item_generation_key(TASKS, item_id)] == cache.generation_ttl
+        redis_client.ttls.clear()
+        await cache.get_item(TASKS, 1, loader)
+        assert redis_client.ttls[cache._item_generation_key(TASKS, 1)] == cache.generation_ttl
+
+    asyncio.run(scenario())
+    assert cache.generation_ttl >= max(300, settings.REPORT_CACHE_TTL_SECONDS) + 2
+
+def test_cache_list_generation():
+    """Liste anahtarları namespace sürümü artınca geçersiz olur."""
+    cache = ReadThroughCache(redis_client=InMemoryRedis())
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        return {"items": [], "next_cursor": None}
+
+    async def scenario():
+        await cache.get_list(TASKS, {"limit": 10}, loader)
+        await cache.get_list(TASKS, {"limit": 10}, loader)
+        await cache.invalidate(TASKS)
+        await cache.get_list(TASKS, {"limit": 10}, loader)
+
+    asyncio.run(scenario())
+    assert len(loads) == 2
+
+def test_load_started_before_invalidate_is_not_served():
+    """Yazmadan önce başlayan yükleme bayat değeri önbelleğe yazsa da sonraki okuma yeni değeri yükler."""
+    cache = ReadThroughCache(redis_client=InMemoryRedis())
+    rows = {1: "TODO"}
+    started = asyncio.Event()
+
+    async def slow_loader():
+        status = rows[1]
+        started.set()
+        await asyncio.sleep(0.01)
+        return {"id": 1, "status": status}
+
+    async def loader():
+        return {"id": 1, "status": rows[1]}
+
+    async def scenario():
+        stale = asyncio.create_task(cache.get_item(TASKS, 1, slow_loader))
+        await started.wait()
+        rows[1] = "DONE"
+        await cache.invalidate(TASKS, [1])
+        assert (await stale)["status"] == "TODO"
+        assert (await cache.get_item(TASKS, 1, loader))["status"] == "DONE"
+        assert (await cache.peek_item(TASKS, 1))["status"] == "DONE"
+
+    asyncio.run(scenario())
+
+def test_cache_coalesces_concurrent_misses():
+    """Aynı anahtar için eşzamanlı kaçırmalar tek yüklemeye düşer."""
+    cache = ReadThroughCache(redis_client=InMemoryRedis())
+    loads = []
+
+    async def loader():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 7}
+
+    async def scenario():
+        return await asyncio.gather(*[cache.get_item(TASKS, 7, loader) for _ in range(10)])
+
+    results = asyncio.run(scenario())
+    assert results == [{"id": 7}] * 10
+    assert len(loads) == 1
@@ -0,0 +1,120 @@
+import asyncio
+import pytest
+from app.services.dashboard_snapshots import DashboardSnapshotScheduler, DashboardSnapshotStore
+
+class FakeSnapshotStore:
+    """Scheduler testleri için Redis'siz snapshot deposu."""
+
+    def __init__(self, projects):
+        self.projects = {str(p["id"]): p for p in projects}
+        self.snapshots = {}
+        self.dirty = set()
+        self.seq = {}
+
+    async def load_projects(self):
+        return list(self.projects.values())
+
+    async def load_project(self, project_id):
+        return self.projects.get(project_id)
+
+    async def take_dirty(self, settle_seconds, limit=100):
+        taken, self.dirty = sorted(self.dirty), set()
+        return taken
+
+    async def mark_changed(self, project_id):
+        self.dirty.add(project_id)
+        return True
+
+    async def next_version(self, project_id):
+        self.seq[project_id] = self.seq.get(project_id, 0) + 1
+        return self.seq[project_id]
+
+    async def save(self, project_id, version, dashboard):
+        current = self.snapshots.get(project_id)
+        if current is not None and current[0] >= version:
+            return False
+        self.snapshots[project_id] = (version, dashboard)
+        return True
+
+def test_scheduler_precomputes_all_projects_and_dirty_ones():
+    """Tam yenileme tüm projeleri, olay sonrası yenileme yalnızca değişen projeyi hesaplar."""
+    store = FakeSnapshotStore([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+    built = []
+
+    async def build(project_data):
+        built.append(project_data["id"])
+        return {"project": project_data["name"]}
+
+    scheduler = DashboardSnapshotScheduler(store, build, interval_seconds=60, debounce_seconds=0, concurrency=2)
+
+    async def scenario():
+        assert await scheduler.refresh_all() == 2
+        store.projects["2"]["name"] = "b2"
+        await store.mark_changed("2")
+        assert await scheduler.refresh_dirty() == 1
+
+    asyncio.run(scenario())
+    assert sorted(built) == [1, 2, 2]
+    assert store.snapshots["1"] == (1, {"project": "a"})
+    assert store.snapshots["2"] == (2, {"project": "b2"})
+
+def test_stale_build_does_not_overwrite_newer_snapshot():
+    """Önce başlayıp geç biten hesaplama, sonradan başlayanın snapshot'ını ezmez."""
+    store = FakeSnapshotStore([{"id": 1}])
+    release_first = asyncio.Event()
+
+    async def build(project_data):
+        if project_data.get("slow"):
+            await release_first.wait()
+        return {"slow": project_data.get("slow", False)}
+
+    async def scenario():
+        slow = DashboardSnapshotScheduler(store, build, debounce_seconds=0)
+        fast = DashboardSnapshotScheduler(store, build, debounce_seconds=0)
+        first = asyncio.ensure_future(slow.refresh({"id": 1, "slow": True}))
+        await asyncio.sleep(0)
+        assert await fast.refresh({"id": 1}) == 2
+        release_first.set()
+        assert await first is None
+
+    asyncio.run(scenario())
+    assert store.snapshots["1"] == (2, {"slow": False})
+
+def test_store_keeps_etag_for_same_content_and_applies_changed_fields():
+    """Aynı içerikli yeniden hesaplama digest'i korur; olayla gelen alanlar kayıtlı veriye işlenir."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    store = DashboardSnapshotStore(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+    async def build(project_data):
+        return {"dashboard_metadata": {"generated_at": f"t{len(built)}"}, "sprints": project_data["sprints"]}
+
+    built = []
+    scheduler = DashboardSnapshotScheduler(store, build, debounce_seconds=0)
+
+    async def scenario():
+        await store.register_project({"id": 1, "name": "Proje", "sprints": [1]})
+        project = await store.load_project("1")
+        built.append(await scheduler.refresh(project))
+        first = await store.get(1)
+        built.append(await scheduler.refresh(project))
+        second = await store.get(1)
+
+        assert await store.mark_changed(1, {"sprints": [1, 2]})
+        assert await store.take_dirty(0) == ["1"]
+        assert await store.load_project("1") == {"id": 1, "name": "Proje", "sprints": [1, 2]}
+        built.append(await scheduler.refresh(await store.load_project("1")))
+        third = await store.get(1)
+
+        assert not await store.mark_changed(2, {"sprints": []})
+        # Sürüm sayacı snapshot'la aynı anahtarda, ayrı süresiz anahtar kalmaz
+        keys = await store.redis.keys("dashboard:*")
+        ttl = await store.redis.ttl(store.snapshot_key(1))
+        return first, second, third, keys, ttl
+
+    first, second, third, keys, ttl = asyncio.run(scenario())
+    assert built == [1, 2, 3]
+    assert second["version"] == 2 and second["digest"] == first["digest"]
+    assert second["generated_at"] == first["generated_at"] and second["dashboard"] == first["dashboard"]
+    assert third["digest"] != first["digest"]
+    assert keys == [store.snapshot_key(1)] and ttl > 0
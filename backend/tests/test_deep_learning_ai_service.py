@@ -0,0 +1,85 @@
+import asyncio
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("stable_baselines3")
+from stable_baselines3 import PPO
+from stable_baselines3.common.vec_env import DummyVecEnv
+from app.core.services import deep_learning_ai_service as dl
+from app.core.services.deep_learning_ai_service import (
+    AGENT_OBSERVATION_SIZE,
+    DeepLearningAIProductOwner,
+    DeepLearningModel,
+    ProductOwnerEnvironment,
+    StoryAnalysisNetwork
+)
+
+class StubTokenizer:
+    """Kelime sayısına göre padding'li input_ids/attention_mask üreten küçük tokenizer."""
+
+    def __call__(self, texts, return_tensors="pt", padding=True, truncation=True):
+        lengths = [max(len(text.split()), 1) for text in texts]
+        width = max(lengths)
+        mask = torch.tensor([[1] * n + [0] * (width - n) for n in lengths])
+        return {"input_ids": mask * 7, "attention_mask": mask}
+
+class StubEncoder(torch.nn.Module):
+    """BERT yerine token kimliklerinden 768 boyutlu gizli durum üreten kodlayıcı."""
+
+    def __init__(self):
+        super().__init__()
+        self.embedding = torch.nn.Embedding(16, 768)
+
+    def forward(self, input_ids, attention_mask, **kwargs):
+        return SimpleNamespace(last_hidden_state=self.embedding(input_ids))
+
+@pytest.fixture
+def owner(monkeypatch):
+    # Ağır modeller yüklenmeden, gerçek ağ başlıkları ve gerçek PPO agent'ıyla kurulur
+    monkeypatch.setattr(dl, "word_tokenize", str.split)
+    torch.manual_seed(0)
+    owner = object.__new__(DeepLearningAIProductOwner)
+    owner.tokenizer = StubTokenizer()
+    owner.bert_model = StubEncoder().eval()
+    owner.story_network = StoryAnalysisNetwork(
+        owner.bert_model,
+        DeepLearningModel(768, 32, 256),
+        DeepLearningModel(256, 16, 3),
+        DeepLearningModel(256, 16, 3),
+        DeepLearningModel(256, 16, 1)
+    ).eval()
+    owner.word2vec = SimpleNamespace(wv={"login": np.ones(100, dtype=np.float32)}, vector_size=100)
+    owner.env = DummyVecEnv([lambda: ProductOwnerEnvironment()])
+    owner.agent = PPO("MlpPolicy", owner.env, n_steps=8, batch_size=8, verbose=0)
+    owner.inference_executor = None
+    return owner
+
+def test_story_batch_features_are_projected_to_agent_observation(owner):
+    """256 boyutlu özellikler agent'ın gözlem boyutuna indirgenir; her story bir öneri alır."""
+    results = owner._analyze_story_batch(["user can login", "export the sprint report as pdf"])
+
+    assert len(results) == 2
+    for result in results:
+        assert len(result["story_embedding"]) == 768
+        assert 0 <= result["agent_recommendation"]["action_type"] < 10
+        assert result["agent_recommendation"]["confidence"] > 0
+    assert owner._agent_observations(np.ones((3, 868))).shape == (3, AGENT_OBSERVATION_SIZE)
+    assert owner._agent_observations(np.ones((1, 20))).shape == (1, AGENT_OBSERVATION_SIZE)
+
+def test_prioritize_backlog_ranks_items_and_recommends_action(owner):
+    """868 boyutlu backlog gömmeleriyle sıralama ve agent önerisi hatasız üretilir."""
+    items = [
+        {"id": 1, "title": "Login", "description": "user can login", "priority": "LOW"},
+        {"id": 2, "title": "Export", "description": "export the sprint report", "priority": "CRITICAL"},
+        {"id": 3, "title": "Audit", "description": "audit log for login", "priority": "MEDIUM"}
+    ]
+
+    result = asyncio.run(owner.prioritize_backlog(items, {"sprint_goals": ["secure login"]}))
+
+    assert [item["id"] for item in result["prioritized_items"]][0] == 2
+    assert sorted(item["id"] for item in result["prioritized_items"]) == [1, 2, 3]
+    assert all(len(embedding) == 868 for embedding in result["embeddings"])
+    assert 0 <= result["agent_recommendation"]["action_type"] < 10
+    assert asyncio.run(owner.prioritize_backlog([]))["prioritized_items"] == []
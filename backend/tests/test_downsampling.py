@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from app.utils.downsampling import downsample
+from app.utils.figures import timeseries
+
+def _series(n=20_000):
+    x = np.arange(n, dtype=np.float64)
+    y = np.sin(x / 500) + np.random.default_rng(0).normal(0, 0.05, n)
+    y[n * 5 // 8] = 10.0  # tek noktalık sıçrama
+    return x, y
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_downsample_respects_budget_and_keeps_extremes(method):
+    """Çıktı bütçeyi aşmaz, sıralı kalır ve tepe noktası kaybolmaz."""
+    x, y = _series()
+    dx, dy = downsample(x, y, 500, method)
+    assert len(dx) <= 500
+    assert np.all(np.diff(dx) > 0)
+    assert dy.max() == 10.0
+
+def test_downsample_keeps_date_labels_and_drops_nan():
+    """Tarih metinleri korunur; NaN değerler seçime girmez; kısa seri olduğu gibi döner."""
+    dates = np.datetime_as_string(np.arange("2020-01-01", "2023-01-01", dtype="datetime64[D]")).tolist()
+    values = np.linspace(0, 1, len(dates))
+    values[5] = np.nan
+    dx, dy = downsample(dates, values, 100)
+    assert len(dx) == 100 and dx[0] == "2020-01-01" and dx[-1] == "2022-12-31"
+    assert not np.isnan(dy).any()
+    sx, sy = downsample(dates[:10], values[:10], 100)
+    assert len(sx) == 9
+
+def test_timeseries_switches_to_webgl_above_threshold():
+    x, y = _series(5_000)
+    assert timeseries(x, y, max_points=None, webgl_threshold=1000)["type"] == "scattergl"
+    assert timeseries(x, y, max_points=500, webgl_threshold=1000)["type"] == "scatter"
+
+def test_timeseries_keeps_short_and_non_numeric_series_as_is():
+    """Bütçe içindeki seri azaltılmaz; sayısal olmayan seri hata vermeden düz scatter olur."""
+    trends = {"trend_direction": "", "trend_magnitude": 0.0, "trend_stability": 0.0}
+    short = timeseries(list(trends), list(trends.values()), max_points=500)
+    assert short["type"] == "scatter" and short["y"] == ["", 0.0, 0.0]
+    labels = [f"t{i}" for i in range(2_000)]
+    long = timeseries(labels, ["yukarı"] * 2_000, max_points=500, webgl_threshold=1000)
+    assert long["type"] == "scatter" and len(long["y"]) == 2_000
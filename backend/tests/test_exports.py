@@ -0,0 +1,49 @@
+import io
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+def _create_tasks(client):
+    payloads = [
+        {"title": "Login", "priority": "HIGH", "description": "OAuth"},
+        {"title": "Profil", "priority": "LOW"},
+        {"title": "Rapor", "priority": "HIGH", "status": "DONE"}
+    ]
+    response = client.post("/api/v1/tasks/bulk", json=payloads)
+    assert response.status_code == 200
+
+def test_export_tasks_arrow_with_projection_and_filter(client):
+    """Arrow IPC export'u: kolon projeksiyonu ve filtre uygulanır."""
+    _create_tasks(client)
+    response = client.get("/exports/tasks", params={"columns": "id,title,description", "priority": "HIGH"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column_names == ["id", "title", "description"]
+    assert table.column("title").to_pylist() == ["Login", "Rapor"]
+    assert table.column("description").to_pylist() == ["OAuth", None]
+
+def test_export_tasks_parquet(client):
+    """Parquet export'u tüm task'ları tipli kolonlarla döner."""
+    _create_tasks(client)
+    response = client.get("/exports/tasks", params={"format": "parquet"})
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="tasks.parquet"'
+
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 3
+    assert table.column("status").to_pylist() == ["TODO", "TODO", "DONE"]
+    assert pa.types.is_timestamp(table.schema.field("updated_at").type)
+
+def test_export_empty_result_is_readable(client):
+    """Eşleşen satır yoksa da şemalı, okunabilir bir stream döner."""
+    response = client.get("/exports/sprints")
+    assert response.status_code == 200
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.num_rows == 0
+    assert "velocity" in table.column_names
+
+def test_export_rejects_unknown_column_and_format(client):
+    """Bilinmeyen kolon 400, bilinmeyen format 422 döner."""
+    assert client.get("/exports/tasks", params={"columns": "id,secret"}).status_code == 400
+    assert client.get("/exports/tasks", params={"format": "csv"}).status_code == 422
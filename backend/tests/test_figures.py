@@ -0,0 +1,20 @@
+import numpy as np
+import orjson
+import plotly.graph_objects as go
+from app.utils.figures import bar, encode_figure, figure, scatter
+
+def test_builder_matches_plotly_trace_json():
+    """Üretilen sözlük, go.Figure'ün plotly.js'e gönderdiği trace ile aynıdır."""
+    x, y = ["a", "b", "c"], [1, 2, 3]
+    reference = go.Figure(go.Scatter(x=x, y=y, mode="lines+markers", name="Trend")).to_plotly_json()
+    built = figure(scatter(x, y, mode="lines+markers", name="Trend"))
+    assert built["data"] == [{**reference["data"][0], "x": x, "y": y}]
+
+def test_encoded_figure_is_embedded_without_double_encoding():
+    """NumPy dizileri kodlanır ve Fragment yanıta string olarak değil nesne olarak gömülür."""
+    fig = figure(bar(np.array(["q1", "q2"]), np.arange(2, dtype=np.float64), marker={"color": ["#fff", "#000"]}))
+    payload = orjson.loads(orjson.dumps({"components": {"roi_chart": encode_figure(fig)}}))
+    chart = payload["components"]["roi_chart"]
+    assert chart["data"][0]["type"] == "bar"
+    assert chart["data"][0]["y"] == [0.0, 1.0]
+    assert chart["layout"] == {}
@@ -0,0 +1,47 @@
+from datetime import datetime
+import numpy as np
+from app.core.services.forecasting import MonteCarloForecaster, remaining_work
+
+def test_forecast_percentiles_and_completion_dates():
+    """Sabit geçmişte tüm örnekler aynı sprint'te biter; tarih sprint uzunluğundan hesaplanır."""
+    forecaster = MonteCarloForecaster([10, 10, 10], [2, 2, 2], samples=1000, seed=0)
+    result = forecaster.forecast(remaining_points=35, remaining_items=5, start=datetime(2024, 1, 1))
+    assert result["points"]["sprints"] == {"p50": 4, "p70": 4, "p85": 4, "p95": 4}
+    assert result["points"]["completion_dates"]["p85"] == "2024-02-26T00:00:00"
+    assert result["points"]["distribution"] == [{"sprints": 4, "probability": 1.0, "cumulative": 1.0}]
+    assert result["items"]["sprints"]["p95"] == 3
+
+    bands = forecaster.velocity_bands(3)
+    assert bands["cumulative_points"]["p50"] == [10.0, 20.0, 30.0]
+
+def test_forecast_matches_brute_force_simulation():
+    """Parça parça uzatılan simülasyon, tam ufuklu düz simülasyonla aynı dağılımı verir."""
+    history = np.array([0, 3, 10, 25, 40], dtype=np.float64)
+    result = MonteCarloForecaster(history, samples=40000, seed=1).forecast(remaining_points=200)
+    cumulative = np.cumsum(history[np.random.default_rng(2).integers(0, len(history), (40000, 104))], axis=1)
+    expected = np.percentile((cumulative >= 200).argmax(axis=1) + 1, [50, 85], method="higher")
+    assert abs(result["points"]["sprints"]["p50"] - expected[0]) <= 1
+    assert abs(result["points"]["sprints"]["p85"] - expected[1]) <= 1
+    assert result["points"]["probability_within_horizon"] == 1.0
+
+def test_forecaster_from_history_and_empty_or_stalled_history():
+    """Geçmiş sprint'ler ve story'lerden kurulur; geçmiş yoksa ya da hız sıfırsa tarih verilmez."""
+    sprints = [
+        {"id": 1, "start_date": "2024-01-01", "end_date": "2024-01-08", "status": "COMPLETED", "velocity": 0},
+        {"id": 2, "start_date": "2024-01-08", "end_date": "2024-01-15", "status": "COMPLETED", "velocity": 0}
+    ]
+    stories = [
+        {"id": 1, "sprint_id": 1, "status": "DONE", "story_points": 5},
+        {"id": 2, "sprint_id": 2, "status": "DONE", "story_points": 5},
+        {"id": 3, "sprint_id": 2, "status": "TODO", "story_points": 8}
+    ]
+    forecaster = MonteCarloForecaster.from_history({"sprints": sprints, "stories": stories}, samples=500, seed=0)
+    assert forecaster.velocities.tolist() == [5.0, 5.0]
+    assert forecaster.sprint_length.days == 7
+    assert remaining_work(stories) == {"items": 1, "points": 8.0}
+    assert forecaster.forecast(remaining_points=8)["points"]["sprints"]["p50"] == 2
+
+    assert MonteCarloForecaster([]).forecast(remaining_points=10)["points"] is None
+    stalled = MonteCarloForecaster([0, 0], samples=100).forecast(remaining_points=10)
+    assert stalled["points"]["sprints"]["p50"] is None
+    assert stalled["points"]["probability_within_horizon"] == 0.0
@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from app.core.services import inference_runtime
+from app.core.services.inference_runtime import InferenceBatcher, InferenceRuntimeConfig, configure_inference_runtime
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield pool
+    pool.shutdown(wait=True)
+
+class RecordingBatchFn:
+    """Aldığı batch'leri ve aynı anda çalışan çağrı sayısını kaydeden sahte batch_fn."""
+
+    def __init__(self, delay=0.0, error=None):
+        self.delay = delay
+        self.error = error
+        self.batches = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, items):
+        with self._lock:
+            self.batches.append(list(items))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(self.delay)
+            if self.error is not None:
+                raise self.error
+            return [item * 10 for item in items]
+        finally:
+            with self._lock:
+                self.running -= 1
+
+def _run(batcher, scenario):
+    async def main():
+        try:
+            return await scenario()
+        finally:
+            await batcher.close()
+    return asyncio.run(main())
+
+def test_full_batch_flushes_without_waiting_for_timeout(executor):
+    """Batch dolunca bekleme süresi beklenmeden çalışır."""
+    batch_fn = RecordingBatchFn()
+    batcher = InferenceBatcher(batch_fn, executor, max_batch_size=3, max_wait_ms=10_000, max_in_flight=1)
+
+    async def scenario():
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(3))), timeout=1)
+
+    assert _run(batcher, scenario) == [0, 10, 20]
+    assert batch_fn.batches == [[0, 1, 2]]
+
+def test_partial_batch_flushes_after_max_wait(executor):
+    """Batch dolmasa da bekleme süresi dolunca eldeki isteklerle çalışır."""
+    batch_fn = RecordingBatchFn()
+    batcher = InferenceBatcher(batch_fn, executor, max_batch_size=10, max_wait_ms=20, max_in_flight=1)
+
+    async def scenario():
+        first = await asyncio.gather(batcher.submit(1), batcher.submit(2))
+        return first, await batcher.submit(3)
+
+    assert _run(batcher, scenario) == ([10, 20], 30)
+    assert batch_fn.batches == [[1, 2], [3]]
+
+def test_in_flight_batches_are_limited(executor):
+    """Havuzda boş thread olsa da aynı anda en fazla max_in_flight batch çalışır."""
+    batch_fn = RecordingBatchFn(delay=0.02)
+    batcher = InferenceBatcher(batch_fn, executor, max_batch_size=1, max_wait_ms=0, max_in_flight=2)
+
+    async def scenario():
+        return await asyncio.gather(*(batcher.submit(i) for i in range(8)))
+
+    assert _run(batcher, scenario) == [i * 10 for i in range(8)]
+    assert len(batch_fn.batches) == 8
+    assert batch_fn.max_running <= 2
+
+def test_batch_error_reaches_every_waiting_caller(executor):
+    """batch_fn hatası batch'teki tüm çağıranlara iletilir; sonraki batch'ler çalışmaya devam eder."""
+    batch_fn = RecordingBatchFn(error=RuntimeError("model failed"))
+    batcher = InferenceBatcher(batch_fn, executor, max_batch_size=3, max_wait_ms=1000, max_in_flight=1)
+
+    async def scenario():
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+        batch_fn.error = None
+        return results, await batcher.submit(4)
+
+    results, after = _run(batcher, scenario)
+    assert [str(result) for result in results] == ["model failed"] * 3
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert after == 40
+
+def test_cancelled_caller_is_dropped_from_batch(executor):
+    """İptal edilen çağıran batch'ten çıkarılır, diğerleri sonucunu alır."""
+    batch_fn = RecordingBatchFn()
+    batcher = InferenceBatcher(batch_fn, executor, max_batch_size=10, max_wait_ms=20, max_in_flight=1)
+
+    async def scenario():
+        first, second, third = (batcher.submit(i) for i in (1, 2, 3))
+        second.cancel()
+        return await asyncio.gather(first, third), second.cancelled()
+
+    assert _run(batcher, scenario) == ([10, 30], True)
+    assert batch_fn.batches == [[1, 3]]
+
+def test_runtime_configuration_is_applied_once(monkeypatch):
+    """Torch thread ayarları process başına bir kez uygulanır; sonraki çağrılar ilk ayarı döner."""
+    calls = []
+    monkeypatch.setattr(inference_runtime, "_runtime_config", None)
+    monkeypatch.setattr(inference_runtime.torch, "set_num_threads", lambda n: calls.append(("intra", n)))
+    monkeypatch.setattr(inference_runtime.torch, "set_num_interop_threads", lambda n: calls.append(("inter", n)))
+    monkeypatch.setattr(inference_runtime, "describe_parallelism", lambda: {})
+
+    first = configure_inference_runtime(InferenceRuntimeConfig(intra_op_threads=2, inter_op_threads=1, pool_workers=1))
+    second = configure_inference_runtime(InferenceRuntimeConfig(intra_op_threads=8, inter_op_threads=4, pool_workers=4))
+
+    assert second is first
+    assert calls == [("intra", 2), ("inter", 1)]
@@ -0,0 +1,150 @@
+import asyncio
+import pytest
+from app.core.config import settings
+from app.services import jobs
+from app.services.jobs import DELAYED_KEY, JOB_PRIORITIES, QUEUE_KEY, RUNNING_KEY, JobQueue, _queue_score, registered_job_types
+import app.services.job_handlers  # noqa: F401
+
+def test_priority_orders_before_enqueue_time():
+    """Yüksek öncelikli iş, daha önce kuyruğa girmiş düşük öncelikli işten önce alınır."""
+    earlier_low = _queue_score(JOB_PRIORITIES["low"], 1_700_000_000_000)
+    later_high = _queue_score(JOB_PRIORITIES["high"], 1_800_000_000_000)
+    later_normal = _queue_score(JOB_PRIORITIES["normal"], 1_800_000_000_000)
+    assert later_high < later_normal < earlier_low
+    # Aynı öncelikte FIFO
+    assert _queue_score(1, 1) < _queue_score(1, 2)
+
+def test_submit_rejects_unknown_type_and_priority():
+    """Geçersiz iş tipi / öncelik Redis'e yazılmadan reddedilir."""
+    assert {"sprint_report", "comprehensive_report"} <= set(registered_job_types())
+    queue = JobQueue()
+    with pytest.raises(ValueError):
+        asyncio.run(queue.submit("unknown", {}))
+    with pytest.raises(ValueError):
+        asyncio.run(queue.submit("sprint_report", {}, priority="urgent"))
+
+class Clock:
+    """jobs._now_ms yerine geçen elle ilerletilen saat."""
+
+    def __init__(self, now_ms=1_700_000_000_000):
+        self.now_ms = now_ms
+
+    def __call__(self):
+        return self.now_ms
+
+    def advance(self, seconds):
+        self.now_ms += int(seconds * 1000)
+
+@pytest.fixture
+def queue(monkeypatch):
+    """Lua betiklerini gerçekten çalıştıran fakeredis üzerinde kuyruk ve sahte saat."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    clock = Clock()
+    monkeypatch.setattr(jobs, "_now_ms", clock)
+    monkeypatch.setattr(settings, "JOB_LEASE_SECONDS", 60)
+    monkeypatch.setattr(settings, "JOB_RETRY_BACKOFF_SECONDS", 5)
+    job_queue = JobQueue(fakeredis.FakeAsyncRedis(decode_responses=True))
+    job_queue.clock = clock
+    return job_queue
+
+def test_claim_takes_highest_priority_with_a_lease(queue):
+    """Claim betiği en öncelikli işi alır, running'e lease ile koyar ve denemeyi sayar."""
+    async def scenario():
+        low = await queue.submit("sprint_report", {"n": 1}, priority="low")
+        high = await queue.submit("sprint_report", {"n": 2}, priority="high")
+        job = await queue.claim()
+        assert job["id"] == high and job["payload"] == {"n": 2} and job["attempts"] == 1
+        assert (await queue.get(high))["status"] == "running"
+        assert await queue.redis.zscore(RUNNING_KEY, high) == queue.clock() + 60_000
+        assert (await queue.claim())["id"] == low
+        assert await queue.claim() is None
+
+        assert await queue.complete(job, {"ok": True})
+        assert (await queue.get(high))["status"] == "succeeded"
+        assert await queue.get_result(high) == (True, {"ok": True})
+        assert await queue.redis.zscore(RUNNING_KEY, high) is None
+
+    asyncio.run(scenario())
+
+def test_expired_lease_requeues_until_attempts_run_out(queue):
+    """Lease'i dolan iş kuyruğa döner; eski worker sonucu yazamaz; deneme hakkı bitince failed olur."""
+    async def scenario():
+        job_id = await queue.submit("sprint_report", {}, max_attempts=2)
+        stale = await queue.claim()
+
+        queue.clock.advance(59)
+        assert await queue.promote() == 0
+        assert await queue.extend_lease(job_id)  # lease yenilendi: 59 + 60 sn
+        queue.clock.advance(61)
+        assert await queue.promote() == 1
+        assert (await queue.get(job_id))["status"] == "queued"
+        assert not await queue.complete(stale, "late")
+        assert await queue.get_result(job_id) == (False, None)
+
+        assert (await queue.claim())["attempts"] == 2
+        queue.clock.advance(61)
+        assert await queue.promote() == 1
+        state = await queue.get(job_id)
+        assert state["status"] == "failed" and state["error"] == "worker lease expired"
+        assert await queue.claim() is None
+
+    asyncio.run(scenario())
+
+def test_failed_job_retries_after_exponential_backoff(queue):
+    """Hata sonrası iş delayed kümesine geri çekilme ile girer, zamanı gelince promote edilir."""
+    async def scenario():
+        job_id = await queue.submit("sprint_report", {}, max_attempts=3)
+        assert await queue.fail(await queue.claim(), "boom") == "retrying"
+        assert await queue.redis.zscore(DELAYED_KEY, job_id) == queue.clock() + 5_000
+        assert (await queue.get(job_id))["status"] == "retrying"
+
+        queue.clock.advance(4)
+        assert await queue.promote() == 0 and await queue.claim() is None
+        queue.clock.advance(1)
+        assert await queue.promote() == 1
+        assert (await queue.get(job_id))["status"] == "queued"
+
+        second = await queue.claim()
+        assert second["attempts"] == 2
+        assert await queue.fail(second, "boom") == "retrying"
+        assert await queue.redis.zscore(DELAYED_KEY, job_id) == queue.clock() + 10_000
+        queue.clock.advance(10)
+        await queue.promote()
+        assert await queue.fail(await queue.claim(), "boom") == "failed"
+        state = await queue.get(job_id)
+        assert state["status"] == "failed" and state["attempts"] == 3 and state["error"] == "boom"
+
+    asyncio.run(scenario())
+
+def test_cancel_queued_delayed_and_running_jobs(queue):
+    """Kuyruktaki ve bekleyen iş hemen iptal olur; çalışan iş için iptal istenir ve yeniden denenmez."""
+    async def scenario():
+        queued = await queue.submit("sprint_report", {})
+        assert await queue.cancel(queued) == "cancelled"
+        assert await queue.redis.zscore(QUEUE_KEY, queued) is None
+        assert await queue.claim() is None
+
+        delayed = await queue.submit("sprint_report", {})
+        await queue.fail(await queue.claim(), "boom")
+        assert await queue.cancel(delayed) == "cancelled"
+        queue.clock.advance(60)
+        assert await queue.promote() == 0
+        assert (await queue.get(delayed))["status"] == "cancelled"
+
+        running = await queue.submit("sprint_report", {})
+        job = await queue.claim()
+        assert await queue.cancel(running) == "running"
+        assert (await queue.get(running))["cancel_requested"]
+        assert await queue.fail(job, "interrupted") == "failed"
+
+        # İptal istenmiş işin worker'ı ölürse lease dolunca cancelled olur
+        orphan = await queue.submit("sprint_report", {})
+        await queue.claim()
+        await queue.cancel(orphan)
+        queue.clock.advance(61)
+        assert await queue.promote() == 1
+        assert (await queue.get(orphan))["status"] == "cancelled"
+        assert await queue.cancel("missing") is None
+
+    asyncio.run(scenario())
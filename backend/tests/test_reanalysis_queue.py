@@ -0,0 +1,70 @@
+import asyncio
+from app.core.services.reanalysis_queue import SprintReanalysisQueue
+
+def test_done_events_coalesced_per_sprint():
+    """Debounce penceresindeki DONE olayları sprint başına tek analize düşer."""
+    queue = SprintReanalysisQueue(debounce_seconds=0.05, max_delay_seconds=1.0)
+    runs = []
+
+    async def analyze(sprint_id):
+        runs.append(sprint_id)
+        return {"sprint_id": sprint_id, "velocity": 13}
+
+    async def scenario():
+        for _ in range(30):
+            queue.schedule(1, analyze)
+        queue.schedule(2, analyze)
+        assert queue.is_pending(1)
+        assert runs == []
+        await queue.drain()
+
+    asyncio.run(scenario())
+    assert sorted(runs) == [1, 2]
+    latest = queue.get_latest(1)
+    assert latest["result"]["velocity"] == 13
+    assert latest["coalesced_events"] == 30
+
+def test_event_during_analysis_triggers_one_more_run():
+    """Analiz sürerken gelen olay, analiz bitince bir tur daha çalıştırır."""
+    queue = SprintReanalysisQueue(debounce_seconds=0.01, max_delay_seconds=1.0)
+    runs = []
+
+    async def analyze(sprint_id):
+        runs.append(sprint_id)
+        if len(runs) == 1:
+            queue.schedule(sprint_id, analyze)
+        await asyncio.sleep(0.01)
+        return len(runs)
+
+    async def scenario():
+        queue.schedule(5, analyze)
+        await queue.drain()
+
+    asyncio.run(scenario())
+    assert runs == [5, 5]
+    assert queue.get_latest(5)["result"] == 2
+
+def test_session_scoped_analyzer_uses_its_own_session():
+    """Analiz, isteğin repository'leriyle değil, kendi açtığı session'ın repository'leriyle çalışır."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from app.core.services.reanalysis_queue import session_scoped_analyzer
+
+    class UseCase:
+        def __init__(self, sprint_repo):
+            self.sprint_repo = sprint_repo
+
+        async def analyze_sprint_performance(self, sprint_id):
+            return {"sprint_id": sprint_id, "session": self.sprint_repo.session}
+
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        request_repo = object()
+        use_case = UseCase(request_repo)
+        result = await session_scoped_analyzer(use_case, session_factory=async_sessionmaker(engine))(3)
+        await engine.dispose()
+        return use_case, request_repo, result
+
+    use_case, request_repo, result = asyncio.run(scenario())
+    assert result["sprint_id"] == 3
+    assert isinstance(result["session"], AsyncSession)
+    assert use_case.sprint_repo is request_repo
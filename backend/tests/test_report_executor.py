@@ -0,0 +1,146 @@
+import asyncio
+import time
+import pytest
+from app.core.services.report_executor import ReportExecutor, ReportSection
+from app.core.services.section_cache import SectionCache
+
+def test_independent_sections_run_concurrently_and_share_inputs():
+    """Bağımsız bölümler paralel çalışır; ortak girdi bir kez hesaplanır."""
+    calls = []
+    spans = {}
+
+    async def shared(_):
+        calls.append("shared")
+        await asyncio.sleep(0.01)
+        return {"health": 0.8}
+
+    def slow_section(name):
+        async def build(results):
+            started = time.perf_counter()
+            await asyncio.sleep(0.05)
+            spans[name] = (started, time.perf_counter())
+            return {"name": name, "health": results["shared"]["health"]}
+        return build
+
+    executor = ReportExecutor([
+        ReportSection("shared", shared, internal=True),
+        *[ReportSection(name, slow_section(name), depends_on=["shared"]) for name in ("a", "b", "c")]
+    ])
+    run = asyncio.run(executor.run())
+
+    assert calls == ["shared"]
+    # Sıralı çalışsaydı her bölüm bir öncekinin bitişinden sonra başlardı
+    assert max(start for start, _ in spans.values()) < min(end for _, end in spans.values())
+    assert set(run.results) == {"a", "b", "c"}
+    assert run.results["b"] == {"name": "b", "health": 0.8}
+    assert not run.degraded
+
+def test_failed_and_slow_sections_degrade_to_fallback():
+    """Hata ve zaman aşımı fallback'e düşer, bağımlılar atlanır, diğer bölümler etkilenmez."""
+    async def broken(_):
+        raise RuntimeError("boom")
+
+    async def slow(_):
+        await asyncio.sleep(1)
+        return "late"
+
+    async def ok(_):
+        return "fine"
+
+    async def dependent(results):
+        return results["broken"]["value"]
+
+    run = asyncio.run(ReportExecutor([
+        ReportSection("broken", broken, fallback={}),
+        ReportSection("slow", slow, timeout=0.05, fallback="n/a"),
+        ReportSection("ok", ok),
+        ReportSection("dependent", dependent, depends_on=["broken"], fallback=[])
+    ]).run())
+
+    assert run.results == {"broken": {}, "slow": "n/a", "ok": "fine", "dependent": []}
+    assert run.sections["broken"]["status"] == "failed"
+    assert run.sections["slow"]["status"] == "timeout"
+    assert run.sections["dependent"]["status"] == "skipped"
+    assert run.degraded
+
+def test_cycles_and_unknown_dependencies_are_rejected():
+    async def noop(_):
+        return None
+
+    with pytest.raises(ValueError):
+        ReportExecutor([ReportSection("a", noop, depends_on=["b"]), ReportSection("b", noop, depends_on=["a"])])
+    with pytest.raises(ValueError):
+        ReportExecutor([ReportSection("a", noop, depends_on=["missing"])])
+
+def test_cached_sections_recompute_only_when_their_inputs_change():
+    """Yalnızca girdisi değişen bölüm (ve ona bağlı olanlar) yeniden hesaplanır; etiketle düşürülebilir."""
+    cache = SectionCache(max_entries=100, ttl=60)
+    calls = []
+
+    def tracked(name, value):
+        async def build(results):
+            calls.append(name)
+            return {"value": value, **results}
+        return build
+
+    def sections(project):
+        return [
+            ReportSection("health", tracked("health", project["scope"]), internal=True,
+                          inputs=project["scope"], tags=[("project", 1)]),
+            ReportSection("team", tracked("team", project["team"]), internal=True,
+                          inputs=project["team"], tags=[("team", 1)]),
+            ReportSection("health_report", tracked("health_report", None), depends_on=["health"]),
+            ReportSection("team_report", tracked("team_report", None), depends_on=["team"])
+        ]
+
+    project = {"scope": ["login"], "team": ["ayse"]}
+    asyncio.run(ReportExecutor(sections(project), cache=cache).run())
+    assert sorted(calls) == ["health", "health_report", "team", "team_report"]
+
+    calls.clear()
+    run = asyncio.run(ReportExecutor(sections({**project, "team": ["ayse", "mehmet"]}), cache=cache).run())
+    assert sorted(calls) == ["team", "team_report"]
+    assert run.sections["health_report"]["cached"]
+    assert "health" not in run.sections  # önbellekten gelen bölümün bağımlılığı çalışmadı
+    assert run.results["team_report"]["team"]["value"] == ["ayse", "mehmet"]
+
+    calls.clear()
+    assert cache.invalidate(("team", 1)) == 4  # iki ekip sürümünün team ve team_report kayıtları
+    asyncio.run(ReportExecutor(sections(project), cache=cache).run())
+    assert sorted(calls) == ["team", "team_report"]
+
+def test_report_builders_receive_only_their_keyed_fields():
+    """Analizler yalnızca anahtarlandıkları alanları alır; başka alan değişince önbellekten gelir."""
+    from app.core.services.reporting_service import ReportingService
+    received = {}
+
+    class Recorder:
+        def __init__(self, name, result):
+            self.name, self.result = name, result
+
+        async def __call__(self, data, *args):
+            received.setdefault(self.name, []).append(data)
+            return self.result
+
+    class Services:
+        pass
+
+    health, team, bi = Services(), Services(), Services()
+    health.calculate_project_health = Recorder("health", {
+        "health_metrics": {}, "trend_analysis": {}, "risk_assessment": [], "improvements": []
+    })
+    team.analyze_team_performance = Recorder("team", {
+        "performance_metrics": {}, "skill_analysis": {}, "motivation_analysis": {}, "improvement_recommendations": []
+    })
+    bi.analyze_market_trends = Recorder("market", {"recommendations": []})
+    bi.calculate_roi = Recorder("roi", {"recommendations": []})
+    service = ReportingService(None, bi, team, health, section_cache=SectionCache(max_entries=100, ttl=60))
+
+    project = {"id": 1, "name": "Proje", "sprints": [], "team": {"id": 3}, "market": ["saas"]}
+    asyncio.run(service.generate_comprehensive_report(project))
+    asyncio.run(service.generate_comprehensive_report({**project, "team": {"id": 3, "size": 5}}))
+
+    assert received["health"] == [{"id": 1, "name": "Proje", "sprints": []}]
+    assert received["market"] == [{"id": 1, "name": "Proje", "market": ["saas"]}]
+    assert received["roi"] == [{"id": 1, "name": "Proje"}]
+    assert [data["team"] for data in received["team"]] == [{"id": 3}, {"id": 3, "size": 5}]
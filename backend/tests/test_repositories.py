@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.core.domain.entities import UserStory, Sprint, Stakeholder, Feedback
+from app.database.database import Base
+from app.database.repositories import SqlRepositories
+from app.models import task, sprint, backlog_item, stakeholder, feedback  # noqa: F401
+
+def _run(scenario):
+    """Senaryoyu bellek içi SQLite üzerinde, SELECT sayısını ölçerek çalıştırır."""
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        selects = []
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            result = await scenario(SqlRepositories(session), selects)
+        await engine.dispose()
+        return result
+
+    return asyncio.run(main())
+
+def _story(title, sprint_id=None, status="TODO"):
+    now = datetime.utcnow()
+    return UserStory(
+        title=title, description=title, acceptance_criteria=["kriter"], priority="MEDIUM",
+        story_points=3, status=status, sprint_id=sprint_id, created_at=now, updated_at=now
+    )
+
+def test_get_many_batches_into_one_query():
+    """Eşzamanlı get_by_id çağrıları tek sorguda yüklenir ve istek içinde önbelleklenir."""
+    async def scenario(repos, selects):
+        created = [await repos.user_stories.create(_story(f"Story {i}")) for i in range(3)]
+        repos.user_stories.loader.clear_all()
+        selects.clear()
+
+        ids = [story.id for story in created]
+        stories = await asyncio.gather(*[repos.user_stories.get_by_id(story_id) for story_id in ids + [999]])
+        again = await repos.user_stories.get_many(ids)
+        return stories, again, len(selects)
+
+    stories, again, select_count = _run(scenario)
+    assert [story.title for story in stories[:3]] == ["Story 0", "Story 1", "Story 2"]
+    assert stories[3] is None
+    assert [story.title for story in again] == ["Story 0", "Story 1", "Story 2"]
+    assert select_count == 1
+
+def test_filtered_queries():
+    """Sprint, durum ve stakeholder filtreleri."""
+    async def scenario(repos, selects):
+        now = datetime.utcnow()
+        first = await repos.sprints.create(Sprint(
+            name="Sprint 1", start_date=now, end_date=now + timedelta(days=14), goal="MVP",
+            status="ACTIVE", velocity=20.0, created_at=now, updated_at=now
+        ))
+        await repos.user_stories.create(_story("Login", sprint_id=first.id, status="DONE"))
+        await repos.user_stories.create(_story("Rapor", sprint_id=first.id))
+        await repos.user_stories.create(_story("Backlog"))
+
+        owner = await repos.stakeholders.create(Stakeholder(
+            name="Ayşe", role="PM", email="ayse@example.com", created_at=now, updated_at=now
+        ))
+        await repos.feedback.create(Feedback(
+            stakeholder_id=owner.id, content="Hızlı olmalı", type="PERFORMANCE",
+            priority="HIGH", status="NEW", created_at=now, updated_at=now
+        ))
+
+        return (
+            await repos.user_stories.get_by_sprint(first.id),
+            await repos.user_stories.get_by_status("DONE"),
+            await repos.sprints.get_active(),
+            await repos.feedback.get_by_stakeholder(owner.id)
+        )
+
+    in_sprint, done, active, feedbacks = _run(scenario)
+    assert sorted(story.title for story in in_sprint) == ["Login", "Rapor"]
+    assert [story.title for story in done] == ["Login"]
+    assert active.goal == "MVP"
+    assert [f.content for f in feedbacks] == ["Hızlı olmalı"]
+
+def test_recent_sprints_and_sprint_story_memo():
+    """Son sprint'lerin story'leri tek sorguda gelir; aynı istekte tekrar sorulunca sorgu atılmaz."""
+    async def scenario(repos, selects):
+        start = datetime(2024, 1, 1)
+        sprints = []
+        for i in range(4):
+            sprints.append(await repos.sprints.create(Sprint(
+                name=f"Sprint {i}", start_date=start + timedelta(days=14 * i),
+                end_date=start + timedelta(days=14 * i + 13), goal="", status="CLOSED",
+                velocity=10.0 + i, created_at=start, updated_at=start
+            )))
+            await repos.user_stories.create(_story(f"Story {i}", sprint_id=sprints[-1].id))
+
+        recent = await repos.sprints.get_recent(2)
+        selects.clear()
+        stories = await asyncio.gather(*[repos.user_stories.get_by_sprint(s.id) for s in recent])
+        await repos.user_stories.get_by_sprint(recent[0].id)
+        return recent, stories, len(selects)
+
+    recent, stories, select_count = _run(scenario)
+    assert [s.name for s in recent] == ["Sprint 3", "Sprint 2"]
+    assert [[story.title for story in group] for group in stories] == [["Story 3"], ["Story 2"]]
+    assert select_count == 1
@@ -0,0 +1,53 @@
+from app.core.services.sprint_metrics import SprintMetricsEngine
+
+SPRINTS = [
+    {"id": 1, "start_date": "2024-01-01", "end_date": "2024-01-14", "status": "COMPLETED", "velocity": 0},
+    {"id": 2, "start_date": "2024-01-15", "end_date": "2024-01-28", "status": "COMPLETED", "velocity": 0}
+]
+
+TASKS = [
+    {"id": 1, "sprint_id": 1, "status": "DONE", "story_points": 5, "assignee": "ayse",
+     "created_at": "2024-01-01T00:00:00", "updated_at": "2024-01-03T00:00:00"},
+    {"id": 2, "sprint_id": 1, "status": "DONE", "story_points": 3, "assignee": "mehmet",
+     "created_at": "2024-01-01T00:00:00", "updated_at": "2024-01-02T00:00:00"},
+    {"id": 3, "sprint_id": 2, "status": "IN_PROGRESS", "story_points": 8, "assignee": "ayse",
+     "created_at": "2024-01-16T00:00:00", "updated_at": "2024-01-20T00:00:00"},
+    {"id": 4, "sprint_id": 2, "status": "DONE", "story_points": 2, "assignee": None,
+     "created_at": "2024-01-15T00:00:00", "updated_at": "2024-01-15T12:00:00"}
+]
+
+def test_sprint_metrics_from_task_rows():
+    """Velocity, carry-over, kapsam değişikliği, cycle time ve kişi başı yük task'lardan hesaplanır."""
+    engine = SprintMetricsEngine.from_records(TASKS, SPRINTS)
+    metrics = engine.sprint_metrics(2)
+    assert metrics["story_points_planned"] == 10.0
+    assert metrics["story_points_completed"] == 2.0
+    assert metrics["completion_rate"] == 0.2
+    assert metrics["carry_over"] == {"tasks": 1, "points": 8.0}
+    assert metrics["scope_added"] == 1
+    assert metrics["cycle_time_hours"]["median"] == 12.0
+    assert [point["velocity"] for point in metrics["velocity_history"]] == [8.0, 2.0]
+    assert metrics["average_velocity"] == 5.0
+    load = {row["assignee"]: row for row in metrics["assignee_load"]}
+    assert load["ayse"]["open_points"] == 8.0 and load["ayse"]["in_progress"] == 1
+    assert load["unassigned"]["completed_points"] == 2.0
+
+def test_apply_recomputes_only_affected_sprints():
+    """Artımlı güncelleme, baştan kurulan motorla aynı sonucu verir."""
+    engine = SprintMetricsEngine.from_records(TASKS, SPRINTS)
+    moved = {**TASKS[1], "sprint_id": 2, "status": "TODO"}
+    assert engine.apply(tasks=[moved], deleted_task_ids=[4]) == {1, 2}
+
+    rebuilt = SprintMetricsEngine.from_records([TASKS[0], moved, TASKS[2]], SPRINTS)
+    for sprint_id in (1, 2):
+        assert engine.sprint_metrics(sprint_id) == rebuilt.sprint_metrics(sprint_id)
+
+def test_team_metrics_reads_nested_sprint_stories_and_handles_empty_data():
+    """Sprint içindeki story listeleri okunur; veri yoksa metrikler sıfırdır."""
+    sprints = [{**SPRINTS[0], "stories": [{k: v for k, v in task.items() if k != "sprint_id"} for task in TASKS[:2]]}]
+    metrics = SprintMetricsEngine.from_team_data({"sprints": sprints}).team_metrics()
+    assert metrics["velocity"] == 8.0
+    assert metrics["throughput"] == 2
+
+    empty = SprintMetricsEngine.from_team_data({}).team_metrics()
+    assert empty["velocity"] == 0.0 and empty["assignee_load"] == []
@@ -0,0 +1,86 @@
+import asyncio
+import os
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.core.services.story_point_predictor import StoryPointPredictor
+from app.database.database import Base
+from app.models import task, sprint  # noqa: F401
+from app.models.task import Task
+
+def _stories(count, offset=0):
+    # Açıklama ve kabul kriteri arttıkça puan büyür
+    return [
+        {
+            "title": f"Story {offset + i}",
+            "description": " ".join(["api entegrasyonu"] * (i % 5 + 1)),
+            "acceptance_criteria": ["kriter"] * (i % 5),
+            "priority": "HIGH",
+            "story_points": [1, 2, 3, 5, 8][i % 5]
+        }
+        for i in range(count)
+    ]
+
+def test_fitted_model_is_persisted_and_served_in_batches(tmp_path):
+    """Eğitilen model diske yazılır; yeni örnek model dosyadan yükleyip tek çağrıda tahmin eder."""
+    path = str(tmp_path / "model.joblib")
+    assert StoryPointPredictor(path=path).predict(_stories(2)) == [None, None]
+
+    trainer = StoryPointPredictor(path=path, min_training_samples=10, refit_min_samples=5)
+    trainer.fit(_stories(50))
+    server = StoryPointPredictor(path=path, min_training_samples=10, refit_min_samples=5)
+    assert server.predict(_stories(5)) == [1, 2, 3, 5, 8]
+    assert server.info()["trained_samples"] == 50
+    assert not server.needs_refit(50, 4) and server.needs_refit(50, 5)
+
+    # Başka process yeniden eğittiğinde dosya değişir, sunan örnek yeni modeli yükler
+    trainer.fit(_stories(60))
+    os.utime(path, (0, 0))
+    assert server.info()["trained_samples"] == 60
+
+def test_refresh_refits_only_when_enough_new_samples(tmp_path):
+    """refresh() az örnekle eğitmez, yeni örnek birikince eğitir; silinenler yenileri götürmez."""
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        predictor = StoryPointPredictor(path=str(tmp_path / "model.joblib"), min_training_samples=20, refit_min_samples=10)
+        results = []
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            for batch in (_stories(15), _stories(10, 15), _stories(5, 25), _stories(5, 30)):
+                session.add_all(Task(status="DONE", **story) for story in batch)
+                await session.commit()
+                results.append(await predictor.refresh(session))
+            # Toplam değişmese de son eğitimden sonra tamamlanan 10 story yeniden eğitir
+            for task in (await session.scalars(select(Task).limit(10))).all():
+                await session.delete(task)
+            session.add_all(Task(status="DONE", **story) for story in _stories(10, 35))
+            await session.commit()
+            results.append(await predictor.refresh(session))
+        await engine.dispose()
+        return results, predictor.trained_samples
+
+    results, trained_samples = asyncio.run(main())
+    assert results == [False, True, False, True, True]
+    assert trained_samples == 35
+
+def test_done_transitions_from_task_api_are_counted_after_commit(client, monkeypatch):
+    """Task API'sinde DONE'a geçen puanlı task'lar commit'ten sonra modele yeni örnek olarak bildirilir."""
+    from app.core.services.story_point_predictor import get_story_point_predictor
+    counted = []
+    monkeypatch.setattr(get_story_point_predictor(), "note_completed", counted.append)
+
+    created = client.post("/api/v1/tasks/bulk", json=[
+        {"title": "Login", "story_points": 5},
+        {"title": "Profil", "story_points": 3},
+        {"title": "Taslak"}
+    ]).json()["items"]
+    login, profile, draft = (task["id"] for task in created)
+    assert counted == []
+
+    assert client.patch("/api/v1/tasks/bulk", json=[
+        {"id": login, "status": "DONE"}, {"id": profile, "status": "DONE"}, {"id": draft, "status": "DONE"}
+    ]).status_code == 200
+    assert counted == [2]
+    # Zaten DONE olan task'ın başka alanı değişince yeni örnek sayılmaz
+    assert client.patch(f"/api/v1/tasks/{login}", json={"title": "Login v2"}).status_code == 200
+    assert counted == [2]
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import func, select
+from app.models.sprint import Sprint
+from app.models.task import Task
+from app.models.task_event import TaskEvent, SprintStatusTotal
+from app.services.cache import ReadThroughCache, get_cache
+
+def _sprint(db_session, name, days_ago=3, length=10):
+    start = datetime.utcnow() - timedelta(days=days_ago)
+    sprint = Sprint(name=name, start_date=start, end_date=start + timedelta(days=length), status="ACTIVE")
+    db_session.add(sprint)
+    db_session.commit()
+    return sprint.id
+
+def test_task_writes_maintain_event_log_and_sprint_views(client, db_session):
+    """Oluşturma, durum değişikliği, taşıma ve silme olay yazar; toplamlar ve grafikler bunlardan gelir."""
+    sprint_id = _sprint(db_session, "Sprint 1")
+    other_id = _sprint(db_session, "Sprint 2")
+    created = client.post("/api/v1/tasks/bulk", json=[
+        {"title": "Login", "sprint_id": sprint_id, "story_points": 5},
+        {"title": "Profil", "sprint_id": sprint_id, "story_points": 3},
+        {"title": "Rapor", "sprint_id": sprint_id, "story_points": 8},
+        {"title": "Arama", "sprint_id": sprint_id, "story_points": 2}
+    ]).json()["items"]
+    login, profile, report, search = (task["id"] for task in created)
+
+    assert client.patch(f"/api/v1/tasks/{login}", json={"status": "IN_PROGRESS"}).status_code == 200
+    assert client.patch(f"/api/v1/tasks/{login}", json={"status": "DONE"}).status_code == 200
+    assert client.patch("/api/v1/tasks/bulk", json=[{"id": profile, "sprint_id": other_id}]).status_code == 200
+    assert client.delete(f"/api/v1/tasks/{search}").status_code == 200
+    # Takip edilmeyen alan olay üretmez
+    assert client.patch(f"/api/v1/tasks/{report}", json={"title": "Rapor v2"}).status_code == 200
+
+    assert db_session.scalar(select(func.count()).select_from(TaskEvent)) == 9
+
+    status = client.get(f"/api/v1/sprints/{sprint_id}/status").json()
+    assert status["statuses"] == {"DONE": {"tasks": 1, "points": 5}, "TODO": {"tasks": 1, "points": 8}}
+    assert status["completed_points"] == 5 and status["remaining_points"] == 8
+
+    # Artımlı toplamlar task tablosundan baştan hesaplananla aynı
+    totals = {
+        (row.sprint_id, row.status): (row.task_count, row.points)
+        for row in db_session.scalars(select(SprintStatusTotal)) if row.task_count
+    }
+    expected = {
+        (row.sprint_id, row.status): (row.count, row.points)
+        for row in db_session.execute(
+            select(Task.sprint_id, Task.status, func.count().label("count"), func.sum(Task.story_points).label("points"))
+            .group_by(Task.sprint_id, Task.status)
+        )
+    }
+    assert totals == expected
+
+    burndown = client.get(f"/api/v1/sprints/{sprint_id}/burndown").json()
+    assert len(burndown["dates"]) == 4
+    assert burndown["remaining_points"][-1] == 8.0
+    assert burndown["scope_points"][-1] == 13.0
+
+    flow = client.get(f"/api/v1/sprints/{sprint_id}/cumulative-flow").json()
+    assert list(flow["statuses"]) == ["TODO", "IN_PROGRESS", "DONE"]
+    assert flow["statuses"]["DONE"][-1] == 1 and flow["statuses"]["TODO"][-1] == 1
+    assert flow["statuses"]["IN_PROGRESS"][-1] == 0
+
+    cycle = client.get(f"/api/v1/sprints/{sprint_id}/cycle-time").json()
+    assert cycle["tasks"] == 1
+
+    # Satırdaki oluşturma zamanı değil, durum geçişleri ölçülür
+    db_session.execute(Task.__table__.update().where(Task.id == login).values(created_at=datetime.utcnow() - timedelta(days=2)))
+    db_session.commit()
+    metrics = client.get(f"/api/v1/sprints/{sprint_id}/metrics").json()
+    assert metrics["velocity"] == 5.0 and metrics["story_points_planned"] == 13.0
+    assert metrics["tasks"] == 2 and metrics["throughput"] == 1
+    # Metriklerdeki cycle time /cycle-time ile aynı olay verisinden gelir
+    assert metrics["cycle_time_hours"] == {"mean": cycle["mean_hours"], "median": cycle["median_hours"], "p85": cycle["p85_hours"]}
+    # Sonraki task yazması metriklere yansır
+    assert client.patch(f"/api/v1/tasks/{report}", json={"status": "DONE"}).status_code == 200
+    assert client.get(f"/api/v1/sprints/{sprint_id}/metrics").json()["velocity"] == 13.0
+
+    assert client.get("/api/v1/sprints/999999/burndown").status_code == 404
+
+def test_cached_sprint_metrics_follow_earlier_sprint_writes(client, db_session):
+    """Önceki sprint'teki task yazması sonraki sprint'in önbellekteki metriklerinde ortalamaya yansır."""
+    fakeredis = pytest.importorskip("fakeredis")
+    redis_client = fakeredis.FakeAsyncRedis()
+    client.app.dependency_overrides[get_cache] = lambda: ReadThroughCache(redis_client=redis_client)
+    previous_id = _sprint(db_session, "Sprint 1", days_ago=20, length=10)
+    current_id = _sprint(db_session, "Sprint 2", days_ago=5, length=10)
+    created = client.post("/api/v1/tasks/bulk", json=[
+        {"title": "Login", "sprint_id": previous_id, "story_points": 5, "status": "DONE"},
+        {"title": "Rapor", "sprint_id": previous_id, "story_points": 8},
+        {"title": "Arama", "sprint_id": current_id, "story_points": 3, "status": "DONE"}
+    ]).json()["items"]
+
+    metrics = client.get(f"/api/v1/sprints/{current_id}/metrics").json()
+    assert [point["velocity"] for point in metrics["velocity_history"]] == [5.0, 3.0]
+    assert metrics["average_velocity"] == 4.0
+
+    assert client.patch(f"/api/v1/tasks/{created[1]['id']}", json={"status": "DONE"}).status_code == 200
+    metrics = client.get(f"/api/v1/sprints/{current_id}/metrics").json()
+    assert [point["velocity"] for point in metrics["velocity_history"]] == [13.0, 3.0]
+    assert metrics["average_velocity"] == 8.0
+    # Bu sprint'in kendi görünümü önbellekten gelmeye devam eder
+    assert metrics["velocity"] == 3.0 and metrics["tasks"] == 1
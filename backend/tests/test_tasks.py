@@ -0,0 +1,235 @@
+import re
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from app.routers.tasks import SPRINT_FK_CONSTRAINT, _integrity_error, _patch_statement
+
+def _create_task(client, **fields):
+    payload = {"title": "Login sayfası", "description": "OAuth ile giriş", "priority": "HIGH"}
+    payload.update(fields)
+    response = client.post("/api/v1/tasks/", json=payload)
+    assert response.status_code == 200
+    return response.json()
+
+def test_create_and_get_task(client):
+    """Task oluşturma ve okuma testi."""
+    task = _create_task(client)
+    assert task["status"] == "TODO"
+
+    response = client.get(f"/api/v1/tasks/{task['id']}")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Login sayfası"
+
+def test_update_task(client):
+    """Task güncelleme testi."""
+    task = _create_task(client)
+    response = client.put(
+        f"/api/v1/tasks/{task['id']}",
+        json={"title": "Login sayfası", "status": "IN_PROGRESS", "priority": "HIGH"}
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "IN_PROGRESS"
+
+def test_delete_task(client):
+    """Task silme testi."""
+    task = _create_task(client)
+    response = client.delete(f"/api/v1/tasks/{task['id']}")
+    assert response.status_code == 200
+
+    response = client.get(f"/api/v1/tasks/{task['id']}")
+    assert response.status_code == 404
+
+def test_get_missing_task(client):
+    """Olmayan task için 404 testi."""
+    response = client.get("/api/v1/tasks/999999")
+    assert response.status_code == 404
+
+def test_list_tasks_with_cursor(client):
+    """Cursor tabanlı sayfalama testi."""
+    created = [_create_task(client, title=f"Task {i}")["id"] for i in range(5)]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/tasks/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(set(seen))
+
+def test_list_tasks_filters_and_fields(client):
+    """Sunucu tarafı filtre ve seçili alan testi."""
+    _create_task(client, title="Açık", status="TODO")
+    done = _create_task(client, title="Bitti", status="DONE")
+
+    response = client.get("/api/v1/tasks/", params={"status": "DONE", "fields": "id,status"})
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": done["id"], "status": "DONE"}]
+
+    response = client.get("/api/v1/tasks/", params={"fields": "id,secret"})
+    assert response.status_code == 400
+
+def test_bulk_create_tasks(client):
+    """Toplu task oluşturma ve satır bazlı hata testi."""
+    response = client.post(
+        "/api/v1/tasks/bulk",
+        json=[
+            {"title": "API tasarımı"},
+            {"title": "Olmayan sprint", "sprint_id": 999999},
+            {"title": "Testler", "priority": "LOW"}
+        ]
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [task["title"] for task in data["items"]] == ["API tasarımı", "Testler"]
+    assert data["errors"] == [{"index": 1, "id": None, "detail": "Sprint not found"}]
+
+def test_bulk_update_tasks(client):
+    """Toplu kısmi güncelleme testi."""
+    first = _create_task(client, title="Birinci")
+    second = _create_task(client, title="İkinci")
+
+    response = client.patch(
+        "/api/v1/tasks/bulk",
+        json=[
+            {"id": first["id"], "status": "DONE"},
+            {"id": second["id"], "priority": "LOW", "status": "IN_PROGRESS"},
+            {"id": 999999, "status": "DONE"}
+        ]
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [(task["id"], task["status"]) for task in data["items"]] == [
+        (first["id"], "DONE"),
+        (second["id"], "IN_PROGRESS")
+    ]
+    assert data["items"][0]["title"] == "Birinci"
+    assert data["items"][1]["priority"] == "LOW"
+    assert data["errors"][0]["id"] == 999999
+
+def test_bulk_delete_tasks(client):
+    """Toplu silme testi."""
+    task = _create_task(client)
+    response = client.request("DELETE", "/api/v1/tasks/bulk", json={"ids": [task["id"], 999999]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["deleted"] == [task["id"]]
+    assert data["errors"][0]["id"] == 999999
+
+def test_patch_task_partial(client):
+    """PATCH yalnızca gönderilen alanları değiştirir ve version'ı artırır."""
+    task = _create_task(client)
+    assert task["version"] == 1
+
+    response = client.patch(f"/api/v1/tasks/{task['id']}", json={"status": "DONE"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "DONE"
+    assert data["title"] == task["title"]
+    assert data["priority"] == task["priority"]
+    assert data["version"] == 2
+
+def test_patch_task_if_match(client):
+    """If-Match version uyuşmazlığında 412, olmayan task için 404 testi."""
+    task = _create_task(client)
+
+    response = client.patch(
+        f"/api/v1/tasks/{task['id']}", json={"status": "IN_PROGRESS"}, headers={"If-Match": '"1"'}
+    )
+    assert response.status_code == 200
+
+    response = client.patch(
+        f"/api/v1/tasks/{task['id']}", json={"status": "DONE"}, headers={"If-Match": '"1"'}
+    )
+    assert response.status_code == 412
+
+    response = client.patch("/api/v1/tasks/999999", json={"status": "DONE"}, headers={"If-Match": '"1"'})
+    assert response.status_code == 404
+
+def test_get_task_etag(client):
+    """Değişmeyen task için If-None-Match ile 304, değişince 200 testi."""
+    task = _create_task(client)
+    response = client.get(f"/api/v1/tasks/{task['id']}")
+    etag = response.headers["ETag"]
+
+    response = client.get(f"/api/v1/tasks/{task['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = client.patch(f"/api/v1/tasks/{task['id']}", json={"status": "DONE"}, headers={"If-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+    response = client.get(f"/api/v1/tasks/{task['id']}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+def test_list_tasks_etag(client):
+    """Liste ETag'i satır sürümleri değişince değişir."""
+    task = _create_task(client)
+    etag = client.get("/api/v1/tasks/").headers["ETag"]
+
+    response = client.get("/api/v1/tasks/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    client.patch(f"/api/v1/tasks/{task['id']}", json={"priority": "LOW"})
+    response = client.get("/api/v1/tasks/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def _task_statements(client, method, url, **kwargs):
+    """İstek sırasında tasks tablosuna giden SQL ifadelerini toplar."""
+    statements = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if re.search(r"\btasks\b", statement):
+            statements.append(statement.split()[0].upper())
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        response = client.request(method, url, **kwargs)
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    return statements
+
+def test_patch_task_statement_count(client):
+    """Olay üretmeyen PATCH tek UPDATE'tir; status PATCH'i SQLite'ta yalnızca bir kilitli okuma ekler."""
+    task = _create_task(client)
+    url = f"/api/v1/tasks/{task['id']}"
+
+    assert _task_statements(client, "PATCH", url, json={"priority": "LOW"}) == ["UPDATE"]
+    assert _task_statements(client, "PATCH", url, json={"status": "DONE"}) == ["SELECT", "UPDATE"]
+
+def test_patch_statement_returns_prior_state_on_postgresql():
+    """PostgreSQL'de önceki durum ayrı SELECT yerine kilitli alt sorgu ile UPDATE'ten döner."""
+    sql = str(_patch_statement(1, {"status": "DONE"}, None, True).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("UPDATE tasks SET")
+    assert "FOR UPDATE) AS \"old\"" in sql
+    assert "\"old\".status AS old_status" in sql
+
+class _DriverError(Exception):
+    def __init__(self, message, constraint_name=None):
+        super().__init__(message)
+        self.constraint_name = constraint_name
+
+def test_integrity_errors_map_to_constraint():
+    """Yalnızca sprint yabancı anahtarı 400 "Sprint not found" olur; diğer ihlaller kısıt adıyla 409 döner."""
+    def mapped(orig):
+        return _integrity_error(IntegrityError("UPDATE tasks", {}, orig))
+
+    sprint = mapped(_DriverError("violates foreign key", SPRINT_FK_CONSTRAINT))
+    assert (sprint.status_code, sprint.detail) == (400, "Sprint not found")
+    assert mapped(_DriverError("FOREIGN KEY constraint failed")).detail == "Sprint not found"
+
+    other = mapped(_DriverError("violates check constraint", "ck_tasks_story_points"))
+    assert other.status_code == 409
+    assert "ck_tasks_story_points" in other.detail
+    assert mapped(_DriverError("NOT NULL constraint failed: tasks.title")).status_code == 409
@@ -0,0 +1,37 @@
+import asyncio
+import orjson
+from app.core.services.business_intelligence_service import BusinessIntelligenceService
+from app.core.services.project_management_service import ProjectManagementService
+from app.core.services.reporting_service import ReportingService
+from app.core.services.team_management_service import TeamManagementService
+from app.core.services.visualization_service import VisualizationService
+
+def _service():
+    # Raporlar gerçek servislerin döndürdüğü şekille üretilir; bu yollarda AI modeli kullanılmaz
+    reporting = ReportingService(
+        None,
+        BusinessIntelligenceService(None),
+        TeamManagementService(None),
+        ProjectManagementService(None),
+        section_cache=None
+    )
+    return VisualizationService(reporting)
+
+def test_create_dashboard_renders_real_report_shape():
+    """Sağlık trendleri gibi sayısal olmayan alanlar içeren rapordan dashboard üretilir."""
+    dashboard = asyncio.run(_service().create_dashboard({"id": 1, "name": "Proje", "sprints": [], "tasks": []}))
+    components = orjson.loads(orjson.dumps(dashboard["components"]))
+    assert set(components) == {"project_health", "team_performance", "business_metrics", "risk_analysis", "recommendations"}
+    trend = components["project_health"]["trend_line"]["data"][0]
+    assert trend["x"] == ["trend_direction", "trend_magnitude", "trend_stability"]
+
+def test_create_sprint_visualization_builds_velocity_chart():
+    """Velocity grafiği de diğer bileşenler gibi await edilerek üretilir."""
+    sprint_data = {
+        "sprint": {"id": 2, "start_date": "2024-01-15", "end_date": "2024-01-28", "status": "COMPLETED", "velocity": 0},
+        "stories": [{"id": 1, "status": "DONE", "story_points": 5, "created_at": "2024-01-15", "updated_at": "2024-01-16"}],
+        "previous_sprints": [{"id": 1, "start_date": "2024-01-01", "end_date": "2024-01-14", "status": "COMPLETED", "velocity": 8}]
+    }
+    result = asyncio.run(_service().create_sprint_visualization(sprint_data))
+    chart = orjson.loads(orjson.dumps(result["visualizations"]["velocity_chart"]))
+    assert chart["data"][0]["y"] == [8.0, 5.0]